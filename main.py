@@ -2,11 +2,12 @@ import pygame
 import sys
 from datetime import datetime
 import random
+import bisect
 import time
 import re
 import json
 import os
-import numpy as np
+from itertools import chain
 from typing import Dict, List, Optional, Tuple
 
 # Try to import fitz (PyMuPDF) for PDF rendering
@@ -34,7 +35,7 @@ if os.path.exists(_data_path) and _data_path not in sys.path:
 # Import game systems
 from games import GAME_DEFINITIONS, GameDefinition, BaseGameSession
 from games.registry import launch_external_game
-from tokens import Tokens, normalize_token, describe_token, sort_tokens
+from tokens import Tokens, normalize_token, normalize_tokens, describe_token, sort_tokens
 
 # Import supporting systems
 from systems import Email, EmailDatabase, NPCResponder, EnhancedNPCResponder, TokenInventory, SteamManager
@@ -42,7 +43,7 @@ from systems import Email, EmailDatabase, NPCResponder, EnhancedNPCResponder, To
 # Import OS Mode
 from OS.OS_Mode import OSMode
 
-# Try to import cv2 for video playback
+# Try to import cv2 for video playback (frames are wrapped with pygame.image.frombuffer, so numpy is not needed)
 try: 
     import cv2
     _cv2_available = True
@@ -64,7 +65,31 @@ except:
 # Initialize pygame
 pygame.init()
 
+# Outbound email parsing
+USERNAME_RE = re.compile(r"username:\s*(\S+)", re.IGNORECASE)
+# Every help phrase Jaxkando listens for contains "help", "crack games" or "volunteer",
+# so a substring scan for those three covers the whole keyword list in one pass
+HELP_RE = re.compile(r"help|crack games|volunteer")
+# "thanks" contains "thank", so three alternatives cover Glyphis's gratitude words
+GRATITUDE_RE = re.compile(r"thank|thx|appreciate", re.IGNORECASE)
+
 _glyph_font_cache = {}
+_ui_font_cache = {}
+_ascii_art_font_cache = {}
+
+
+def get_ui_font(size):
+    """Return the Retro Gaming UI font at a pixel size (default font if the TTF is missing), caching per size."""
+    font_obj = _ui_font_cache.get(size)
+    if font_obj is None:
+        try:
+            font_obj = pygame.font.Font(get_data_path("Retro Gaming.ttf"), size)
+        except Exception:
+            if not _ui_font_cache:
+                print("Warning: Retro Gaming.ttf not found, using default font")
+            font_obj = pygame.font.Font(None, size)
+        _ui_font_cache[size] = font_obj
+    return font_obj
 
 
 def get_selection_glyph_font(size):
@@ -89,6 +114,27 @@ def get_selection_glyph_font(size):
     return fallback
 
 
+def get_ascii_art_font(size):
+    """Return a monospaced system font that can render the box-drawing ASCII art, caching per size."""
+    if size in _ascii_art_font_cache:
+        return _ascii_art_font_cache[size]
+
+    # Try fonts in order of preference for box-drawing character support
+    font_obj = None
+    for name in ["Consolas", "Courier New", "Lucida Console", "DejaVu Sans Mono", "Courier"]:
+        try:
+            candidate = pygame.font.SysFont(name, size)
+            if candidate.render("█", True, (255, 255, 255)).get_width() > 0:
+                font_obj = candidate
+                break
+        except Exception:
+            continue
+    if font_obj is None:
+        font_obj = pygame.font.SysFont("courier", size)
+    _ascii_art_font_cache[size] = font_obj
+    return font_obj
+
+
 class DocumentationViewer:
     """Stylised document viewer that renders reference PDFs alongside the BBS."""
 
@@ -928,6 +974,61 @@ class DocumentationViewer:
 
 # Main BBS Application
 class GLYPHIS_IOBBS:
+    # Static footer / hint strings (built once rather than every frame)
+    FOOTER_POST_INSTRUCTIONS = "ESC: return   SPACEBAR: main menu"
+    FOOTER_POST_INSTRUCTIONS_SCROLL = FOOTER_POST_INSTRUCTIONS + "   UP/DOWN: scroll"
+    FOOTER_TERMINAL_FEED = "TERMINAL FEED: THE WALL.... GLYPHIS_IO BBS"
+    FOOTER_TERMINAL_FEED_TAB = "   TAB: cycle posts   ENTER: read   SPACEBAR: main menu"
+    COMPOSE_SEND_HINT = "TAB to target SEND, ENTER to transmit"
+    READING_SCROLL_HINT = "Scroll for additional content"
+    PANEL_CACHED_STATES = frozenset(("games", "tasks", "team", "radio"))
+    # Window events after which the OS may have dropped what was on screen, so the next frame must be a
+    # full flip rather than a dirty-rect update (the WINDOW* events only exist on SDL2 builds)
+    REPAINT_EVENTS = frozenset(
+        getattr(pygame, name)
+        for name in ("VIDEOEXPOSE", "WINDOWEXPOSED", "WINDOWSHOWN", "WINDOWRESTORED", "WINDOWFOCUSGAINED")
+        if hasattr(pygame, name)
+    )
+    # States whose handler consumes MOUSEMOTION events; everywhere else motion is blocked at the queue
+    MOUSE_MOTION_STATES = frozenset(("game_session", "urgent_ops_session"))
+    # States whose draw method fills or blits over the whole bbs_surface itself
+    # (their own fill(BLACK), or the full-size chrome / panel / post-layer snapshots)
+    SELF_CLEARING_STATES = frozenset((
+        "bbs_scroll", "intro", "loading", "main_menu", "front_post",
+        "email_menu", "compose", "inbox", "outbox", "sent", "reading",
+        "games", "tasks", "team", "radio",
+        "login_username", "login_pin_create", "login_pin_verify", "login_success",
+    ))
+    EMAIL_LIST_STATES = frozenset(("inbox", "outbox", "sent"))
+    # Steam achievements unlocked by token milestones
+    # (ACH_LAPC1_READY is unlocked when all 7 nodes are completed, not from a token)
+    TOKEN_ACHIEVEMENTS = {
+        Tokens.PSEM: "ACH_FIRST_STEPS",  # Email system unlocked
+        Tokens.USERNAME_SET: "ACH_REGISTERED",  # Username registered
+        Tokens.GAMES1: "ACH_GAMES_UNLOCKED",  # Games module unlocked
+        Tokens.AUDIO1: "ACH_AUDIO_OPS",  # Audio ops unlocked
+    }
+    # UP/DOWN handlers per state, called with -1 or +1 (looked up with getattr like task launch methods)
+    NAVIGATION_STEP_HANDLERS = {
+        "reading": "_step_email_scroll",
+        "front_post": "_step_front_post",
+        "team": "_step_bio_scroll",
+        "main_menu": "_step_main_menu",
+        "email_menu": "_step_email_menu",
+        "tasks": "_step_task",
+        "games": "_step_game",
+        "inbox": "_step_email_list",
+        "outbox": "_step_email_list",
+        "sent": "_step_email_list",
+    }
+    # ENTER handlers for the login screens, looked up the same way as NAVIGATION_STEP_HANDLERS
+    LOGIN_SUBMIT_HANDLERS = {
+        "login_username": "_submit_login_username",
+        "login_pin_create": "_submit_login_pin_create",
+        "login_pin_verify": "_submit_login_pin_verify",
+        "login_success": "_submit_login_success",
+    }
+
     def __init__(self):
         log_event("Initialising GLYPHIS_IO BBS client")
         # Start in fullscreen mode
@@ -966,6 +1067,7 @@ class GLYPHIS_IOBBS:
         self.bbs_height = int(self.baseline_bbs_height * self.scale)
         self.bbs_x = int(self.baseline_bbs_x * self.scale)
         self.bbs_y = int(self.baseline_bbs_y * self.scale)
+        self._rebuild_scale_cache()
         
         # General scroll offset for BBS window content (like a text document)
         # All content can be scrolled if it exceeds window height
@@ -982,23 +1084,38 @@ class GLYPHIS_IOBBS:
             print("Warning: images/desktop.png not found, using black background")
             self.desktop_bg = None
         
-        # Create a surface for the BBS window (with alpha support for transparency)
-        self.bbs_surface = pygame.Surface((self.bbs_width, self.bbs_height), pygame.SRCALPHA)
+        # Create a surface for the BBS window. Every screen paints it fully opaque, so it uses the
+        # display format without per-pixel alpha (translucent overlays still blend onto it normally)
+        self.bbs_surface = pygame.Surface((self.bbs_width, self.bbs_height)).convert()
         
         # Load font (scaled based on resolution)
-        try:
-            self.font_large = pygame.font.Font(get_data_path("Retro Gaming.ttf"), int(30 * self.scale))
-            self.font_medium = pygame.font.Font(get_data_path("Retro Gaming.ttf"), int(22 * self.scale))
-            self.font_medium_small = pygame.font.Font(get_data_path("Retro Gaming.ttf"), max(1, int(20 * self.scale)))
-            self.font_small = pygame.font.Font(get_data_path("Retro Gaming.ttf"), int(16 * self.scale))
-            self.font_tiny = pygame.font.Font(get_data_path("Retro Gaming.ttf"), int(12 * self.scale))
-        except:
-            print("Warning: Retro Gaming.ttf not found, using default font")
-            self.font_large = pygame.font.Font(None, int(30 * self.scale))
-            self.font_medium = pygame.font.Font(None, int(22 * self.scale))
-            self.font_medium_small = pygame.font.Font(None, max(1, int(20 * self.scale)))
-            self.font_small = pygame.font.Font(None, int(16 * self.scale))
-            self.font_tiny = pygame.font.Font(None, int(12 * self.scale))
+        self._load_fonts()
+        # Rendered text surfaces keyed by (font, color, bg, text)
+        self._text_cache = {}
+        # Wrapped line lists keyed by (font, width, text), and measured word widths per font
+        self._wrap_cache = {}
+        self._word_width_cache = {}
+        # Pre-composed static screen layers (and the state each was built for)
+        self._static_layer = {}
+        self._static_layer_key = {}
+        self._login_username_rects = None  # (content_rect, input_box_rect) of the cached login layers
+        self._login_pin_rects = None
+        self._banner_cache = {}  # (font, colour, lines) -> pre-rendered multi-line ASCII-art banner
+        self._post_view_content_area = None
+        self._screen_chrome_cache = {}
+        self._row_templates = {}  # (width, height) -> (normal, highlighted) row box surfaces
+        self._panel_cache = {}  # module screen -> (last rendered frame, state it was drawn for)
+        self._dirty_rects = []  # Screen-space rects of BBS content redrawn this frame
+        self._last_present_key = None  # Layout the previous frame was presented with; None = full flip
+        self._last_hud_rects = []
+        self._hud_surfaces = {}  # HUD line -> (text, surface); re-rendered only when the text changes
+        self._mouse_motion_allowed = True  # Mirrors pygame.event.set_allowed/set_blocked(MOUSEMOTION)
+        self._bio_prepared = {}  # current_team_member -> wrapped + rendered bio lines
+        self._modal_overlay = None  # Translucent black dimmer shared by the confirmation modals
+        self._grid_surface = None  # Black backdrop with the GRID_BLUE stripes, rebuilt on resize
+        self._grid_surface_dims = None
+        self._scroll_text_surface = None
+        self._scroll_text_key = None
 
         self.documentation_viewer = DocumentationViewer("Bradsonic_Docs", self.scale)
         self.start_video_playing = False
@@ -1013,6 +1130,7 @@ class GLYPHIS_IOBBS:
         
         # BBS Scroll animation state
         self.scroll_image = None
+        self._scroll_image_original = None  # Unscaled BBS_Scroll.png, kept so F5 can rescale without reloading
         self.scroll_y = None  # Current scroll position (will be set to start below screen)
         self.scroll_speed = int(2 * self.scale)  # Pixels per frame (scaled)
         self.scroll_pause_frames = 0  # Frames remaining in pause
@@ -1021,6 +1139,7 @@ class GLYPHIS_IOBBS:
         try:
             scroll_path = get_data_path("images", "BBS_Scroll.png")
             self.scroll_image = pygame.image.load(scroll_path).convert_alpha()
+            self._scroll_image_original = self.scroll_image
             # Scale image to fit BBS window width if needed
             if self.scroll_image.get_width() != self.bbs_width:
                 scale_factor = self.bbs_width / self.scroll_image.get_width()
@@ -1091,6 +1210,7 @@ class GLYPHIS_IOBBS:
         self.outbox = []
         self.sent = []
         self.player_email = "unknown"
+        self._inbox_unread = 0  # Kept in sync by _recount_unread() so draw code doesn't rescan the inbox
         
         # NPC Responder - Enhanced trait-based system
         self.npc = EnhancedNPCResponder()
@@ -1100,17 +1220,24 @@ class GLYPHIS_IOBBS:
         
         # Steam Integration
         self.steam = SteamManager(app_id=STEAM_APP_ID)
+        self._lapc1_achievement_unlocked = False
         
         # Terminal Feed (formerly Front Post Board)
         self.front_post_data = self.load_main_terminal_feed()
         self.posts = []
+        self._posts_unread = 0
+        self._posts_read_bits = 0  # Bit i set = self.posts[i] has been read
+        self._unread_post_cache = (None, [])
         self.active_post_signature = None
 
         # Email Database System
         self.email_db = EmailDatabase()
+        self._user_state_written = None  # Text of the last user_state.json write, to skip identical rewrites
+        self._user_state_save_due_ms = None  # get_ticks() deadline of a deferred save_user_state, if any
         self.user_state = self.load_user_state()
         self.apply_active_user_profile()
-        self._email_check_counter = 0  # Counter for periodic email checks
+        self._email_last_check_ms = 0  # get_ticks() of the last periodic email check
+        self._email_poll_key = None  # (inventory version, player, sent count) the last check ran against
         
         # Compose email fields
         self.compose_to = "glyphis@ciphernet.net"  # glyphis is the sysop
@@ -1121,6 +1248,7 @@ class GLYPHIS_IOBBS:
         # Selected email
         self.selected_email = None
         self.previous_email_state = None  # Track which list we came from
+        self.selected_email_index = None  # Position of selected_email in that list when it was opened
 
         # User deletion confirmation modal
         self.delete_confirmation_active = False
@@ -1147,6 +1275,7 @@ class GLYPHIS_IOBBS:
         self.login_error = ""
         self.login_message = ""
         self.login_focus = "input"
+        self._caret_on = True  # Text-input caret blink phase, advanced once per frame in run()
         
         # Load initial emails from database (emails with send_on_start = true)
         self.check_email_database()
@@ -1163,12 +1292,22 @@ class GLYPHIS_IOBBS:
         self.game_definitions = GAME_DEFINITIONS
         self.current_game_index = 0
         self.active_game_session: Optional[BaseGameSession] = None
+        self._unlocked_games_cache = None  # (inventory.version, games)
+        self._visible_tasks_cache = None  # (inventory.version, tasks)
         
         # Load custom mouse cursors for outside BBS window (day and night versions)
         self.mouse_hand_cursor = self._load_hand_cursor("mouse-hand-pointer.png")
         self.mouse_hand_cursor_click = self._load_hand_cursor_click("mouse-hand-pointer-click.png")
         self.mouse_hand_cursor_night = self._load_hand_cursor("night-mouse-hand-pointer.png")
         self.mouse_hand_cursor_click_night = self._load_hand_cursor_click("night-mouse-hand-pointer-click.png")
+        try:
+            # Transparent cursor used to hide the pointer inside the BBS window
+            self._blank_cursor = pygame.cursors.Cursor((0, 0), pygame.Surface((1, 1), pygame.SRCALPHA))
+        except Exception:
+            self._blank_cursor = None
+        self._last_cursor = None  # Cursor most recently passed to pygame.mouse.set_cursor by _apply_cursor
+        self._night_flag = False
+        self._night_flag_checked_ms = None  # get_ticks() of the last _is_tokyo_nighttime() call
         
         # Module content states
         self.current_task = 0
@@ -1231,7 +1370,10 @@ class GLYPHIS_IOBBS:
         # Video playback state (default mode, fallback to normal if unavailable)
         self.video_cap = None
         self.video_frame = None
+        self._video_frame_interval_ms = 1000.0 / 30.0  # Source frame duration of the desktop video
+        self._next_video_frame_ms = 0
         self.scanline_image = None
+        self._scanline_scaled = None  # scanline_image stretched to the BBS window, rebuilt on resize
         self.desktop_video_filename: Optional[str] = None
         self.desktop_state = "default"
         
@@ -1285,8 +1427,9 @@ class GLYPHIS_IOBBS:
                     # Start playing immediately - this is room ambiance, not BBS audio
                     # Initialize fade-in variables
                     self.ambient_fade_in = False
-                    self.ambient_fade_start_time = None
+                    self.ambient_fade_elapsed = 0.0  # Seconds into the fade-in, advanced by the frame dt
                     self.ambient_fade_duration = 3.0  # 3 seconds fade-in
+                    self._ambient_busy_check_timer = 0.0
                     try:
                         # Ensure mixer is initialized before playing
                         if not pygame.mixer.get_init():
@@ -1297,7 +1440,7 @@ class GLYPHIS_IOBBS:
                             self.ambient_channel.set_volume(0.0)  # Start at 0 for fade-in
                             self.ambient_playing = True
                             self.ambient_fade_in = True
-                            self.ambient_fade_start_time = pygame.time.get_ticks() / 1000.0
+                            self.ambient_fade_elapsed = 0.0
                             print("DEBUG: Ambient room track started, fade-in beginning at volume 0.0")
                         else:
                             print("DEBUG: Warning: play() returned None, no channel available")
@@ -1325,63 +1468,224 @@ class GLYPHIS_IOBBS:
             self.ambient_channel = None
         
         
+    def _rebuild_scale_cache(self):
+        """Precompute int(N * scale) layout constants used by the BBS draw methods"""
+        self._S = {n: int(n * self.scale) for n in (
+            4, 5, 6, 8, 10, 12, 14, 15, 16, 18, 20, 22, 24, 25, 28, 30, 32, 34, 35, 36, 40, 46, 48, 50, 60, 80, 100, 105, 110, 120, 140, 160, 200, 210,
+        )}
+        # Desktop hotspots (scaled from baseline coordinates), hit-tested on every click and drawn every frame
+        reset_x, reset_y, reset_w, reset_h = RESET_HOTSPOT
+        self._reset_hotspot_rect = pygame.Rect(
+            int(reset_x * self.scale),
+            int(reset_y * self.scale),
+            int(reset_w * self.scale),
+            int(reset_h * self.scale)
+        )
+        overlay_x, overlay_y, overlay_w, overlay_h = OVERLAY_HOTSPOT
+        self._overlay_hotspot_rect = pygame.Rect(
+            int(overlay_x * self.scale),
+            int(overlay_y * self.scale),
+            int(overlay_w * self.scale),
+            int(overlay_h * self.scale)
+        )
+        # Black-out rect for the overlay hotspot (stretched right 20px and down 15px, scaled)
+        self._stretched_overlay_rect = pygame.Rect(
+            int(overlay_x * self.scale),
+            int(overlay_y * self.scale),
+            int((overlay_w + 20) * self.scale),
+            int((overlay_h + 15) * self.scale)
+        )
+        # BBS window on screen: cyan border, overlay black-out and full-window dirty rect
+        self._bbs_screen_rect = pygame.Rect(self.bbs_x, self.bbs_y, self.bbs_width, self.bbs_height)
+        # Confirmation modal boxes, centred in the BBS window
+        self._modal_rects = {}
+        for name, width, height in (
+            ("delete_email", int(self.bbs_width * 0.72), int(self.bbs_height * 0.28)),
+            ("logout", int(self.bbs_width * 0.68), int(self.bbs_height * 0.24) + int(30 * self.scale)),
+            ("delete_user", int(self.bbs_width * 0.75), int(self.bbs_height * 0.32)),
+        ):
+            self._modal_rects[name] = pygame.Rect(
+                (self.bbs_width - width) // 2, (self.bbs_height - height) // 2, width, height
+            )
+
+    def _load_fonts(self):
+        """Point the UI fonts at the current scale; sizes seen before (e.g. toggling F5 back) are reused"""
+        self.font_large = get_ui_font(int(30 * self.scale))
+        self.font_medium = get_ui_font(int(22 * self.scale))
+        self.font_medium_small = get_ui_font(max(1, int(20 * self.scale)))
+        self.font_small = get_ui_font(int(16 * self.scale))
+        self.font_tiny = get_ui_font(int(12 * self.scale))
+        # Default font for the PIN bullets ("•" isn't in the Retro Gaming TTF), matched to font_medium's height
+        self.font_pin = pygame.font.SysFont(None, self.font_medium.get_height())
+
+    def _clear_render_caches(self):
+        """Drop every cached surface / layout that depends on the current fonts or scale"""
+        self._text_cache.clear()
+        self._wrap_cache.clear()
+        self._word_width_cache.clear()
+        self._static_layer.clear()
+        self._static_layer_key.clear()
+        self._screen_chrome_cache.clear()
+        self._bio_prepared.clear()
+        self._row_templates.clear()
+        self._panel_cache.clear()
+        self._banner_cache.clear()
+        self._scanline_scaled = None
+
     def _wrap_text(self, text, font, max_width):
         """Helper to wrap text into lines, returns list of lines. Preserves double newlines as blank lines."""
         if text is None:
             return []
+        # Bodies and titles are re-wrapped every frame they are shown, so memoize per font/width
+        key = (id(font), max_width, text)
+        lines = self._wrap_cache.get(key)
+        if lines is not None:
+            return lines
+        lines = self._wrap_text_uncached(text, font, max_width)
+        if len(self._wrap_cache) > 512:
+            self._wrap_cache.clear()
+        self._wrap_cache[key] = lines
+        return lines
+
+    def _wrap_text_uncached(self, text, font, max_width):
+        # Split by newlines to preserve paragraph structure and consecutive newlines;
+        # an empty paragraph means a blank line (from \n\n)
+        return list(chain.from_iterable(
+            self._wrap_paragraph(paragraph, font, max_width) if paragraph else ("",)
+            for paragraph in text.split('\n')
+        ))
+
+    def _wrap_paragraph(self, paragraph, font, max_width):
+        wrapped = self._wrap_paragraph_fast(paragraph, font, max_width)
+        if wrapped is None:
+            wrapped = self._wrap_paragraph_measured(paragraph, font, max_width)
+        return wrapped
+
+    def _wrap_paragraph_fast(self, paragraph, font, max_width):
+        """Greedy wrap using memoized per-word widths instead of re-measuring every prefix.
+        Each finished line is measured, along with the line plus the word that was pushed to the next
+        one; returns None if either shows the estimate was off (kerning), so the caller can fall back
+        to the exact per-prefix wrap and the output always matches it."""
+        widths = self._word_width_cache.get(id(font))
+        if widths is None or len(widths) > 4096:
+            widths = self._word_width_cache[id(font)] = {" ": font.size(" ")[0]}
+        space_width = widths[" "]
         
-        # First split by newlines to preserve paragraph structure and consecutive newlines
-        paragraphs = text.split('\n')
         lines = []
-        
-        for para_idx, paragraph in enumerate(paragraphs):
-            # Empty paragraph means a blank line (from \n\n)
-            if paragraph == "":
-                lines.append("")
+        current_line = []
+        current_width = 0
+        for word in paragraph.split(' '):
+            if not word:  # Skip empty strings from multiple spaces
                 continue
-            
-            # Wrap this paragraph
-            words = paragraph.split(' ')
-            current_line = []
-            
-            for word in words:
-                if not word:  # Skip empty strings from multiple spaces
-                    continue
-                    
-                test_line = ' '.join(current_line + [word]) if current_line else word
-                if font.size(test_line)[0] <= max_width:
-                    current_line.append(word)
+            word_width = widths.get(word)
+            if word_width is None:
+                word_width = widths[word] = font.size(word)[0]
+            if not current_line:
+                current_line = [word]
+                current_width = word_width
+            elif current_width + space_width + word_width <= max_width:
+                current_line.append(word)
+                current_width += space_width + word_width
+            else:
+                lines.append(current_line)
+                current_line = [word]
+                current_width = word_width
+        if current_line:
+            lines.append(current_line)
+        
+        result = []
+        last = len(lines) - 1
+        for n, words in enumerate(lines):
+            line = ' '.join(words)
+            # Single overlong words are allowed to overflow, as in the measured wrap
+            if len(words) > 1 and font.size(line)[0] > max_width:
+                return None
+            # The break must also be where the measured wrap puts it: the next word really doesn't fit
+            if n < last and font.size(line + ' ' + lines[n + 1][0])[0] <= max_width:
+                return None
+            result.append(line)
+        return result
+
+    def _wrap_paragraph_measured(self, paragraph, font, max_width):
+        """Exact wrap that measures whole candidate lines with font.size.
+        Binary-searches the longest run of words that fits, so each line costs O(log words) measurements."""
+        lines = []
+        words = [word for word in paragraph.split(' ') if word]  # Skip empty strings from multiple spaces
+        count = len(words)
+        start = 0
+        while start < count:
+            # The first word always goes on the line, even if it overflows on its own
+            low, high = start + 1, count
+            while low < high:
+                mid = (low + high + 1) // 2
+                if font.size(' '.join(words[start:mid]))[0] <= max_width:
+                    low = mid
                 else:
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                    current_line = [word]
-            
-            if current_line:
-                lines.append(' '.join(current_line))
-        
+                    high = mid - 1
+            lines.append(' '.join(words[start:low]))
+            start = low
         return lines
     
-    def draw_text(self, text, font, color, x, y, max_width=None):
+    def _render_cached(self, text, font, color, bg=None):
+        """Render a text line once and reuse the surface on later frames"""
+        key = (id(font), color, bg, text)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if bg is None:
+                surface = font.render(text, True, color)
+            else:
+                # Rendering with a background colour gives an opaque surface (no per-pixel alpha blit)
+                surface = font.render(text, True, color, bg)
+            if len(self._text_cache) >= 1024:
+                # Drop the oldest entry so scrolling text can't grow the cache without bound
+                self._text_cache.pop(next(iter(self._text_cache)))
+            self._text_cache[key] = surface
+        return surface
+
+    def _draw_text_line(self, text, font, color, x, y, bg=None, /):
+        """Single unwrapped line; the common case, called positionally to skip draw_text's keyword handling"""
+        if not text:
+            # Nothing to render; advance as far as a blank line would
+            return y if text is None else y + font.get_height()
+        surface = self._render_cached(text, font, color, bg)
+        self.bbs_surface.blit(surface, (x, y + self.content_scroll_y))
+        return y + surface.get_height()  # Position without scroll offset
+
+    def draw_text(self, text, font, color, x, y, max_width=None, bg=None):
         """Draw text with optional word wrapping - flows like a document"""
+        if max_width is None:
+            return self._draw_text_line(text, font, color, x, y, bg)
         # Apply scroll offset (allows scrolling if content exceeds window)
         y = y + self.content_scroll_y
         if text is None:
             return y - self.content_scroll_y
-        if max_width is None:
-            surface = font.render(text, True, color)
-            self.bbs_surface.blit(surface, (x, y))
-            return y + surface.get_height() - self.content_scroll_y  # Return position without scroll offset
         else:
             lines = self._wrap_text(text, font, max_width)
             
             y_offset = y
             for line in lines:
-                surface = font.render(line, True, color)
+                surface = self._render_cached(line, font, color, bg)
                 self.bbs_surface.blit(surface, (x, y_offset))
                 y_offset += surface.get_height() + 5
             
             return y_offset - self.content_scroll_y  # Return position without scroll offset
     
+    def _queue_text(self, pairs, text, font, color, x, y, max_width=None):
+        """Like draw_text, but appends (surface, dest) pairs for a later bbs_surface.blits() call"""
+        y = y + self.content_scroll_y
+        if text is None:
+            return y - self.content_scroll_y
+        if max_width is None:
+            surface = self._render_cached(text, font, color)
+            pairs.append((surface, (x, y)))
+            return y + surface.get_height() - self.content_scroll_y
+        y_offset = y
+        for line in self._wrap_text(text, font, max_width):
+            surface = self._render_cached(line, font, color)
+            pairs.append((surface, (x, y_offset)))
+            y_offset += surface.get_height() + 5
+        return y_offset - self.content_scroll_y
+    
     def _load_hand_cursor(self, filename: str) -> Optional[pygame.cursors.Cursor]:
         """Load a hand cursor image with hotspot at top-left corner"""
         path = get_data_path("images", filename)
@@ -1416,45 +1720,43 @@ class GLYPHIS_IOBBS:
         return (self.bbs_x <= mouse_x < self.bbs_x + self.bbs_width and
                 self.bbs_y <= mouse_y < self.bbs_y + self.bbs_height)
     
+    def _hand_cursor(self):
+        """Pick the hand cursor for outside the BBS window (night/day, pressed/released).
+        The night check reads the wall clock, so it is only re-evaluated every few seconds."""
+        now_ms = pygame.time.get_ticks()
+        if self._night_flag_checked_ms is None or now_ms - self._night_flag_checked_ms >= 5000:
+            self._night_flag = _is_tokyo_nighttime()
+            self._night_flag_checked_ms = now_ms
+        pressed = pygame.mouse.get_pressed()[0]
+        if self._night_flag:
+            if pressed and self.mouse_hand_cursor_click_night:
+                return self.mouse_hand_cursor_click_night
+            return self.mouse_hand_cursor_night
+        if pressed and self.mouse_hand_cursor_click:
+            return self.mouse_hand_cursor_click
+        return self.mouse_hand_cursor
+
+    def _apply_cursor(self, cursor) -> None:
+        """Set the system cursor, skipping the call when it is already the one we last set"""
+        if cursor is None or cursor is self._last_cursor:
+            return
+        try:
+            pygame.mouse.set_cursor(cursor)
+            self._last_cursor = cursor
+        except Exception:
+            pass
+
     def _update_cursor(self) -> None:
         """Update cursor based on mouse position and game state"""
         # If a game session is active, let the game handle cursor
         if self.state == "game_session" and self.active_game_session:
             return  # Game will handle its own cursor
         
-        # Check if mouse is inside BBS window
+        # Hide cursor inside BBS window, custom hand cursor outside it
         if self._is_mouse_in_bbs_window():
-            # Hide cursor inside BBS window
-            try:
-                # Create a transparent cursor to hide it
-                blank_cursor = pygame.cursors.Cursor((0, 0), pygame.Surface((1, 1), pygame.SRCALPHA))
-                pygame.mouse.set_cursor(blank_cursor)
-            except Exception:
-                pass
+            self._apply_cursor(self._blank_cursor)
         else:
-            # Show custom hand cursor outside BBS window
-            # Use night versions if it's nighttime, otherwise use day versions
-            is_night = _is_tokyo_nighttime()
-            mouse_buttons = pygame.mouse.get_pressed()
-            
-            if is_night:
-                # Use night cursor versions
-                if mouse_buttons[0] and self.mouse_hand_cursor_click_night:
-                    cursor_to_use = self.mouse_hand_cursor_click_night
-                else:
-                    cursor_to_use = self.mouse_hand_cursor_night
-            else:
-                # Use day cursor versions
-                if mouse_buttons[0] and self.mouse_hand_cursor_click:
-                    cursor_to_use = self.mouse_hand_cursor_click
-                else:
-                    cursor_to_use = self.mouse_hand_cursor
-            
-            if cursor_to_use:
-                try:
-                    pygame.mouse.set_cursor(cursor_to_use)
-                except Exception:
-                    pass
+            self._apply_cursor(self._hand_cursor())
     
     def _reset_to_beginning(self) -> None:
         """Reset the BBS back to the beginning of the game loop"""
@@ -1501,6 +1803,16 @@ class GLYPHIS_IOBBS:
             x2 = self.bbs_width - 50
         pygame.draw.line(self.bbs_surface, DARK_BLUE, (x1, y), (x2, y), 2)
 
+    def _video_frame_to_surface(self, frame):
+        """Scale a decoded desktop-video frame to the screen, reusing self.video_frame between frames"""
+        # Wrap the BGR frame directly (no colour conversion or axis swap) and scale into the reused surface
+        raw = pygame.image.frombuffer(frame, (frame.shape[1], frame.shape[0]), "BGR")
+        size = (self.screen_width, self.screen_height)
+        if self.video_frame is None or self.video_frame.get_size() != size:
+            self.video_frame = pygame.Surface(size, 0, raw)
+        pygame.transform.scale(raw, size, self.video_frame)
+        return self.video_frame
+
     def _set_desktop_video(self, filename: str) -> None:
         """Load or switch the desktop background video. Properly stops and releases the old video before loading the new one."""
         if not _cv2_available:
@@ -1539,6 +1851,9 @@ class GLYPHIS_IOBBS:
         self.desktop_video_filename = filename
         self.video_frame = None  # Ensure frame is cleared for new video
         self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)  # Reset to start
+        fps = self.video_cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self._video_frame_interval_ms = 1000.0 / fps
+        self._next_video_frame_ms = 0
 
     def _is_audio_power_led_green(self) -> bool:
         """Check the urgent ops session for the C400 power LED state."""
@@ -1625,6 +1940,15 @@ class GLYPHIS_IOBBS:
     # ------------------------------------------------------------------
 
     def _get_unlocked_games(self) -> List[GameDefinition]:
+        cached = self._unlocked_games_cache
+        if cached is not None and cached[0] == self.inventory.version:
+            available = cached[1]
+            if available:
+                self.current_game_index = max(0, min(self.current_game_index, len(available) - 1))
+            else:
+                self.current_game_index = 0
+            return available
+
         tokens = getattr(self.inventory, "tokens", set())
         available: List[GameDefinition] = []
         for definition in self.game_definitions:
@@ -1641,6 +1965,7 @@ class GLYPHIS_IOBBS:
                     for definition in self.game_definitions
                     if Tokens.GAMES1 in definition.tokens_required
                 ]
+        self._unlocked_games_cache = (self.inventory.version, available)
         return available
 
     def launch_game(self, definition: GameDefinition) -> None:
@@ -1679,15 +2004,58 @@ class GLYPHIS_IOBBS:
         self.screen.fill(BLACK)
         self.screen.blit(self.bbs_surface, (self.bbs_x, self.bbs_y))
         pygame.display.flip()
+        # This flip bypassed run(); make its next frame a full flip so the launch screen is replaced
+        self._last_present_key = None
     
     def check_email_database(self):
         """Check email database for new emails based on tokens and add them to inbox"""
+        # Deliveries depend only on the tokens held, the player and what was already sent;
+        # if none of those moved since the last check, there is nothing new to send
+        poll_key = (self.inventory.version, self.player_email, len(self.email_db.sent_email_ids))
+        if poll_key == self._email_poll_key:
+            return
         new_emails = self.email_db.check_and_send_emails(self.inventory, self.player_email)
+        self._email_poll_key = (self.inventory.version, self.player_email, len(self.email_db.sent_email_ids))
         for email in new_emails:
             self.inbox.append(email)
         # Save sent email IDs
         if new_emails:
+            self._recount_unread()
             self.save_user_state()
+
+    def _recount_unread(self):
+        """Refresh the cached unread counters after the inbox or posts change"""
+        self._inbox_unread = sum(1 for e in self.inbox if not e.read)
+        bits = 0
+        for i, post in enumerate(self.posts):
+            if post.get("read", False):
+                bits |= 1 << i
+        self._posts_read_bits = bits
+        self._posts_unread = len(self.posts) - bin(bits).count("1")
+
+    def _mark_post_read(self, index):
+        """Flag self.posts[index] as read, keeping the read bitmask and unread count in step"""
+        mask = 1 << index
+        if self._posts_read_bits & mask:
+            return
+        self.posts[index]["read"] = True
+        cache_key, unread = self._unread_post_cache
+        if cache_key == (self._posts_read_bits, len(self.posts)):
+            # The cached unread list is sorted and holds this index: bisect to it and delete it in place
+            pos = bisect.bisect_left(unread, index)
+            if pos < len(unread) and unread[pos] == index:
+                del unread[pos]
+            self._unread_post_cache = ((self._posts_read_bits | mask, len(self.posts)), unread)
+        self._posts_read_bits |= mask
+        self._posts_unread -= 1
+
+    def _unread_post_indices(self):
+        """Indices of unread posts, rebuilt only when the read bitmask changes"""
+        key = (self._posts_read_bits, len(self.posts))
+        if self._unread_post_cache[0] != key:
+            bits = self._posts_read_bits
+            self._unread_post_cache = (key, [i for i in range(len(self.posts)) if not (bits >> i) & 1])
+        return self._unread_post_cache[1]
     
     def draw_bbs_scroll(self):
         """Draw the BBS scroll animation"""
@@ -1792,14 +2160,14 @@ class GLYPHIS_IOBBS:
         welcome_text = "WELCOME TO OUR BBS"
         welcome_width = self.font_medium.size(welcome_text)[0]
         welcome_x = (self.bbs_width - welcome_width) // 2
-        self.draw_text(welcome_text, self.font_medium, CYAN, welcome_x, welcome_y)
+        self._draw_text_line(welcome_text, self.font_medium, CYAN, welcome_x, welcome_y)
         
         # Subtitle - next line under welcome
         subtitle_y = welcome_y + int(35 * self.scale)
         subtitle_text = "ROOT ACCESS FOR THE FORGOTTEN"
         subtitle_width = self.font_small.size(subtitle_text)[0]
         subtitle_x = (self.bbs_width - subtitle_width) // 2
-        self.draw_text(subtitle_text, self.font_small, DARK_CYAN, subtitle_x, subtitle_y)
+        self._draw_text_line(subtitle_text, self.font_small, DARK_CYAN, subtitle_x, subtitle_y)
         
         # System operators list
         sysop_y = subtitle_y + int(50 * self.scale)
@@ -1813,7 +2181,7 @@ class GLYPHIS_IOBBS:
         for line in sysop_lines:
             line_width = self.font_small.size(line)[0]
             line_x = (self.bbs_width - line_width) // 2
-            self.draw_text(line, self.font_small, DARK_CYAN, line_x, sysop_y)
+            self._draw_text_line(line, self.font_small, DARK_CYAN, line_x, sysop_y)
             sysop_y += int(25 * self.scale)
         
         # Instructions at bottom
@@ -1821,7 +2189,7 @@ class GLYPHIS_IOBBS:
         instruction_text = "Press any key to continue..."
         instruction_width = self.font_small.size(instruction_text)[0]
         instruction_x = (self.bbs_width - instruction_width) // 2
-        self.draw_text(instruction_text, self.font_small, DARK_CYAN, instruction_x, instruction_y)
+        self._draw_text_line(instruction_text, self.font_small, DARK_CYAN, instruction_x, instruction_y)
     
     def draw_loading_screen(self):
         """Draw the BBS connection/loading screen"""
@@ -1831,13 +2199,13 @@ class GLYPHIS_IOBBS:
         title_text = "GLYPHIS_IO BBS"
         title_width = self.font_large.size(title_text)[0]
         title_x = (self.bbs_width - title_width) // 2
-        self.draw_text(title_text, self.font_large, CYAN, title_x, int(180 * self.scale))
+        self._draw_text_line(title_text, self.font_large, CYAN, title_x, int(180 * self.scale))
         
         # Connecting text - centered (scaled)
         connecting_text = "CONNECTING TO NETWORK..."
         connecting_width = self.font_medium.size(connecting_text)[0]
         connecting_x = (self.bbs_width - connecting_width) // 2
-        self.draw_text(connecting_text, self.font_medium, CYAN, connecting_x, int(230 * self.scale))
+        self._draw_text_line(connecting_text, self.font_medium, CYAN, connecting_x, int(230 * self.scale))
         
         # Loading bar - centered, scaled to window
         bar_width = min(int(600 * self.scale), self.bbs_width - int(100 * self.scale))  # Max 600px scaled, but fit within window
@@ -1865,13 +2233,13 @@ class GLYPHIS_IOBBS:
         
         status_width = self.font_small.size(status)[0]
         status_x = (self.bbs_width - status_width) // 2
-        self.draw_text(status, self.font_small, DARK_CYAN, status_x, int(330 * self.scale))
+        self._draw_text_line(status, self.font_small, DARK_CYAN, status_x, int(330 * self.scale))
         
         # Progress percentage - centered (scaled)
         progress_text = f"{int(self.loading_progress)}%"
         progress_width = self.font_small.size(progress_text)[0]
         progress_x = (self.bbs_width - progress_width) // 2
-        self.draw_text(progress_text, self.font_small, CYAN, progress_x, int(360 * self.scale))
+        self._draw_text_line(progress_text, self.font_small, CYAN, progress_x, int(360 * self.scale))
         
         # Update loading progress
         if not self.loading_complete:
@@ -1887,9 +2255,17 @@ class GLYPHIS_IOBBS:
                 self.refresh_main_terminal_feed()
     
     def _draw_background_grid(self):
-        stripe_step = max(10, int(24 * self.scale))
-        for offset in range(0, self.bbs_height, stripe_step):
-            pygame.draw.line(self.bbs_surface, GRID_BLUE, (0, offset), (self.bbs_width, offset), 1)
+        """Paint the black, striped BBS backdrop; the stripes are rasterised once per size / scale"""
+        dims = (self.bbs_width, self.bbs_height, self.scale)
+        if self._grid_surface is None or self._grid_surface_dims != dims:
+            grid = pygame.Surface((self.bbs_width, self.bbs_height))
+            grid.fill(BLACK)
+            stripe_step = max(10, int(24 * self.scale))
+            for offset in range(0, self.bbs_height, stripe_step):
+                pygame.draw.line(grid, GRID_BLUE, (0, offset), (self.bbs_width, offset), 1)
+            self._grid_surface = grid.convert(self.bbs_surface)
+            self._grid_surface_dims = dims
+        self.bbs_surface.blit(self._grid_surface, (0, 0))
 
     def _draw_header_panel(self, title, instructions=None):
         instruction_count = len(instructions) if instructions else 0
@@ -1916,7 +2292,7 @@ class GLYPHIS_IOBBS:
         title_y = header_rect.y + int(8 * self.scale)
         if title_wrapped:
             for idx, line in enumerate(title_wrapped):
-                self.draw_text(
+                self._draw_text_line(
                     line,
                     self.font_large,
                     ACCENT_CYAN,
@@ -1931,7 +2307,7 @@ class GLYPHIS_IOBBS:
                 subtitle_wrapped = self._wrap_text(instructions[0], self.font_large, max_title_width)
                 if subtitle_wrapped:
                     for idx, line in enumerate(subtitle_wrapped):
-                        self.draw_text(
+                        self._draw_text_line(
                             line,
                             self.font_large,
                             ACCENT_CYAN,
@@ -1942,7 +2318,7 @@ class GLYPHIS_IOBBS:
                 base_y = subtitle_y + int(35 * self.scale)
                 line_height = int(18 * self.scale)
                 for idx, line in enumerate(instructions[1:], start=0):
-                    self.draw_text(
+                    self._draw_text_line(
                         line,
                         self.font_tiny,
                         DARK_CYAN,
@@ -1954,7 +2330,7 @@ class GLYPHIS_IOBBS:
                 base_y = header_rect.y + int(48 * self.scale)
                 line_height = int(18 * self.scale)
                 for idx, line in enumerate(instructions):
-                    self.draw_text(
+                    self._draw_text_line(
                         line,
                         self.font_tiny,
                         DARK_CYAN,
@@ -1991,17 +2367,45 @@ class GLYPHIS_IOBBS:
         return modules_rect, info_rect
 
     def _prepare_bbs_screen(self, title, instructions=None, include_info=True, left_ratio=0.58):
-        self.bbs_surface.fill(BLACK)
+        # The chrome (background, grid, header, panels) only depends on these arguments and the
+        # layout, so it is drawn once per combination and blitted from then on
+        key = (
+            title,
+            tuple(instructions) if instructions else None,
+            include_info,
+            left_ratio,
+            self.bbs_width,
+            self.bbs_height,
+            self.content_scroll_y,
+        )
+        cached = self._screen_chrome_cache.get(key)
+        if cached is not None:
+            chrome, header_rect, modules_rect, info_rect = cached
+            self.bbs_surface.blit(chrome, (0, 0))
+            return header_rect.copy(), modules_rect.copy(), info_rect.copy() if info_rect else None
+
         self._draw_background_grid()
         header_rect = self._draw_header_panel(title, instructions)
         modules_rect, info_rect = self._draw_panel_layout(header_rect, include_info=include_info, left_ratio=left_ratio)
+        if len(self._screen_chrome_cache) >= 16:
+            self._screen_chrome_cache.clear()
+        self._screen_chrome_cache[key] = (
+            self.bbs_surface.convert(),
+            header_rect.copy(),
+            modules_rect.copy(),
+            info_rect.copy() if info_rect else None,
+        )
         return header_rect, modules_rect, info_rect
 
     def _draw_footer_status(self):
-        footer_y = self.bbs_height - int(60 * self.scale)
+        S = self._S
+        footer_y = self.bbs_height - S[60]
         self.draw_line(footer_y)
-        self.draw_text(f"USER: {self.player_email}", self.font_small, CYAN, int(50 * self.scale), footer_y + int(10 * self.scale))
-        self.draw_text("SYSTEM STATUS: ONLINE", self.font_small, CYAN, int(50 * self.scale), footer_y + int(30 * self.scale))
+        # The footer sits outside the chrome cache (it is drawn over the panels), so batch its two labels
+        footer_blits = []
+        self._queue_text(footer_blits, f"USER: {self.player_email}", self.font_small, CYAN, S[50], footer_y + S[10])
+        self._queue_text(footer_blits, "SYSTEM STATUS: ONLINE", self.font_small, CYAN, S[50], footer_y + S[30])
+        self.bbs_surface.blits(footer_blits, doreturn=0)
 
     def draw_main_menu(self):
         """Draw the main BBS menu"""
@@ -2012,9 +2416,9 @@ class GLYPHIS_IOBBS:
             include_info=True,
         )
 
-        email_unread_count = len([e for e in self.inbox if not e.read])
+        email_unread_count = self._inbox_unread
 
-        self.draw_text(
+        self._draw_text_line(
             "[ MODULE ACCESS ]",
             self.font_small,
             ACCENT_CYAN,
@@ -2025,6 +2429,15 @@ class GLYPHIS_IOBBS:
         y = modules_rect.y + int(60 * self.scale)
         row_height = max(int(46 * self.scale), 32)
 
+        # One rect is moved down the column instead of allocating a new one per row
+        entry_rect = pygame.Rect(
+            modules_rect.x + int(16 * self.scale),
+            0,
+            modules_rect.width - int(32 * self.scale),
+            row_height,
+        )
+        row_offset = int(10 * self.scale)
+        text_x = entry_rect.x + int(14 * self.scale)
         for i, module in enumerate(self.modules):
             locked = self.is_module_locked(module)
             base_label = module
@@ -2032,12 +2445,7 @@ class GLYPHIS_IOBBS:
                 base_label = f"{module} ({email_unread_count})"
             label = base_label + (" (LOCKED)" if locked else "")
             module_font = self.font_medium_small if module == "TERMINAL FEED: THE WALL" else self.font_medium
-            entry_rect = pygame.Rect(
-                modules_rect.x + int(16 * self.scale),
-                y - int(10 * self.scale),
-                modules_rect.width - int(32 * self.scale),
-                row_height,
-            )
+            entry_rect.y = y - row_offset
             if i == self.current_module:
                 pygame.draw.rect(self.bbs_surface, HIGHLIGHT_BLUE, entry_rect)
                 pygame.draw.rect(self.bbs_surface, ACCENT_CYAN, entry_rect, 2)
@@ -2048,36 +2456,35 @@ class GLYPHIS_IOBBS:
                 color = RED if locked else DARK_CYAN
                 tag = "[ ]"
 
-            text_x = entry_rect.x + int(14 * self.scale)
-            self.draw_text(f"{tag} {label}", module_font, color, text_x, y)
+            self._draw_text_line(f"{tag} {label}", module_font, color, text_x, y)
             y += row_height
 
         if info_rect:
             info_x = info_rect.x + int(20 * self.scale)
             info_y = info_rect.y + int(20 * self.scale)
 
-            self.draw_text("[ SESSION TELEMETRY ]", self.font_small, ACCENT_CYAN, info_x, info_y)
+            self.draw_text("[ SESSION TELEMETRY ]", self.font_small, ACCENT_CYAN, info_x, info_y, bg=PANEL_BLUE)
             info_y += int(35 * self.scale)
-            self.draw_text(f"CURRENT USER: {self.player_email}", self.font_small, CYAN, info_x, info_y)
+            self.draw_text(f"CURRENT USER: {self.player_email}", self.font_small, CYAN, info_x, info_y, bg=PANEL_BLUE)
             info_y += int(28 * self.scale)
-            self.draw_text("SYS CLOCK:", self.font_small, ACCENT_CYAN, info_x, info_y)
+            self.draw_text("SYS CLOCK:", self.font_small, ACCENT_CYAN, info_x, info_y, bg=PANEL_BLUE)
             info_y += int(24 * self.scale)
-            self.draw_text(format_ingame_clock(), self.font_small, CYAN, info_x, info_y)
+            self.draw_text(format_ingame_clock(), self.font_small, CYAN, info_x, info_y, bg=PANEL_BLUE)
             info_y += int(28 * self.scale)
-            self.draw_text("[ INTERNAL COMMS ]", self.font_small, ACCENT_CYAN, info_x, info_y)
+            self.draw_text("[ INTERNAL COMMS ]", self.font_small, ACCENT_CYAN, info_x, info_y, bg=PANEL_BLUE)
             info_y += int(28 * self.scale)
-            unread = len([e for e in self.inbox if not e.read])
+            unread = self._inbox_unread
             unread_text = f"UNREAD MAIL: {unread}" if unread else "UNREAD MAIL: --"
-            self.draw_text(unread_text, self.font_small, CYAN, info_x, info_y)
+            self.draw_text(unread_text, self.font_small, CYAN, info_x, info_y, bg=PANEL_BLUE)
             info_y += int(28 * self.scale)
             if hasattr(self, "wall_posts"):
                 unread_wall = len([post for post in self.wall_posts if not post.get("read", False)])
             else:
                 unread_wall = 0
             unread_wall_text = f"UNREAD WALL: {unread_wall}" if unread_wall else "UNREAD WALL: --"
-            self.draw_text(unread_wall_text, self.font_small, CYAN, info_x, info_y)
+            self.draw_text(unread_wall_text, self.font_small, CYAN, info_x, info_y, bg=PANEL_BLUE)
             info_y += int(28 * self.scale)
-            self.draw_text("[ ACTIVE OPS ]", self.font_small, ACCENT_CYAN, info_x, info_y)
+            self.draw_text("[ ACTIVE OPS ]", self.font_small, ACCENT_CYAN, info_x, info_y, bg=PANEL_BLUE)
             info_y += int(28 * self.scale)
             available_games = 0
             try:
@@ -2091,6 +2498,7 @@ class GLYPHIS_IOBBS:
                 RED if games_locked else CYAN,
                 info_x,
                 info_y,
+                bg=PANEL_BLUE,
             )
             info_y += int(28 * self.scale)
             urgent_count = len(self.urgent_ops_task_definitions or [])
@@ -2100,14 +2508,15 @@ class GLYPHIS_IOBBS:
                 CYAN if urgent_count else RED,
                 info_x,
                 info_y,
+                bg=PANEL_BLUE,
             )
             info_y += int(28 * self.scale)
-            self.draw_text("[ EXTERNAL COMMS ]", self.font_small, ACCENT_CYAN, info_x, info_y)
+            self.draw_text("[ EXTERNAL COMMS ]", self.font_small, ACCENT_CYAN, info_x, info_y, bg=PANEL_BLUE)
             info_y += int(28 * self.scale)
             station = getattr(self, "current_frequency", None)
             radio_unlocked = getattr(self.inventory, "has_token", lambda *_: False)(Tokens.RADIO_ACCESS)
             station_text = f"RADIO TUNED: {station} kHz" if station else "RADIO TUNED: -- kHz"
-            self.draw_text(station_text, self.font_small, CYAN if radio_unlocked and station else RED, info_x, info_y)
+            self.draw_text(station_text, self.font_small, CYAN if radio_unlocked and station else RED, info_x, info_y, bg=PANEL_BLUE)
             info_y += int(28 * self.scale)
 
         self._draw_footer_status()
@@ -2115,7 +2524,7 @@ class GLYPHIS_IOBBS:
         if self.main_menu_message_timer > 0 and self.main_menu_message:
             footer_y = self.bbs_height - int(60 * self.scale)
             message_y = footer_y - int(40 * self.scale)
-            self.draw_text(self.main_menu_message, self.font_small, RED, int(50 * self.scale), message_y)
+            self._draw_text_line(self.main_menu_message, self.font_small, RED, int(50 * self.scale), message_y)
             self.main_menu_message_timer -= 1
             if self.main_menu_message_timer <= 0:
                 self.main_menu_message = ""
@@ -2278,15 +2687,15 @@ class GLYPHIS_IOBBS:
     def refresh_main_terminal_feed(self, initial=False):
         templates = self.front_post_data.get("posts", [])
         # Normalize all tokens in inventory for comparison
-        token_set = {normalize_token(t) for t in self.inventory.tokens if normalize_token(t)}
+        token_set = normalize_tokens(self.inventory.tokens)
 
         exclusive_matches = []
         general_matches = []
 
         for template in templates:
-            required = {normalize_token(t) for t in template.get("required_tokens", []) if normalize_token(t)}
-            forbidden = {normalize_token(t) for t in template.get("forbidden_tokens", []) if normalize_token(t)}
-            exclusive = {normalize_token(t) for t in template.get("exclusive_tokens", []) if normalize_token(t)}
+            required = normalize_tokens(template.get("required_tokens", []))
+            forbidden = normalize_tokens(template.get("forbidden_tokens", []))
+            exclusive = normalize_tokens(template.get("exclusive_tokens", []))
 
             if required and not required.issubset(token_set):
                 continue
@@ -2314,8 +2723,8 @@ class GLYPHIS_IOBBS:
             # Fallback: show templates with no requirements AND no forbidden tokens
             fallback = []
             for t in templates:
-                required = {normalize_token(tok) for tok in t.get("required_tokens", []) if normalize_token(tok)}
-                forbidden = {normalize_token(tok) for tok in t.get("forbidden_tokens", []) if normalize_token(tok)}
+                required = normalize_tokens(t.get("required_tokens", []))
+                forbidden = normalize_tokens(t.get("forbidden_tokens", []))
                 if required:
                     continue
                 if forbidden and token_set.intersection(forbidden):
@@ -2337,19 +2746,49 @@ class GLYPHIS_IOBBS:
             return
 
         self.posts = visible_posts
+        self._recount_unread()
         self.active_post_signature = signature
         self.current_post = None
         self.post_scroll_y = 0
         if self.state == "front_post":
             self.current_module = 0
     
+    def _post_header_parts(self, post):
+        """Return (date_stamp, title) for a post, parsing the header once and caching it on the post"""
+        if "_date_stamp" not in post:
+            # Parse header to extract date stamp and title
+            header_full = post.get("header", "")
+            header_parts = [part.strip() for part in header_full.split("|")]
+            
+            if len(header_parts) >= 3:
+                # Format: "[TAG] author | date | title"
+                post["_date_stamp"] = f"{header_parts[0]} | {header_parts[1]}"
+                post["_title"] = header_parts[2]
+            elif len(header_parts) == 2:
+                # Fallback: assume "tag | title" or "tag | date"
+                post["_date_stamp"] = header_parts[0]
+                post["_title"] = header_parts[1]
+            else:
+                # Fallback: use whole header as date stamp
+                post["_date_stamp"] = header_full
+                post["_title"] = ""
+        return post["_date_stamp"], post["_title"]
+
     def draw_front_post_board(self):
         """Draw the Main Terminal Feed module"""
+        S = self._S
         # Ensure posts are refreshed when viewing THE WALL
         if not self.posts:
             self.refresh_main_terminal_feed()
         
-        self.bbs_surface.fill(BLACK)
+        if self.current_post is not None:
+            # Post view chrome is pre-composed once per post; only the body is redrawn each frame
+            layer_key = (self.current_post, self.active_post_signature, self.bbs_width, self.bbs_height, self.content_scroll_y)
+            if self._static_layer_key.get("post") == layer_key:
+                self.bbs_surface.blit(self._static_layer["post"], (0, 0))
+                self._draw_post_view_body(self.posts[self.current_post], self._post_view_content_area)
+                return
+        
         self._draw_background_grid()
         
         # Header panel - with ASCII art for THE WALL
@@ -2370,28 +2809,16 @@ class GLYPHIS_IOBBS:
             ":::..:::::..:::::..::........::::::...::...:::..:::::..::........::........::"
         ]
         
-        # Find a monospaced font that can render the ASCII art (4pt larger than original)
-        wall_ascii_font = None
-        font_names = ["Consolas", "Courier New", "Lucida Console", "DejaVu Sans Mono", "Courier"]
-        for font_name in font_names:
-            try:
-                test_font = pygame.font.SysFont(font_name, int(16 * self.scale))
-                test_surface = test_font.render("'", True, (255, 255, 255))
-                if test_surface.get_width() > 0:
-                    wall_ascii_font = test_font
-                    break
-            except:
-                continue
-        if wall_ascii_font is None:
-            wall_ascii_font = pygame.font.SysFont("courier", int(16 * self.scale))
+        # Monospaced font for the ASCII art (4pt larger than original), resolved once per size
+        wall_ascii_font = get_ascii_art_font(S[16])
         
         # Calculate ASCII art height (8 lines)
         ascii_line_height = wall_ascii_font.get_linesize()
         ascii_total_height = len(wall_ascii_lines) * ascii_line_height
-        nav_text_height = int(20 * self.scale)  # Height for navigation text line
-        warning_text_height = int(18 * self.scale)  # Height for warning text line (font_tiny)
-        padding_bottom = int(10 * self.scale)  # Padding below warning
-        spacing = int(10 * self.scale) + int(20 * self.scale)  # Spacing between elements
+        nav_text_height = S[20]  # Height for navigation text line
+        warning_text_height = S[18]  # Height for warning text line (font_tiny)
+        padding_bottom = S[10]  # Padding below warning
+        spacing = S[10] + S[20]  # Spacing between elements
         extra_line_height = self.font_small.get_linesize()  # One extra character line for moving text down
         
         # Extend header panel to accommodate ASCII art, navigation text, warning, and extra line
@@ -2404,17 +2831,17 @@ class GLYPHIS_IOBBS:
         pygame.draw.rect(self.bbs_surface, CYAN, header_rect, 2)
         
         # Draw ASCII art in the header area - moved up 10px
-        title_y = header_rect.y + int(8 * self.scale)
-        subtitle_y = title_y + int(32 * self.scale)
-        wall_ascii_x = header_rect.x + int(20 * self.scale)
+        title_y = header_rect.y + S[8]
+        subtitle_y = title_y + S[32]
+        wall_ascii_x = header_rect.x + S[20]
         wall_ascii_y = subtitle_y + ascii_line_height - (2 * ascii_line_height) - 10  # Moved up 10px
         for line in wall_ascii_lines:
-            self.draw_text(line, wall_ascii_font, WHITE, wall_ascii_x, wall_ascii_y)
+            self._draw_text_line(line, wall_ascii_font, WHITE, wall_ascii_x, wall_ascii_y)
             wall_ascii_y += ascii_line_height
         
         # Navigation text below ASCII art (moved down 1 character line from previous position)
-        nav_y = wall_ascii_y + int(10 * self.scale) - self.font_small.get_linesize() - 10 + 7 + self.font_small.get_linesize()
-        nav_x = header_rect.x + int(20 * self.scale)
+        nav_y = wall_ascii_y + S[10] - self.font_small.get_linesize() - 10 + 7 + self.font_small.get_linesize()
+        nav_x = header_rect.x + S[20]
         
         # Draw "Sysop News - Team Requests - On-Boarding" with color changes (centered)
         sysop_text = "Sysop News"
@@ -2447,7 +2874,7 @@ class GLYPHIS_IOBBS:
         self.bbs_surface.blit(onboard_surface, (current_x, nav_y))
         
         # Warning message in white, centered (moved down 1 character line along with nav text)
-        warning_y = nav_y + int(20 * self.scale) - 10 + 7
+        warning_y = nav_y + S[20] - 10 + 7
         warning_text = "Shhhh... you found us cuz we invited you, don't forget to NOT spread the word!"
         warning_surface = self.font_tiny.render(warning_text, True, WHITE)
         warning_x_centered = header_rect.x + (header_rect.width - warning_surface.get_width()) // 2
@@ -2455,13 +2882,13 @@ class GLYPHIS_IOBBS:
         
         # Main content panel - adjusted for shorter header, taller by 5 character rows
         # Bottom line brought up 5px above the blue footer line
-        panel_top = header_rect.bottom + int(20 * self.scale)
-        footer_y = self.bbs_height - int(50 * self.scale)
+        panel_top = header_rect.bottom + S[20]
+        footer_y = self.bbs_height - S[50]
         panel_height = footer_y - panel_top - 5  # 5px above the blue line
         content_rect = pygame.Rect(
-            int(50 * self.scale),
+            S[50],
             panel_top,
-            self.bbs_width - int(100 * self.scale),
+            self.bbs_width - S[100],
             panel_height
         )
         pygame.draw.rect(self.bbs_surface, PANEL_BLUE, content_rect)
@@ -2469,56 +2896,41 @@ class GLYPHIS_IOBBS:
         
         if self.current_post is None:
             # Section header
-            section_y = content_rect.y + int(15 * self.scale)
-            self.draw_text("[ UNREAD POSTS ]", self.font_small, ACCENT_CYAN, content_rect.x + int(20 * self.scale), section_y)
+            section_y = content_rect.y + S[15]
+            self._draw_text_line("[ UNREAD POSTS ]", self.font_small, ACCENT_CYAN, content_rect.x + S[20], section_y)
             
             # Warning message if email locked
             if self.is_module_locked("EMAIL SYSTEM"):
-                warning_y = section_y + int(30 * self.scale)
+                warning_y = section_y + S[30]
                 warning_rect = pygame.Rect(
-                    content_rect.x + int(20 * self.scale),
+                    content_rect.x + S[20],
                     warning_y,
-                    content_rect.width - int(40 * self.scale),
-                    int(30 * self.scale)
+                    content_rect.width - S[40],
+                    S[30]
                 )
                 pygame.draw.rect(self.bbs_surface, (32, 8, 8), warning_rect)
                 pygame.draw.rect(self.bbs_surface, RED, warning_rect, 1)
-                self.draw_text("System onboarding will commence after you've reviewed all welcome threads.",
-                              self.font_tiny, RED, warning_rect.x + int(10 * self.scale), warning_y + int(8 * self.scale))
-                post_start_y = warning_y + int(40 * self.scale)
+                self._draw_text_line("System onboarding will commence after you've reviewed all welcome threads.",
+                              self.font_tiny, RED, warning_rect.x + S[10], warning_y + S[8])
+                post_start_y = warning_y + S[40]
             else:
-                post_start_y = section_y + int(35 * self.scale)
+                post_start_y = section_y + S[35]
             
             # Filter to show only unread posts
-            unread_posts = [i for i, post in enumerate(self.posts) if not post.get("read", False)]
+            unread_posts = self._unread_post_indices()
             if unread_posts:
                 y = post_start_y
                 for idx, post_idx in enumerate(unread_posts):
                     post = self.posts[post_idx]
                     
-                    # Parse header to extract date stamp and title
-                    header_full = post.get("header", "")
-                    header_parts = [part.strip() for part in header_full.split("|")]
-                    
-                    if len(header_parts) >= 3:
-                        # Format: "[TAG] author | date | title"
-                        date_stamp = f"{header_parts[0]} | {header_parts[1]}"
-                        title = header_parts[2]
-                    elif len(header_parts) == 2:
-                        # Fallback: assume "tag | title" or "tag | date"
-                        date_stamp = header_parts[0]
-                        title = header_parts[1] if len(header_parts) > 1 else ""
-                    else:
-                        # Fallback: use whole header as date stamp
-                        date_stamp = header_full
-                        title = ""
+                    date_stamp, title = self._post_header_parts(post)
                     
                     # Post entry box - increased height to fit all elements with medium fonts
                     post_rect = pygame.Rect(
-                        content_rect.x + int(15 * self.scale),
+                        content_rect.x + S[15],
                         y,
-                        content_rect.width - int(30 * self.scale),
-                        int(105 * self.scale)  # Increased to accommodate 3 lines with medium fonts
+                        content_rect.width - S[30],
+                        S[105]  # Increased to accommodate 3 lines with medium fonts
                     )
                     
                     if idx == self.current_module:  # Selected
@@ -2536,25 +2948,25 @@ class GLYPHIS_IOBBS:
                         prefix = "[ ]"
                     
                     # Text positioning within post box
-                    text_x = post_rect.x + int(12 * self.scale)
-                    text_y = post_rect.y + int(8 * self.scale)
-                    line_spacing = int(22 * self.scale)  # Increased for medium font
+                    text_x = post_rect.x + S[12]
+                    text_y = post_rect.y + S[8]
+                    line_spacing = S[22]  # Increased for medium font
                     
                     # Calculate max width to prevent overflow
-                    max_text_width = post_rect.width - int(24 * self.scale)
+                    max_text_width = post_rect.width - S[24]
                     
                     # Date stamp (first line) - medium font
                     date_text = f"{prefix} {date_stamp}"
                     date_wrapped = self._wrap_text(date_text, self.font_medium, max_text_width)
                     if date_wrapped:
-                        self.draw_text(date_wrapped[0], self.font_medium, date_color, text_x, text_y)
+                        self._draw_text_line(date_wrapped[0], self.font_medium, date_color, text_x, text_y)
                     
                     # Title (second line) - medium font
                     if title:
                         title_y = text_y + line_spacing
                         title_wrapped = self._wrap_text(title, self.font_medium, max_text_width)
                         if title_wrapped:
-                            self.draw_text(title_wrapped[0], self.font_medium, title_color, text_x, title_y)
+                            self._draw_text_line(title_wrapped[0], self.font_medium, title_color, text_x, title_y)
                     else:
                         title_y = text_y + line_spacing
                     
@@ -2573,143 +2985,146 @@ class GLYPHIS_IOBBS:
                                     pass  # Already has ellipsis from wrapping
                                 else:
                                     preview_display = preview_display.rstrip() + "..."
-                            self.draw_text(preview_display, self.font_small, preview_color, text_x, preview_y)
+                            self._draw_text_line(preview_display, self.font_small, preview_color, text_x, preview_y)
                     
-                    y += int(110 * self.scale)  # Increased spacing to match new height
-                    if y > content_rect.bottom - int(20 * self.scale):
+                    y += S[110]  # Increased spacing to match new height
+                    if y > content_rect.bottom - S[20]:
                         break  # Stop if we've reached the bottom
             else:
                 # No posts message
-                empty_y = post_start_y + int(50 * self.scale)
+                empty_y = post_start_y + S[50]
                 # Draw text without box
-                no_unread_y = empty_y + int(15 * self.scale)
-                text_x = content_rect.x + int(20 * self.scale)
-                self.draw_text("No unread posts.", self.font_medium, DARK_CYAN, text_x, no_unread_y)
+                no_unread_y = empty_y + S[15]
+                text_x = content_rect.x + S[20]
+                self._draw_text_line("No unread posts.", self.font_medium, DARK_CYAN, text_x, no_unread_y)
                 # Add one character line spacing between the two texts
-                self.draw_text("Press SPACEBAR to return to the main menu.", self.font_small, DARK_CYAN, text_x, no_unread_y + self.font_medium.get_linesize())
+                self._draw_text_line("Press SPACEBAR to return to the main menu.", self.font_small, DARK_CYAN, text_x, no_unread_y + self.font_medium.get_linesize())
             
             # Footer
-            footer_y = self.bbs_height - int(50 * self.scale)
+            footer_y = self.bbs_height - S[50]
             self.draw_line(footer_y)
             # Terminal feed header text above POSTS (white, same font and size)
-            terminal_feed_text = "TERMINAL FEED: THE WALL.... GLYPHIS_IO BBS"
-            footer_x = int(50 * self.scale)
-            terminal_feed_y = footer_y + int(10 * self.scale)
-            self.draw_text(terminal_feed_text, self.font_tiny, WHITE, footer_x, terminal_feed_y)
+            footer_x = S[50]
+            terminal_feed_y = footer_y + S[10]
+            self._draw_text_line(self.FOOTER_TERMINAL_FEED, self.font_tiny, WHITE, footer_x, terminal_feed_y)
             # Posts count and TAB instructions on same line (moved down 1 row)
-            posts_text = f"POSTS: {len(unread_posts)} unread"
-            tab_text = "   TAB: cycle posts   ENTER: read   SPACEBAR: main menu"
+            posts_text = f"POSTS: {len(unread_posts)} unread{self.FOOTER_TERMINAL_FEED_TAB}"
             footer_text_y = terminal_feed_y + self.font_tiny.get_linesize()
-            self.draw_text(posts_text + tab_text, self.font_tiny, DARK_CYAN, footer_x, footer_text_y)
+            self._draw_text_line(posts_text, self.font_tiny, DARK_CYAN, footer_x, footer_text_y)
         else:
             # Show post content (scaled)
             post = self.posts[self.current_post]
-            post["read"] = True
-            
-            # Parse header to extract date stamp and title
-            header_full = post.get("header", "")
-            header_parts = [part.strip() for part in header_full.split("|")]
-            
-            if len(header_parts) >= 3:
-                # Format: "[TAG] author | date | title"
-                date_stamp = f"{header_parts[0]} | {header_parts[1]}"
-                title = header_parts[2]
-            elif len(header_parts) == 2:
-                # Fallback: assume "tag | title" or "tag | date"
-                date_stamp = header_parts[0]
-                title = header_parts[1] if len(header_parts) > 1 else ""
-            else:
-                # Fallback: use whole header as date stamp
-                date_stamp = header_full
-                title = ""
+            date_stamp, title = self._post_header_parts(post)
             
             # Post header panel - increased height to fit two lines with bottom padding
-            header_y = content_rect.y + int(15 * self.scale)
-            header_panel_height = int(80 * self.scale) if title else int(60 * self.scale)  # Added 10px bottom padding
+            header_y = content_rect.y + S[15]
+            header_panel_height = S[80] if title else S[60]  # Added 10px bottom padding
             header_panel = pygame.Rect(
-                content_rect.x + int(15 * self.scale),
+                content_rect.x + S[15],
                 header_y,
-                content_rect.width - int(30 * self.scale),
+                content_rect.width - S[30],
                 header_panel_height
             )
             pygame.draw.rect(self.bbs_surface, PANEL_BLUE, header_panel)
             pygame.draw.rect(self.bbs_surface, ACCENT_CYAN, header_panel, 2)
             
             # Section label
-            self.draw_text("[ POST VIEW ]", self.font_small, ACCENT_CYAN, header_panel.x + int(12 * self.scale), header_panel.y + int(8 * self.scale))
+            self._draw_text_line("[ POST VIEW ]", self.font_small, ACCENT_CYAN, header_panel.x + S[12], header_panel.y + S[8])
             
             # Date stamp (first line) - wrapped to prevent overflow
-            date_y = header_panel.y + int(25 * self.scale)
-            max_header_width = header_panel.width - int(24 * self.scale)
+            date_y = header_panel.y + S[25]
+            max_header_width = header_panel.width - S[24]
             date_wrapped = self._wrap_text(date_stamp, self.font_medium, max_header_width)
             if date_wrapped:
-                self.draw_text(date_wrapped[0], self.font_medium, ACCENT_CYAN, header_panel.x + int(12 * self.scale), date_y)
+                self._draw_text_line(date_wrapped[0], self.font_medium, ACCENT_CYAN, header_panel.x + S[12], date_y)
             
             # Title (second line) - wrapped to prevent overflow
             if title:
-                title_y = date_y + int(22 * self.scale)
+                title_y = date_y + S[22]
                 title_wrapped = self._wrap_text(title, self.font_medium, max_header_width)
                 if title_wrapped:
-                    self.draw_text(title_wrapped[0], self.font_medium, CYAN, header_panel.x + int(12 * self.scale), title_y)
+                    self._draw_text_line(title_wrapped[0], self.font_medium, CYAN, header_panel.x + S[12], title_y)
             
             # Content area
-            content_start_y = header_panel.bottom + int(20 * self.scale)
+            content_start_y = header_panel.bottom + S[20]
             content_area = pygame.Rect(
-                content_rect.x + int(15 * self.scale),
+                content_rect.x + S[15],
                 content_start_y,
-                content_rect.width - int(30 * self.scale),
-                content_rect.bottom - content_start_y - int(20 * self.scale)
+                content_rect.width - S[30],
+                content_rect.bottom - content_start_y - S[20]
             )
             pygame.draw.rect(self.bbs_surface, PANEL_BLUE, content_area)
             pygame.draw.rect(self.bbs_surface, CYAN, content_area, 1)
             
-            # Post body content
-            post_content_width = content_area.width - int(40 * self.scale)
-            post_lines = self._wrap_text(post.get("body", ""), self.font_small, post_content_width)
-            line_height = int(20 * self.scale)
-            max_visible_height = content_area.height - int(20 * self.scale)
-            max_visible_lines = max_visible_height // line_height
-            
-            # Calculate scroll limits
-            max_scroll_lines = max(0, len(post_lines) - max_visible_lines)
-            self.post_scroll_y = max(0, min(max_scroll_lines, self.post_scroll_y))
-            
-            # Draw visible lines
-            start_line = int(self.post_scroll_y)
-            end_line = min(len(post_lines), start_line + max_visible_lines)
-            
-            draw_y = content_area.y + int(15 * self.scale)
-            for i in range(start_line, end_line):
-                if draw_y < content_area.bottom - int(10 * self.scale):
-                    self.draw_text(post_lines[i], self.font_small, CYAN, content_area.x + int(15 * self.scale), draw_y)
-                draw_y += line_height
-            
-            # Scroll indicator
-            if max_scroll_lines > 0:
-                scroll_indicator_y = content_area.bottom - int(15 * self.scale)
-                scroll_text = f"SCROLL: {self.post_scroll_y}/{max_scroll_lines} (UP/DOWN)"
-                self.draw_text(scroll_text, self.font_tiny, DARK_CYAN, content_area.x + int(15 * self.scale), scroll_indicator_y)
-            
-            # Mark as read when viewing
-            post["read"] = True
-            
-            # Assign guest credentials when first post is read
-            if self.player_email == "unknown":
-                self.player_email = "guest"
-            
-            # Grant PSEM token after all welcome posts are read
-            unread_count = len([p for p in self.posts if not p.get("read", False)])
-            if unread_count == 0 and not self.inventory.has_token(Tokens.PSEM):
-                if self.grant_token(Tokens.PSEM, reason="reviewed all welcome threads"):
-                    self.check_email_database()
-            
             # Footer
-            footer_y = self.bbs_height - int(50 * self.scale)
+            post_lines = self._wrap_text(post.get("body", ""), self.font_small, content_area.width - S[40])
+            max_visible_lines = (content_area.height - S[20]) // S[20]
+            footer_y = self.bbs_height - S[50]
             self.draw_line(footer_y)
-            instruction_text = "ESC: return   SPACEBAR: main menu"
             if len(post_lines) > max_visible_lines:
-                instruction_text += "   UP/DOWN: scroll"
-            self.draw_text(instruction_text, self.font_tiny, DARK_CYAN, int(50 * self.scale), footer_y + int(10 * self.scale))
+                instruction_text = self.FOOTER_POST_INSTRUCTIONS_SCROLL
+            else:
+                instruction_text = self.FOOTER_POST_INSTRUCTIONS
+            self._draw_text_line(instruction_text, self.font_tiny, DARK_CYAN, S[50], footer_y + S[10])
+            
+            # Everything above is unchanged until another post is opened or the layout changes
+            self._static_layer["post"] = self.bbs_surface.convert()
+            self._static_layer_key["post"] = layer_key
+            self._post_view_content_area = content_area
+            self._draw_post_view_body(post, content_area)
+    
+    def _draw_post_view_body(self, post, content_area):
+        """Draw the per-frame parts of the post view: scrolled body lines and scroll indicator"""
+        S = self._S
+        self._mark_post_read(self.current_post)
+        
+        # Post body content
+        post_content_width = content_area.width - S[40]
+        post_lines = self._wrap_text(post.get("body", ""), self.font_small, post_content_width)
+        line_height = S[20]
+        max_visible_height = content_area.height - S[20]
+        max_visible_lines = max_visible_height // line_height
+        
+        # Calculate scroll limits
+        max_scroll_lines = max(0, len(post_lines) - max_visible_lines)
+        self.post_scroll_y = max(0, min(max_scroll_lines, self.post_scroll_y))
+        
+        # Draw visible lines
+        start_line = int(self.post_scroll_y)
+        end_line = min(len(post_lines), start_line + max_visible_lines)
+        
+        draw_y = content_area.y + S[15] + self.content_scroll_y
+        line_x = content_area.x + S[15]
+        line_limit = content_area.bottom - S[10] + self.content_scroll_y
+        # Only lines starting above line_limit are drawn, so trim the range up front
+        visible = max(0, -((draw_y - line_limit) // line_height))
+        body_blits = []
+        for i in range(start_line, min(end_line, start_line + visible)):
+            line_text = post_lines[i]
+            if line_text:
+                body_blits.append((self._render_cached(line_text, self.font_small, CYAN), (line_x, draw_y)))
+            draw_y += line_height
+        self.bbs_surface.blits(body_blits, doreturn=0)
+        
+        # Scroll indicator
+        if max_scroll_lines > 0:
+            scroll_indicator_y = content_area.bottom - S[15]
+            # Only re-format/re-render the indicator when the scroll position actually changes
+            scroll_key = (self.post_scroll_y, max_scroll_lines, id(self.font_tiny))
+            if self._scroll_text_key != scroll_key:
+                scroll_text = f"SCROLL: {self.post_scroll_y}/{max_scroll_lines} (UP/DOWN)"
+                self._scroll_text_surface = self.font_tiny.render(scroll_text, True, DARK_CYAN)
+                self._scroll_text_key = scroll_key
+            self.bbs_surface.blit(self._scroll_text_surface, (content_area.x + S[15], scroll_indicator_y + self.content_scroll_y))
+        
+        # Assign guest credentials when first post is read
+        if self.player_email == "unknown":
+            self.player_email = "guest"
+        
+        # Grant PSEM token after all welcome posts are read
+        if self._posts_unread == 0 and not self.inventory.has_token(Tokens.PSEM):
+            if self.grant_token(Tokens.PSEM, reason="reviewed all welcome threads"):
+                self.check_email_database()
     
     def draw_email_system(self):
         """Draw the Email System module"""
@@ -2727,7 +3142,8 @@ class GLYPHIS_IOBBS:
             self._draw_email_menu_screen()
 
     def _draw_email_menu_screen(self):
-        unread_count = len([e for e in self.inbox if not e.read])
+        S = self._S
+        unread_count = self._inbox_unread
         _, modules_rect, info_rect = self._prepare_bbs_screen(
             "EMAIL SYSTEM // INTERNAL MAIL",
             ["TAB: switch folders   ENTER: open selection   ESC: return to main menu"],
@@ -2741,18 +3157,17 @@ class GLYPHIS_IOBBS:
             f"SENT ({len(self.sent)})",
         ]
 
-        label_x = modules_rect.x + int(20 * self.scale)
-        self.draw_text("[ MAIL OPERATIONS ]", self.font_small, ACCENT_CYAN, label_x, modules_rect.y + int(20 * self.scale))
+        label_x = modules_rect.x + S[20]
+        self._draw_text_line("[ MAIL OPERATIONS ]", self.font_small, ACCENT_CYAN, label_x, modules_rect.y + S[20])
 
-        y = modules_rect.y + int(60 * self.scale)
-        row_height = max(int(46 * self.scale), 32)
+        y = modules_rect.y + S[60]
+        row_height = max(S[46], 32)
+        # One rect is moved down the column instead of allocating a new one per row
+        entry_rect = pygame.Rect(modules_rect.x + S[16], 0, modules_rect.width - S[32], row_height)
+        row_offset = S[10]
+        text_x = entry_rect.x + S[14]
         for i, option in enumerate(options):
-            entry_rect = pygame.Rect(
-                modules_rect.x + int(16 * self.scale),
-                y - int(10 * self.scale),
-                modules_rect.width - int(32 * self.scale),
-                row_height,
-            )
+            entry_rect.y = y - row_offset
             if i == self.current_module:
                 pygame.draw.rect(self.bbs_surface, HIGHLIGHT_BLUE, entry_rect)
                 pygame.draw.rect(self.bbs_surface, ACCENT_CYAN, entry_rect, 2)
@@ -2764,34 +3179,35 @@ class GLYPHIS_IOBBS:
                 tag = "[ ]"
 
             module_font = self.font_medium_small if option.startswith("INBOX") else self.font_medium
-            self.draw_text(f"{tag} {option}", module_font, color, entry_rect.x + int(14 * self.scale), y)
+            self._draw_text_line(f"{tag} {option}", module_font, color, text_x, y)
             y += row_height
 
         if info_rect:
-            info_x = info_rect.x + int(20 * self.scale)
-            info_y = info_rect.y + int(20 * self.scale)
-            self.draw_text("[ INBOX STATUS ]", self.font_small, ACCENT_CYAN, info_x, info_y)
-            info_y += int(30 * self.scale)
-            self.draw_text(f"Unread messages: {unread_count}", self.font_small, CYAN, info_x, info_y)
-            info_y += int(24 * self.scale)
-            self.draw_text(f"Outbox size: {len(self.outbox)}", self.font_tiny, DARK_CYAN, info_x, info_y)
-            info_y += int(20 * self.scale)
-            self.draw_text(f"Sent archive: {len(self.sent)}", self.font_tiny, DARK_CYAN, info_x, info_y)
-            info_y += int(30 * self.scale)
+            info_x = info_rect.x + S[20]
+            info_y = info_rect.y + S[20]
+            self._draw_text_line("[ INBOX STATUS ]", self.font_small, ACCENT_CYAN, info_x, info_y)
+            info_y += S[30]
+            self._draw_text_line(f"Unread messages: {unread_count}", self.font_small, CYAN, info_x, info_y)
+            info_y += S[24]
+            self._draw_text_line(f"Outbox size: {len(self.outbox)}", self.font_tiny, DARK_CYAN, info_x, info_y)
+            info_y += S[20]
+            self._draw_text_line(f"Sent archive: {len(self.sent)}", self.font_tiny, DARK_CYAN, info_x, info_y)
+            info_y += S[30]
             if self.inbox:
                 latest = self.inbox[-1]
-                self.draw_text("Last received:", self.font_tiny, ACCENT_CYAN, info_x, info_y)
-                info_y += int(20 * self.scale)
-                self.draw_text(f"{latest.sender}", self.font_tiny, CYAN, info_x, info_y, max_width=info_rect.width - int(40 * self.scale))
-                info_y += int(18 * self.scale)
-                self.draw_text(f"{latest.subject}", self.font_tiny, DARK_CYAN, info_x, info_y, max_width=info_rect.width - int(40 * self.scale))
+                self._draw_text_line("Last received:", self.font_tiny, ACCENT_CYAN, info_x, info_y)
+                info_y += S[20]
+                self.draw_text(f"{latest.sender}", self.font_tiny, CYAN, info_x, info_y, max_width=info_rect.width - S[40])
+                info_y += S[18]
+                self.draw_text(f"{latest.subject}", self.font_tiny, DARK_CYAN, info_x, info_y, max_width=info_rect.width - S[40])
             else:
-                self.draw_text("Inbox empty.", self.font_tiny, DARK_CYAN, info_x, info_y)
+                self._draw_text_line("Inbox empty.", self.font_tiny, DARK_CYAN, info_x, info_y)
 
         self._draw_footer_status()
     
     def draw_compose_screen(self):
         """Draw the email composition screen"""
+        S = self._S
         _, panel_rect, _ = self._prepare_bbs_screen(
             "EMAIL // COMPOSE MESSAGE",
             ["TAB: switch fields   ENTER: send   ESC: cancel"],
@@ -2799,13 +3215,13 @@ class GLYPHIS_IOBBS:
             left_ratio=1.0,
         )
 
-        panel_x = panel_rect.x + int(20 * self.scale)
-        panel_width = panel_rect.width - int(40 * self.scale)
-        cursor_y = panel_rect.y + int(20 * self.scale)
+        panel_x = panel_rect.x + S[20]
+        panel_width = panel_rect.width - S[40]
+        cursor_y = panel_rect.y + S[20]
 
         if not self.inventory.has_token(Tokens.PSEM):
-            self.draw_text("EMAIL SYSTEM LOCKED", self.font_medium, CYAN, panel_x, cursor_y)
-            cursor_y += int(40 * self.scale)
+            self._draw_text_line("EMAIL SYSTEM LOCKED", self.font_medium, CYAN, panel_x, cursor_y)
+            cursor_y += S[40]
             self.draw_text(
                 "Review every welcome thread on the Terminal Feed to unlock email access.",
                 self.font_small,
@@ -2818,16 +3234,16 @@ class GLYPHIS_IOBBS:
             return
         
         # To field
-        self.draw_text("TO:", self.font_small, ACCENT_CYAN, panel_x, cursor_y)
-        self.draw_text(self.compose_to, self.font_small, DARK_CYAN, panel_x + int(120 * self.scale), cursor_y)
-        cursor_y += int(40 * self.scale)
+        self._draw_text_line("TO:", self.font_small, ACCENT_CYAN, panel_x, cursor_y)
+        self._draw_text_line(self.compose_to, self.font_small, DARK_CYAN, panel_x + S[120], cursor_y)
+        cursor_y += S[40]
 
         # Subject field
-        self.draw_text("SUBJECT:", self.font_small, ACCENT_CYAN, panel_x, cursor_y)
+        self._draw_text_line("SUBJECT:", self.font_small, ACCENT_CYAN, panel_x, cursor_y)
         subject_color = CYAN if self.active_field == "subject" else DARK_CYAN
         cursor = "|" if self.active_field == "subject" else ""
-        subject_field_x = panel_x + int(140 * self.scale)
-        subject_field_width = panel_width - int(160 * self.scale)
+        subject_field_x = panel_x + S[140]
+        subject_field_width = panel_width - S[160]
         pygame.draw.rect(
             self.bbs_surface,
             DARK_BLUE,
@@ -2835,24 +3251,24 @@ class GLYPHIS_IOBBS:
                 subject_field_x,
                 cursor_y + self.content_scroll_y,
                 subject_field_width,
-                int(34 * self.scale),
+                S[34],
             ),
             1,
         )
-        self.draw_text(self.compose_subject + cursor, self.font_small, subject_color, subject_field_x + int(8 * self.scale), cursor_y + int(6 * self.scale))
-        cursor_y += int(60 * self.scale)
+        self._draw_text_line(self.compose_subject + cursor, self.font_small, subject_color, subject_field_x + S[8], cursor_y + S[6])
+        cursor_y += S[60]
 
         # Body field
-        self.draw_text("MESSAGE:", self.font_small, ACCENT_CYAN, panel_x, cursor_y)
+        self._draw_text_line("MESSAGE:", self.font_small, ACCENT_CYAN, panel_x, cursor_y)
         body_color = CYAN if self.active_field == "body" else DARK_CYAN
         
         body_text = self.compose_body
         if self.active_field == "body":
             body_text += "|"
         
-        body_y = cursor_y + int(30 * self.scale)
-        body_field_height = panel_rect.bottom - body_y - int(140 * self.scale)
-        body_field_height = max(body_field_height, int(120 * self.scale))
+        body_y = cursor_y + S[30]
+        body_field_height = panel_rect.bottom - body_y - S[140]
+        body_field_height = max(body_field_height, S[120])
         pygame.draw.rect(
             self.bbs_surface,
             DARK_BLUE,
@@ -2868,12 +3284,12 @@ class GLYPHIS_IOBBS:
             body_text,
             self.font_small,
             body_color,
-            panel_x + int(10 * self.scale),
-            body_y + int(10 * self.scale),
-            panel_width - int(20 * self.scale),
+            panel_x + S[10],
+            body_y + S[10],
+            panel_width - S[20],
         )
 
-        send_y = body_y + body_field_height + int(20 * self.scale)
+        send_y = body_y + body_field_height + S[20]
         button_x = panel_x
         if self.active_field == "send":
             base_color = CYAN
@@ -2891,15 +3307,16 @@ class GLYPHIS_IOBBS:
             self.bbs_surface.blit(right_surface, (circle_x + circle_surface.get_width(), send_y))
         else:
             indicator = "(   ) SEND"
-            self.draw_text(indicator, self.font_medium, DARK_CYAN, button_x, send_y)
+            self._draw_text_line(indicator, self.font_medium, DARK_CYAN, button_x, send_y)
 
-        hint_y = send_y + int(40 * self.scale)
-        self.draw_text("TAB to target SEND, ENTER to transmit", self.font_tiny, DARK_CYAN, panel_x, hint_y)
+        hint_y = send_y + S[40]
+        self._draw_text_line(self.COMPOSE_SEND_HINT, self.font_tiny, DARK_CYAN, panel_x, hint_y)
 
         self._draw_footer_status()
     
     def draw_email_list(self, emails, title):
         """Draw a list of emails"""
+        S = self._S
         _, panel_rect, _ = self._prepare_bbs_screen(
             f"EMAIL // {title}",
             ["UP/DOWN: navigate mail   ENTER: read   ESC: return"],
@@ -2907,65 +3324,82 @@ class GLYPHIS_IOBBS:
             left_ratio=1.0,
         )
 
-        panel_x = panel_rect.x + int(20 * self.scale)
-        panel_width = panel_rect.width - int(40 * self.scale)
-        y = panel_rect.y + int(20 * self.scale)
+        panel_x = panel_rect.x + S[20]
+        panel_width = panel_rect.width - S[40]
+        y = panel_rect.y + S[20]
 
         if not emails:
-            self.draw_text("No messages.", self.font_medium, DARK_CYAN, panel_x, y + int(40 * self.scale))
+            self._draw_text_line("No messages.", self.font_medium, DARK_CYAN, panel_x, y + S[40])
             self._draw_footer_status()
             return
 
-        entry_height = int(80 * self.scale)
-        gap = int(12 * self.scale)
+        entry_height = S[80]
+        gap = S[12]
+        row_normal, row_highlight = self._get_row_templates(panel_rect.width - S[32], entry_height)
+        # Row boxes and entry text are collected and blitted in two batches
+        row_blits = []
+        text_blits = []
 
+        # Rows are template blits, so only the left edge is needed, not a Rect per row
+        entry_x = panel_rect.x + S[16]
+        text_x = entry_x + S[14]
         for i, email in enumerate(emails[:12]):
-            entry_rect = pygame.Rect(
-                panel_rect.x + int(16 * self.scale),
-                y,
-                panel_rect.width - int(32 * self.scale),
-                entry_height,
-            )
             if i == self.current_module:
-                pygame.draw.rect(self.bbs_surface, HIGHLIGHT_BLUE, entry_rect)
-                pygame.draw.rect(self.bbs_surface, ACCENT_CYAN, entry_rect, 2)
+                row_blits.append((row_highlight, (entry_x, y)))
                 header_color = WHITE
                 prefix = "[>]"
             else:
-                pygame.draw.rect(self.bbs_surface, PANEL_BLUE, entry_rect, 1)
+                row_blits.append((row_normal, (entry_x, y)))
                 header_color = DARK_CYAN if email.read else CYAN
                 prefix = "[*]" if not email.read else "[ ]"
 
-            text_x = entry_rect.x + int(14 * self.scale)
-            line_y = y + int(10 * self.scale)
-            self.draw_text(
+            line_y = y + S[10]
+            self._queue_text(
+                text_blits,
                 f"{prefix} FROM: {email.sender}",
                 self.font_small,
                 header_color,
                 text_x,
                 line_y,
-                max_width=panel_width - int(40 * self.scale),
+                max_width=panel_width - S[40],
             )
-            line_y += int(24 * self.scale)
-            self.draw_text(
+            line_y += S[24]
+            self._queue_text(
+                text_blits,
                 f"SUBJECT: {email.subject}",
                 self.font_small,
                 header_color,
                 text_x,
                 line_y,
-                max_width=panel_width - int(40 * self.scale),
+                max_width=panel_width - S[40],
             )
-            line_y += int(24 * self.scale)
-            self.draw_text(f"TIME: {email.timestamp}", self.font_tiny, DARK_CYAN, text_x, line_y)
+            line_y += S[24]
+            self._queue_text(text_blits, f"TIME: {email.timestamp}", self.font_tiny, DARK_CYAN, text_x, line_y)
 
             y += entry_height + gap
-            if y + entry_height > panel_rect.bottom - int(20 * self.scale):
+            if y + entry_height > panel_rect.bottom - S[20]:
                 break
 
+        self.bbs_surface.blits(row_blits, doreturn=0)
+        self.bbs_surface.blits(text_blits, doreturn=0)
         self._draw_footer_status()
+
+    def _get_row_templates(self, width, height):
+        """Return (normal, highlighted) list row box surfaces for the given size, built once per size"""
+        templates = self._row_templates.get((width, height))
+        if templates is None:
+            normal = pygame.Surface((width, height))
+            normal.fill(PANEL_BLUE)  # Rows sit on a PANEL_BLUE panel, so the box can be opaque
+            pygame.draw.rect(normal, PANEL_BLUE, normal.get_rect(), 1)
+            highlight = pygame.Surface((width, height))
+            highlight.fill(HIGHLIGHT_BLUE)
+            pygame.draw.rect(highlight, ACCENT_CYAN, highlight.get_rect(), 2)
+            templates = self._row_templates[(width, height)] = (normal, highlight)
+        return templates
     
     def draw_reading_screen(self):
         """Draw the email reading screen"""
+        S = self._S
         if not self.selected_email:
             self.state = "inbox"
             return
@@ -2978,35 +3412,34 @@ class GLYPHIS_IOBBS:
             left_ratio=1.0,
         )
 
-        panel_x = panel_rect.x + int(20 * self.scale)
-        panel_width = panel_rect.width - int(40 * self.scale)
-        y = panel_rect.y + int(20 * self.scale)
+        panel_x = panel_rect.x + S[20]
+        panel_width = panel_rect.width - S[40]
+        y = panel_rect.y + S[20]
 
-        self.draw_text(f"FROM: {email.sender}", self.font_small, CYAN, panel_x, y)
-        y += int(28 * self.scale)
-        self.draw_text(f"TO: {email.recipient}", self.font_small, CYAN, panel_x, y)
-        y += int(28 * self.scale)
-        self.draw_text(f"TIME: {email.timestamp}", self.font_small, CYAN, panel_x, y)
-        y += int(28 * self.scale)
-        self.draw_text(f"SUBJECT: {email.subject}", self.font_medium, CYAN, panel_x, y)
-        y += int(36 * self.scale)
+        self._draw_text_line(f"FROM: {email.sender}", self.font_small, CYAN, panel_x, y)
+        y += S[28]
+        self._draw_text_line(f"TO: {email.recipient}", self.font_small, CYAN, panel_x, y)
+        y += S[28]
+        self._draw_text_line(f"TIME: {email.timestamp}", self.font_small, CYAN, panel_x, y)
+        y += S[28]
+        self._draw_text_line(f"SUBJECT: {email.subject}", self.font_medium, CYAN, panel_x, y)
+        y += S[36]
 
         separator_start = (panel_x, y)
         separator_end = (panel_x + panel_width, y)
         pygame.draw.line(self.bbs_surface, DARK_BLUE, separator_start, separator_end, 2)
-        y += int(16 * self.scale)
-
-        body_text = email.body or ""
-        paragraphs = body_text.split("\n")
-        body_lines = []
-        for paragraph in paragraphs:
-            if paragraph == "":
-                body_lines.append("")
-            else:
-                body_lines.extend(self._wrap_text(paragraph, self.font_small, panel_width))
-
-        line_height = int(20 * self.scale)
-        max_visible_height = panel_rect.bottom - y - int(20 * self.scale)
+        y += S[16]
+
+        # Keep the wrapped body on the email itself; rewrap only if the width, font or body changes.
+        # _wrap_text keeps blank paragraphs as empty lines, so the whole body wraps in one call
+        wrap_key = (panel_width, id(self.font_small), email.body)
+        if getattr(email, "_wrap_cache_key", None) != wrap_key:
+            email._wrap_lines = self._wrap_text(email.body or "", self.font_small, panel_width)
+            email._wrap_cache_key = wrap_key
+        body_lines = email._wrap_lines
+
+        line_height = S[20]
+        max_visible_height = panel_rect.bottom - y - S[20]
         max_visible_lines = max_visible_height // line_height
         max_scroll_lines = max(0, len(body_lines) - max_visible_lines)
         self.email_scroll_y = max(0, min(max_scroll_lines, self.email_scroll_y))
@@ -3014,19 +3447,20 @@ class GLYPHIS_IOBBS:
         start_line = int(self.email_scroll_y)
         end_line = min(len(body_lines), start_line + max_visible_lines)
         draw_y = y
-        for i in range(start_line, end_line):
-            if draw_y > panel_rect.bottom - int(20 * self.scale):
-                break
+        # Lines are drawn while they start at or above the bottom margin; work out how many up front
+        line_limit = panel_rect.bottom - S[20]
+        visible = max(0, (line_limit - y) // line_height + 1)
+        body_blits = []
+        for i in range(start_line, min(end_line, start_line + visible)):
             line_text = body_lines[i]
-            if line_text == "":
-                draw_y += line_height
-                continue
-            self.draw_text(line_text, self.font_small, CYAN, panel_x, draw_y)
+            if line_text:
+                self._queue_text(body_blits, line_text, self.font_small, CYAN, panel_x, draw_y)
             draw_y += line_height
+        self.bbs_surface.blits(body_blits, doreturn=0)
 
         if len(body_lines) > max_visible_lines:
-            hint_y = panel_rect.bottom - int(30 * self.scale)
-            self.draw_text("Scroll for additional content", self.font_tiny, DARK_CYAN, panel_x, hint_y)
+            hint_y = panel_rect.bottom - S[30]
+            self._draw_text_line(self.READING_SCROLL_HINT, self.font_tiny, DARK_CYAN, panel_x, hint_y)
 
         self._draw_footer_status()
 
@@ -3061,6 +3495,13 @@ class GLYPHIS_IOBBS:
             self.grant_token(token, reason=reason)
     
     def _get_visible_ops_tasks(self) -> List[dict]:
+        cached = self._visible_tasks_cache
+        if cached is not None and cached[0] == self.inventory.version:
+            tasks = cached[1]
+            self.visible_ops_tasks = tasks
+            self.current_task = max(0, min(self.current_task, len(tasks) - 1))
+            return tasks
+
         tasks: List[dict] = []
         for task in self.urgent_ops_task_definitions:
             token = task.get("token_required")
@@ -3080,6 +3521,7 @@ class GLYPHIS_IOBBS:
             ]
 
         self.visible_ops_tasks = tasks
+        self._visible_tasks_cache = (self.inventory.version, tasks)
         if tasks:
             self.current_task = max(0, min(self.current_task, len(tasks) - 1))
         else:
@@ -3091,6 +3533,8 @@ class GLYPHIS_IOBBS:
             return
 
         cap = None
+        ops_surface = None
+        bg_surface = None
         try:
             cap = cv2.VideoCapture(video_path)
             if not cap or not cap.isOpened():
@@ -3099,38 +3543,53 @@ class GLYPHIS_IOBBS:
                 return
 
             fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
-            frame_delay = 1.0 / fps
-            last_time = time.time()
+            video_clock = pygame.time.Clock()
+
+            # Decoded BGR frames are wrapped (no copy) and scaled by SDL straight into these reusable
+            # surfaces; they are created on the first frame so they share the source pixel format
+            ops_size = (self.bbs_width, self.bbs_height)
+            bg_size = (self.screen_width, self.screen_height)
+            # The background only shows around the BBS window, so it is refreshed at half rate
+            # (and not at all if the window covers the whole screen)
+            bbs_covers_screen = (
+                self.bbs_x <= 0
+                and self.bbs_y <= 0
+                and self.bbs_x + self.bbs_width >= self.screen_width
+                and self.bbs_y + self.bbs_height >= self.screen_height
+            )
+            bg_frame_skip = 0
 
             while True:
                 ret, frame = cap.read()
                 if not ret:
                     break
 
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame_resized = cv2.resize(frame_rgb, (self.bbs_width, self.bbs_height))
-                frame_surface = pygame.surfarray.make_surface(np.swapaxes(frame_resized, 0, 1))
-
-                self.bbs_surface.blit(frame_surface, (0, 0))
+                raw = pygame.image.frombuffer(frame, (frame.shape[1], frame.shape[0]), "BGR")
+                if ops_surface is None:
+                    ops_surface = pygame.Surface(ops_size, 0, raw)
+                pygame.transform.scale(raw, ops_size, ops_surface)
+                self.bbs_surface.blit(ops_surface, (0, 0))
 
                 # Keep desktop background video playing instead of using static desktop.png
-                if self.video_cap and _cv2_available:
-                    # Read next frame from desktop background video
-                    ret_bg, frame_bg = self.video_cap.read()
-                    if ret_bg:
-                        frame_bg_rgb = cv2.cvtColor(frame_bg, cv2.COLOR_BGR2RGB)
-                        frame_bg_resized = cv2.resize(frame_bg_rgb, (self.screen_width, self.screen_height))
-                        frame_bg_surface = pygame.surfarray.make_surface(np.swapaxes(frame_bg_resized, 0, 1))
-                        self.screen.blit(frame_bg_surface, (0, 0))
-                    else:
-                        # Video ended, loop back to beginning
-                        self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                if self.video_cap and _cv2_available and not bbs_covers_screen:
+                    if (bg_frame_skip & 1) == 0:
+                        # Read next frame from desktop background video
                         ret_bg, frame_bg = self.video_cap.read()
+                        if not ret_bg:
+                            # Video ended, loop back to beginning
+                            self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                            ret_bg, frame_bg = self.video_cap.read()
                         if ret_bg:
-                            frame_bg_rgb = cv2.cvtColor(frame_bg, cv2.COLOR_BGR2RGB)
-                            frame_bg_resized = cv2.resize(frame_bg_rgb, (self.screen_width, self.screen_height))
-                            frame_bg_surface = pygame.surfarray.make_surface(np.swapaxes(frame_bg_resized, 0, 1))
-                            self.screen.blit(frame_bg_surface, (0, 0))
+                            raw_bg = pygame.image.frombuffer(frame_bg, (frame_bg.shape[1], frame_bg.shape[0]), "BGR")
+                            if bg_surface is None:
+                                bg_surface = pygame.Surface(bg_size, 0, raw_bg)
+                            pygame.transform.scale(raw_bg, bg_size, bg_surface)
+                    else:
+                        # Advance without retrieving/resizing so the background keeps its pace
+                        self.video_cap.grab()
+                    bg_frame_skip += 1
+                    if bg_surface is not None:
+                        self.screen.blit(bg_surface, (0, 0))
                 else:
                     self.screen.fill(BLACK)
 
@@ -3140,16 +3599,17 @@ class GLYPHIS_IOBBS:
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
                         cap.release()
-                        pygame.quit()
-                        sys.exit()
+                        self.shutdown()
 
-                elapsed = time.time() - last_time
-                if elapsed < frame_delay:
-                    time.sleep(frame_delay - elapsed)
-                last_time = time.time()
+                video_clock.tick(int(round(fps)))
         except Exception as exc:
             log_event(f"Intro video playback failed: {exc}")
         finally:
+            # Drop the frame surfaces so their buffers can be released
+            ops_surface = None
+            bg_surface = None
+            # The video flipped its own frames; run()'s next frame must repaint the whole window
+            self._last_present_key = None
             if cap:
                 try:
                     cap.release()
@@ -3379,21 +3839,90 @@ class GLYPHIS_IOBBS:
             self.screen.blit(body_font.render(line, True, WHITE), (x, y))
             y += int(28 * self.scale)
 
+    def _blit_panel_cache(self, name, state_key):
+        """Blit the last frame drawn for a module screen if nothing it shows has changed"""
+        cached = self._panel_cache.get(name)
+        if cached is None or cached[1] != (state_key, self.bbs_width, self.bbs_height):
+            return False
+        self.bbs_surface.blit(cached[0], (0, 0))
+        return True
+
+    def _store_panel_cache(self, name, state_key):
+        self._panel_cache[name] = (self.bbs_surface.convert(), (state_key, self.bbs_width, self.bbs_height))
+        # A cache miss repainted the whole panel
+        self._mark_dirty(self.bbs_surface.get_rect())
+
+    def _render_hud_line(self, slot, text):
+        """One cached surface per slot for text that keeps changing (debug HUD, system clock);
+        kept out of _text_cache so the churn doesn't evict real UI text"""
+        cached = self._hud_surfaces.get(slot)
+        if cached is not None and cached[0] == text and cached[2] is self.font_tiny:
+            return cached[1]
+        surface = self.font_tiny.render(text, True, CYAN)
+        self._hud_surfaces[slot] = (text, surface, self.font_tiny)
+        return surface
+
+    def _mark_dirty(self, bbs_rect):
+        """Record a changed region of bbs_surface (BBS-local coordinates) for a partial display update"""
+        self._dirty_rects.append(bbs_rect.move(self.bbs_x, self.bbs_y))
+
+    def _sync_mouse_motion_filter(self):
+        """Block MOUSEMOTION at the event queue unless something on screen handles it.
+        The BBS itself only reacts to clicks and keys (hotspots poll mouse.get_pos), so idle
+        mouse movement would otherwise flood the queue with events the loop just discards."""
+        wanted = (
+            self.os_mode_active
+            or self.documentation_viewer.visible
+            or self.state in self.MOUSE_MOTION_STATES
+        )
+        if wanted != self._mouse_motion_allowed:
+            if wanted:
+                pygame.event.set_allowed(pygame.MOUSEMOTION)
+            else:
+                pygame.event.set_blocked(pygame.MOUSEMOTION)
+            self._mouse_motion_allowed = wanted
+
+    def _present_key(self):
+        """Layout key for frames that may be presented with display.update(dirty rects), or None.
+        Only plain BBS screens are tracked; anything animating outside the BBS window forces a full flip."""
+        if self.state not in self.SELF_CLEARING_STATES:
+            return None
+        if (self.video_cap and _cv2_available) or self.os_mode_active or self.bbs_overlay_active:
+            return None
+        if self.delete_confirmation_active or self.delete_email_modal_active or self.logout_modal_active:
+            return None
+        if self.documentation_viewer.visible or self.documentation_viewer.closing:
+            return None
+        return (
+            self.state,
+            self.bbs_x,
+            self.bbs_y,
+            self.bbs_width,
+            self.bbs_height,
+            self.screen_width,
+            self.screen_height,
+            id(self.desktop_bg),
+        )
+
     def draw_games_module(self):
         """Draw the Games module"""
+        S = self._S
         self.content_scroll_y = 0
+        games = self._get_unlocked_games()
+        panel_key = (self.current_game_index, tuple(definition.title for definition in games), self.player_email)
+        if self._blit_panel_cache("games", panel_key):
+            return
         _, modules_rect, info_rect = self._prepare_bbs_screen(
             "GAMES // PROTOTYPE LIBRARY",
             ["UP/DOWN: navigate prototypes   ENTER: launch   ESC: return"],
             include_info=True,
         )
 
-        games = self._get_unlocked_games()
-        label_x = modules_rect.x + int(20 * self.scale)
-        self.draw_text("[ PROTOTYPES ]", self.font_small, ACCENT_CYAN, label_x, modules_rect.y + int(20 * self.scale))
+        label_x = modules_rect.x + S[20]
+        self._draw_text_line("[ PROTOTYPES ]", self.font_small, ACCENT_CYAN, label_x, modules_rect.y + S[20])
 
-        y = modules_rect.y + int(60 * self.scale)
-        row_height = max(int(46 * self.scale), 32)
+        y = modules_rect.y + S[60]
+        row_height = max(S[46], 32)
 
         if not games:
             self.draw_text(
@@ -3402,152 +3931,174 @@ class GLYPHIS_IOBBS:
                 DARK_CYAN,
                 label_x,
                 y,
-                max_width=modules_rect.width - int(40 * self.scale),
+                max_width=modules_rect.width - S[40],
             )
         else:
+            entry_x = modules_rect.x + S[16]
+            entry_offset = S[10]
+            text_x = entry_x + S[14]
+            row_normal, row_highlight = self._get_row_templates(modules_rect.width - S[32], row_height)
+            row_blits = []
+            label_blits = []
+            render_cached = self._render_cached
+            font_medium = self.font_medium
+            current_index = self.current_game_index
             for i, definition in enumerate(games):
-                entry_rect = pygame.Rect(
-                    modules_rect.x + int(16 * self.scale),
-                    y - int(10 * self.scale),
-                    modules_rect.width - int(32 * self.scale),
-                    row_height,
-                )
-                if i == self.current_game_index:
-                    pygame.draw.rect(self.bbs_surface, HIGHLIGHT_BLUE, entry_rect)
-                    pygame.draw.rect(self.bbs_surface, ACCENT_CYAN, entry_rect, 2)
+                if i == current_index:
+                    row_blits.append((row_highlight, (entry_x, y - entry_offset)))
                     color = WHITE
                     prefix = "[>]"
                 else:
-                    pygame.draw.rect(self.bbs_surface, PANEL_BLUE, entry_rect, 1)
+                    row_blits.append((row_normal, (entry_x, y - entry_offset)))
                     color = DARK_CYAN
                     prefix = "[ ]"
 
-                self.draw_text(
-                    f"{prefix} {definition.title}",
-                    self.font_medium,
-                    color,
-                    entry_rect.x + int(14 * self.scale),
-                    y,
-                )
+                # content_scroll_y is 0 on this screen, so the cached label can be blitted directly
+                label_surface = render_cached(f"{prefix} {definition.title}", font_medium, color)
+                label_blits.append((label_surface, (text_x, y)))
                 y += row_height
+            self.bbs_surface.blits(row_blits, doreturn=0)
+            self.bbs_surface.blits(label_blits, doreturn=0)
 
         if info_rect:
-            info_x = info_rect.x + int(20 * self.scale)
-            info_y = info_rect.y + int(20 * self.scale)
-            self.draw_text("[ PROTOTYPE DETAILS ]", self.font_small, ACCENT_CYAN, info_x, info_y)
-            info_y += int(30 * self.scale)
+            info_x = info_rect.x + S[20]
+            info_y = info_rect.y + S[20]
+            self._draw_text_line("[ PROTOTYPE DETAILS ]", self.font_small, ACCENT_CYAN, info_x, info_y)
+            info_y += S[30]
 
             if games:
+                draw_text = self.draw_text
+                font_tiny = self.font_tiny
                 selected = games[self.current_game_index]
-                self.draw_text(selected.title, self.font_small, CYAN, info_x, info_y)
-                info_y += int(24 * self.scale)
+                draw_text(selected.title, self.font_small, CYAN, info_x, info_y)
+                info_y += S[24]
                 tokens_required = getattr(selected, "tokens_required", []) or []
                 if tokens_required:
                     token_text = ", ".join(tokens_required)
                 else:
                     token_text = "--"
-                self.draw_text(f"Tokens required: {token_text}", self.font_tiny, DARK_CYAN, info_x, info_y)
-                info_y += int(24 * self.scale)
-                self.draw_text("Description:", self.font_tiny, ACCENT_CYAN, info_x, info_y)
-                info_y += int(20 * self.scale)
-                self.draw_text(
+                draw_text(f"Tokens required: {token_text}", font_tiny, DARK_CYAN, info_x, info_y)
+                info_y += S[24]
+                draw_text("Description:", font_tiny, ACCENT_CYAN, info_x, info_y)
+                info_y += S[20]
+                draw_text(
                     selected.description,
-                    self.font_tiny,
+                    font_tiny,
                     DARK_CYAN,
                     info_x,
                     info_y,
-                    max_width=info_rect.width - int(40 * self.scale),
+                    max_width=info_rect.width - S[40],
                 )
             else:
-                self.draw_text("Awaiting unlock sequence.", self.font_tiny, DARK_CYAN, info_x, info_y)
+                self._draw_text_line("Awaiting unlock sequence.", self.font_tiny, DARK_CYAN, info_x, info_y)
 
         self._draw_footer_status()
+        self._store_panel_cache("games", panel_key)
     
     def draw_tasks_module(self):
         """Draw the Urgent Ops module"""
+        S = self._S
         self.content_scroll_y = 0
+        tasks = self._get_visible_ops_tasks()
+        panel_key = (
+            self.current_task,
+            tuple((task.get("title"), task.get("status"), task.get("description"), task.get("launch_method")) for task in tasks),
+            self.player_email,
+        )
+        if self._blit_panel_cache("tasks", panel_key):
+            return
         _, modules_rect, info_rect = self._prepare_bbs_screen(
             "URGENT OPS // DISPATCH BOARD",
             ["UP/DOWN: navigate assignments   ESC: return"],
             include_info=True,
         )
 
-        label_x = modules_rect.x + int(20 * self.scale)
-        self.draw_text("[ ACTIVE TASKS ]", self.font_small, ACCENT_CYAN, label_x, modules_rect.y + int(20 * self.scale))
-
-        y = modules_rect.y + int(60 * self.scale)
-        row_height = max(int(46 * self.scale), 32)
-
-        tasks = self._get_visible_ops_tasks()
+        label_x = modules_rect.x + S[20]
+        self._draw_text_line("[ ACTIVE TASKS ]", self.font_small, ACCENT_CYAN, label_x, modules_rect.y + S[20])
+
+        y = modules_rect.y + S[60]
+        row_height = max(S[46], 32)
+
+        # Row geometry only depends on the panel, so work it out once rather than per row
+        entry_x = modules_rect.x + S[16]
+        entry_offset = S[10]
+        text_x = entry_x + S[14]
+        label_width = modules_rect.width - S[48]
+        row_normal, row_highlight = self._get_row_templates(modules_rect.width - S[32], row_height)
+        row_blits = []
+        label_blits = []
+        wrap_text = self._wrap_text
+        render_cached = self._render_cached
+        font_medium = self.font_medium
+        current_task = self.current_task
 
         for i, task in enumerate(tasks):
             title = task.get("title", "Unknown assignment")
-            entry_rect = pygame.Rect(
-                modules_rect.x + int(16 * self.scale),
-                y - int(10 * self.scale),
-                modules_rect.width - int(32 * self.scale),
-                row_height,
-            )
-            if i == self.current_task:
-                pygame.draw.rect(self.bbs_surface, HIGHLIGHT_BLUE, entry_rect)
-                pygame.draw.rect(self.bbs_surface, ACCENT_CYAN, entry_rect, 2)
+            if i == current_task:
+                row_blits.append((row_highlight, (entry_x, y - entry_offset)))
                 color = WHITE
                 prefix = "[>]"
             else:
-                pygame.draw.rect(self.bbs_surface, PANEL_BLUE, entry_rect, 1)
+                row_blits.append((row_normal, (entry_x, y - entry_offset)))
                 color = DARK_CYAN
                 prefix = "[ ]"
 
-            self.draw_text(
-                f"{prefix} {title}",
-                self.font_medium,
-                color,
-                entry_rect.x + int(14 * self.scale),
-                y,
-                max_width=modules_rect.width - int(48 * self.scale),
-            )
+            # content_scroll_y is 0 on this screen, so cached label lines can be blitted directly
+            line_y = y
+            for line in wrap_text(f"{prefix} {title}", font_medium, label_width):
+                label_surface = render_cached(line, font_medium, color)
+                label_blits.append((label_surface, (text_x, line_y)))
+                line_y += label_surface.get_height() + 5
             y += row_height
+        self.bbs_surface.blits(row_blits, doreturn=0)
+        self.bbs_surface.blits(label_blits, doreturn=0)
 
         if info_rect:
-            info_x = info_rect.x + int(20 * self.scale)
-            info_y = info_rect.y + int(20 * self.scale)
-            self.draw_text("[ TASK BRIEFING ]", self.font_small, ACCENT_CYAN, info_x, info_y)
-            info_y += int(30 * self.scale)
+            info_x = info_rect.x + S[20]
+            info_y = info_rect.y + S[20]
+            self._draw_text_line("[ TASK BRIEFING ]", self.font_small, ACCENT_CYAN, info_x, info_y)
+            info_y += S[30]
             if tasks:
-                active_task = tasks[self.current_task]
+                font_tiny = self.font_tiny
+                linesize_tiny = font_tiny.get_linesize()
+                briefing_blits = []
+                active_task = tasks[current_task]
                 description = active_task.get("description", active_task.get("title", ""))
-                lines = self._wrap_text(description, self.font_tiny, info_rect.width - int(40 * self.scale))
+                lines = wrap_text(description, font_tiny, info_rect.width - S[40])
                 for line in lines:
-                    self.draw_text(line, self.font_tiny, CYAN, info_x, info_y)
-                    info_y += self.font_tiny.get_linesize()
-                info_y += int(8 * self.scale)
+                    if line:
+                        briefing_blits.append((render_cached(line, font_tiny, CYAN), (info_x, info_y)))
+                    info_y += linesize_tiny
+                info_y += S[8]
                 launch_method = active_task.get("launch_method")
                 status_text = active_task.get("status")
                 if launch_method and not status_text:
                     status_text = "Press ENTER to deploy response."
                 elif not status_text:
                     status_text = "Status: awaiting operator confirmation."
-                status_lines = self._wrap_text(status_text, self.font_tiny, info_rect.width - int(40 * self.scale))
+                status_lines = wrap_text(status_text, font_tiny, info_rect.width - S[40])
                 for line in status_lines[:-1]:
-                    self.draw_text(line, self.font_tiny, DARK_CYAN, info_x, info_y)
-                    info_y += self.font_tiny.get_linesize()
+                    if line:
+                        briefing_blits.append((render_cached(line, font_tiny, DARK_CYAN), (info_x, info_y)))
+                    info_y += linesize_tiny
                 if status_lines:
-                    info_y += self.font_tiny.get_linesize()
-                    self.draw_text(
-                        status_lines[-1],
-                        self.font_tiny,
-                        WHITE,
-                        info_x,
-                        info_y,
-                    )
+                    info_y += linesize_tiny
+                    if status_lines[-1]:
+                        briefing_blits.append((render_cached(status_lines[-1], font_tiny, WHITE), (info_x, info_y)))
+                self.bbs_surface.blits(briefing_blits, doreturn=0)
             else:
-                self.draw_text("No active assignments.", self.font_tiny, DARK_CYAN, info_x, info_y)
+                self._draw_text_line("No active assignments.", self.font_tiny, DARK_CYAN, info_x, info_y)
 
         self._draw_footer_status()
+        self._store_panel_cache("tasks", panel_key)
     
     def draw_team_module(self):
         """Draw the Team Info module"""
+        S = self._S
         self.content_scroll_y = 0
+        panel_key = (self.current_team_member, self.bio_scroll_y, self.player_email)
+        if self._blit_panel_cache("team", panel_key):
+            return
         _, content_rect, _ = self._prepare_bbs_screen(
             "TEAM INFO // PERSONNEL FILES",
             ["LEFT/RIGHT: cycle roster   UP/DOWN: scroll bio   ESC: return"],
@@ -3556,23 +4107,24 @@ class GLYPHIS_IOBBS:
         )
 
         member = self.team_members[self.current_team_member]
-        x = content_rect.x + int(20 * self.scale)
-        y = content_rect.y + int(20 * self.scale)
-        self.draw_text(f"Handle: {member['handle']}", self.font_medium, CYAN, x, y)
-        y += int(30 * self.scale)
+        x = content_rect.x + S[20]
+        y = content_rect.y + S[20]
+        self._draw_text_line(f"Handle: {member['handle']}", self.font_medium, CYAN, x, y)
+        y += S[30]
         if "tag" in member:
-            self.draw_text(member["tag"], self.font_small, ACCENT_CYAN, x, y)
-            y += int(25 * self.scale)
-        self.draw_text(f"Role: {member['role']}", self.font_small, DARK_CYAN, x, y)
-        y += int(30 * self.scale)
+            self._draw_text_line(member["tag"], self.font_small, ACCENT_CYAN, x, y)
+            y += S[25]
+        self._draw_text_line(f"Role: {member['role']}", self.font_small, DARK_CYAN, x, y)
+        y += S[30]
         self.draw_line(y)
-        y += int(20 * self.scale)
-        self.draw_text("Bio:", self.font_small, ACCENT_CYAN, x, y)
-        bio_start_y = y + int(25 * self.scale)
-        bio_width = content_rect.width - int(40 * self.scale)
-        bio_lines = self._wrap_text(member['bio'], self.font_small, bio_width)
-        line_height = int(20 * self.scale)
-        max_visible_height = content_rect.bottom - bio_start_y - int(20 * self.scale)
+        y += S[20]
+        self._draw_text_line("Bio:", self.font_small, ACCENT_CYAN, x, y)
+        bio_start_y = y + S[25]
+        bio_width = content_rect.width - S[40]
+        prepared = self._prepare_team_bio(member, bio_width)
+        bio_lines = prepared["lines"]
+        line_height = S[20]
+        max_visible_height = content_rect.bottom - bio_start_y - S[20]
         max_visible_lines = max_visible_height // line_height
         
         # Calculate scroll limits (scroll_y is number of lines scrolled, starts at 0)
@@ -3585,22 +4137,45 @@ class GLYPHIS_IOBBS:
         start_line = int(self.bio_scroll_y)
         end_line = min(len(bio_lines), start_line + max_visible_lines)
         
-        # Draw lines starting at fixed position, filling downward
-        draw_y = bio_start_y
-        for i in range(start_line, end_line):
-            if draw_y < content_rect.bottom - int(20 * self.scale):
-                self.draw_text(bio_lines[i], self.font_small, DARK_CYAN, x, draw_y)
-            draw_y += line_height
+        # Draw lines starting at fixed position, filling downward (pre-rendered, so scrolling is just a slice)
+        line_limit = content_rect.bottom - S[20]
+        visible_count = max(0, min(end_line - start_line, (line_limit - bio_start_y + line_height - 1) // line_height))
+        self.bbs_surface.blits(
+            [
+                (line_surface, (x, bio_start_y + k * line_height))
+                for k, line_surface in enumerate(prepared["line_surfs"][start_line:start_line + visible_count])
+            ],
+            doreturn=0,
+        )
 
         if len(bio_lines) > max_visible_lines:
-            hint_y = content_rect.bottom - int(30 * self.scale)
-            self.draw_text("Scroll for more...", self.font_tiny, DARK_CYAN, x, hint_y)
+            hint_y = content_rect.bottom - S[30]
+            self._draw_text_line("Scroll for more...", self.font_tiny, DARK_CYAN, x, hint_y)
 
         self._draw_footer_status()
+        self._store_panel_cache("team", panel_key)
+    
+    def _prepare_team_bio(self, member, bio_width):
+        """Wrap and render the current member's bio once; rebuilt only when the width or font changes"""
+        prepared = self._bio_prepared.get(self.current_team_member)
+        if prepared is None or prepared["width"] != bio_width or prepared["font"] != id(self.font_small):
+            lines = self._wrap_text(member['bio'], self.font_small, bio_width)
+            prepared = {
+                "lines": lines,
+                "width": bio_width,
+                "font": id(self.font_small),
+                "line_surfs": [self.font_small.render(line, True, DARK_CYAN) for line in lines],
+            }
+            self._bio_prepared[self.current_team_member] = prepared
+        return prepared
     
     def draw_radio_module(self):
         """Draw the Pirate Radio module"""
+        S = self._S
         self.content_scroll_y = 0
+        panel_key = (self.radio_playing, self.current_track, self.dj_text[self.dj_index], self.player_email)
+        if self._blit_panel_cache("radio", panel_key):
+            return
         _, content_rect, _ = self._prepare_bbs_screen(
             "PIRATE RADIO // SIGNAL NODE",
             ["SPACE: toggle playback   ESC: return"],
@@ -3608,24 +4183,38 @@ class GLYPHIS_IOBBS:
             left_ratio=1.0,
         )
 
-        x = content_rect.x + int(20 * self.scale)
-        y = content_rect.y + int(20 * self.scale)
+        x = content_rect.x + S[20]
+        y = content_rect.y + S[20]
         status = "PLAYING" if self.radio_playing else "STOPPED"
-        self.draw_text(f"Status: {status}", self.font_medium, CYAN, x, y)
-        y += int(40 * self.scale)
-        self.draw_text(f"Now Playing: {self.current_track}", self.font_small, DARK_CYAN, x, y)
-        y += int(40 * self.scale)
+        self._draw_text_line(f"Status: {status}", self.font_medium, CYAN, x, y)
+        y += S[40]
+        self._draw_text_line(f"Now Playing: {self.current_track}", self.font_small, DARK_CYAN, x, y)
+        y += S[40]
         self.draw_line(y)
-        y += int(30 * self.scale)
+        y += S[30]
         
         # DJ text (scaled)
-        self.draw_text("DJ TRANSMISSION:", self.font_small, ACCENT_CYAN, x, y)
-        y += int(30 * self.scale)
-        dj_text_width = content_rect.width - int(40 * self.scale)
+        self._draw_text_line("DJ TRANSMISSION:", self.font_small, ACCENT_CYAN, x, y)
+        y += S[30]
+        dj_text_width = content_rect.width - S[40]
         self.draw_text(self.dj_text[self.dj_index], self.font_small, DARK_CYAN, x, y, dj_text_width)
 
         self._draw_footer_status()
+        self._store_panel_cache("radio", panel_key)
     
+    def _deliver_npc_reply(self, npc_email, email):
+        """Answer a sent email from an NPC and drop the reply straight into the inbox"""
+        response_body = self.npc.generate_response(
+            sender_email=npc_email,
+            email_subject=email.subject,
+            email_body=email.body,
+            player_tokens=self.inventory.get_all_tokens(),
+            player_username=self.player_email
+        )
+        self.inbox.append(Email(npc_email, self.player_email, f"RE: {email.subject}", response_body))
+        # Only the new reply can be unread, so bump the counter instead of rescanning the inbox
+        self._inbox_unread += 1
+
     def handle_text_input(self, event):
         """Handle text input for compose screen"""
         if event.key == pygame.K_ESCAPE:
@@ -3660,8 +4249,7 @@ class GLYPHIS_IOBBS:
                     email_subject = self.compose_subject.strip()
                     
                     # Extract username from "username: " pattern
-                    username_pattern = r"username:\s*(\S+)"
-                    match = re.search(username_pattern, email_body, re.IGNORECASE)
+                    match = USERNAME_RE.search(email_body)
                     if match:
                         new_username = match.group(1).lower()  # Convert to lowercase
                         if new_username and new_username not in ["unknown", "guest"]:
@@ -3692,21 +4280,7 @@ class GLYPHIS_IOBBS:
                         # Only generate NPC response for non-onboarding emails
                         if not match:
                             # Generate response from glyphis (sysop) using enhanced trait-based system
-                            player_tokens = self.inventory.get_all_tokens()
-                            response_body = self.npc.generate_response(
-                                sender_email="glyphis@ciphernet.net",
-                                email_subject=email.subject,
-                                email_body=email.body,
-                                player_tokens=player_tokens,
-                                player_username=self.player_email
-                            )
-                            response = Email(
-                                "glyphis@ciphernet.net",
-                                self.player_email,
-                                f"RE: {email.subject}",
-                                response_body
-                            )
-                            self.inbox.append(response)
+                            self._deliver_npc_reply("glyphis@ciphernet.net", email)
                     elif self.compose_to in ["jaxkando@ciphernet.net", "rain@ciphernet.net", "uncle-am@ciphernet.net"]:
                         # Handle emails to other NPCs using enhanced trait-based system
                         self.sent.append(email)
@@ -3715,31 +4289,14 @@ class GLYPHIS_IOBBS:
                         # Check for help-related keywords (for Jaxkando volunteering)
                         if self.compose_to == "jaxkando@ciphernet.net":
                             email_text = (email.subject + " " + email.body).lower()
-                            help_keywords = ["i want to help", "i'd like to help", "i would like to help", 
-                                            "help", "crack games", "crack games for you", "help with games",
-                                            "help cracking", "want to help", "like to help", "volunteer"]
                             
-                            if any(keyword in email_text for keyword in help_keywords):
+                            if HELP_RE.search(email_text):
                                 # Grant JAX1 token if not already granted
                                 if not self.inventory.has_token(Tokens.JAX1):
                                     self.grant_token(Tokens.JAX1, reason="volunteered to help Jaxkando crack games")
                         
                         # Generate response using enhanced trait-based system
-                        player_tokens = self.inventory.get_all_tokens()
-                        response_body = self.npc.generate_response(
-                            sender_email=self.compose_to,
-                            email_subject=email.subject,
-                            email_body=email.body,
-                            player_tokens=player_tokens,
-                            player_username=self.player_email
-                        )
-                        response = Email(
-                            self.compose_to,
-                            self.player_email,
-                            f"RE: {email.subject}",
-                            response_body
-                        )
-                        self.inbox.append(response)
+                        self._deliver_npc_reply(self.compose_to, email)
                     else:
                         # For other recipients, add to outbox
                         self.outbox.append(email)
@@ -3763,6 +4320,50 @@ class GLYPHIS_IOBBS:
                 elif self.active_field == "body" and len(self.compose_body) < 2000:
                     self.compose_body += event.unicode
     
+    def _mailbox_for(self, state):
+        """The email list behind a mailbox state ("inbox", "outbox" or "sent"), or None for any other state"""
+        return getattr(self, state) if state in self.EMAIL_LIST_STATES else None
+
+    def _current_email_list(self):
+        mailbox = self._mailbox_for(self.state)
+        return self.sent if mailbox is None else mailbox
+
+    def _step_email_scroll(self, step):
+        # Lower limit only; the reading view clamps the bottom against the content length when drawn
+        self.email_scroll_y = max(0, self.email_scroll_y + step)
+
+    def _step_front_post(self, step):
+        if self.current_post is not None:
+            self.post_scroll_y = max(0, self.post_scroll_y + step)
+            return
+        unread_posts = self._unread_post_indices()
+        if unread_posts:
+            self.current_module = max(0, min(len(unread_posts) - 1, self.current_module + step))
+
+    def _step_bio_scroll(self, step):
+        self.bio_scroll_y = max(0, self.bio_scroll_y + step)
+
+    def _step_main_menu(self, step):
+        self.current_module = (self.current_module + step) % len(self.modules)
+
+    def _step_email_menu(self, step):
+        self.current_module = (self.current_module + step) % 4
+
+    def _step_task(self, step):
+        tasks = self._get_visible_ops_tasks()
+        if tasks:
+            self.current_task = (self.current_task + step) % len(tasks)
+
+    def _step_game(self, step):
+        games = self._get_unlocked_games()
+        if games:
+            self.current_game_index = (self.current_game_index + step) % len(games)
+
+    def _step_email_list(self, step):
+        emails = self._current_email_list()
+        if emails:
+            self.current_module = max(0, min(len(emails) - 1, self.current_module + step))
+
     def handle_keyboard_navigation(self, event):
         """Handle keyboard navigation"""
         if event.key == pygame.K_r:
@@ -3795,73 +4396,10 @@ class GLYPHIS_IOBBS:
                 self.current_team_member = (self.current_team_member + 1) % len(self.team_members)
             return
 
-        if event.key == pygame.K_UP:
-            # Handle scrolling for long content first
-            if self.state == "reading":
-                self.email_scroll_y -= 1  # Scroll up (decrease line offset)
-                self.email_scroll_y = max(0, self.email_scroll_y)  # Don't scroll past top
-            elif self.state == "front_post" and self.current_post is not None:
-                self.post_scroll_y -= 1  # Scroll up (decrease line offset)
-                self.post_scroll_y = max(0, self.post_scroll_y)  # Don't scroll past top
-            elif self.state == "team":
-                # Scroll up the bio
-                self.bio_scroll_y -= 1  # Scroll up (decrease line offset)
-                self.bio_scroll_y = max(0, self.bio_scroll_y)  # Don't scroll past top
-            elif self.state == "main_menu":
-                self.current_module = (self.current_module - 1) % len(self.modules)
-            elif self.state == "email_menu":
-                self.current_module = (self.current_module - 1) % 4
-            elif self.state == "tasks":
-                tasks = self._get_visible_ops_tasks()
-                if tasks:
-                    self.current_task = (self.current_task - 1) % len(tasks)
-            elif self.state == "games":
-                games = self._get_unlocked_games()
-                if games:
-                    self.current_game_index = (self.current_game_index - 1) % len(games)
-            elif self.state == "inbox" or self.state == "outbox" or self.state == "sent":
-                emails = self.inbox if self.state == "inbox" else (self.outbox if self.state == "outbox" else self.sent)
-                if emails:
-                    self.current_module = max(0, self.current_module - 1)
-            elif self.state == "front_post":
-                if self.current_post is None:
-                    # Get list of unread posts
-                    unread_posts = [i for i, post in enumerate(self.posts) if not post.get("read", False)]
-                    if unread_posts:
-                        self.current_module = max(0, self.current_module - 1)
-        
-        elif event.key == pygame.K_DOWN:
-            # Handle scrolling for long content
-            if self.state == "reading":
-                self.email_scroll_y += 1  # Scroll down (increase line offset)
-                # Limit scroll based on content length (will be calculated in draw function)
-            elif self.state == "front_post" and self.current_post is not None:
-                self.post_scroll_y += 1  # Scroll down (increase line offset)
-            elif self.state == "team":
-                # Scroll down the bio
-                self.bio_scroll_y += 1  # Scroll down (increase line offset)
-            elif self.state == "main_menu":
-                self.current_module = (self.current_module + 1) % len(self.modules)
-            elif self.state == "email_menu":
-                self.current_module = (self.current_module + 1) % 4
-            elif self.state == "tasks":
-                tasks = self._get_visible_ops_tasks()
-                if tasks:
-                    self.current_task = (self.current_task + 1) % len(tasks)
-            elif self.state == "games":
-                games = self._get_unlocked_games()
-                if games:
-                    self.current_game_index = (self.current_game_index + 1) % len(games)
-            elif self.state == "inbox" or self.state == "outbox" or self.state == "sent":
-                emails = self.inbox if self.state == "inbox" else (self.outbox if self.state == "outbox" else self.sent)
-                if emails:
-                    self.current_module = min(len(emails) - 1, self.current_module + 1)
-            elif self.state == "front_post":
-                if self.current_post is None:
-                    # Get list of unread posts
-                    unread_posts = [i for i, post in enumerate(self.posts) if not post.get("read", False)]
-                    if unread_posts:
-                        self.current_module = min(len(unread_posts) - 1, self.current_module + 1)
+        if event.key == pygame.K_UP or event.key == pygame.K_DOWN:
+            handler_name = self.NAVIGATION_STEP_HANDLERS.get(self.state)
+            if handler_name:
+                getattr(self, handler_name)(-1 if event.key == pygame.K_UP else 1)
         
         elif event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
             if self.state == "main_menu":
@@ -3908,15 +4446,17 @@ class GLYPHIS_IOBBS:
                     self.state = "sent"
                     self.current_module = 0
             
-            elif self.state == "inbox" or self.state == "outbox" or self.state == "sent":
-                emails = self.inbox if self.state == "inbox" else (self.outbox if self.state == "outbox" else self.sent)
+            elif self.state in self.EMAIL_LIST_STATES:
+                emails = self._current_email_list()
                 if emails and 0 <= self.current_module < len(emails):
                     email_obj = emails[self.current_module]
                     self.selected_email = email_obj
                     self.previous_email_state = self.state  # Remember where we came from
+                    self.selected_email_index = self.current_module
                     self.state = "reading"
                     self.email_scroll_y = 0  # Reset scroll when opening email
                     email_obj.read = True
+                    self._recount_unread()
                     self._on_email_marked_read(email_obj)
                     self.save_user_state()
             elif self.state == "tasks":
@@ -3944,12 +4484,12 @@ class GLYPHIS_IOBBS:
             elif self.state == "front_post":
                 if self.current_post is None:
                     # Get list of unread posts
-                    unread_posts = [i for i, post in enumerate(self.posts) if not post.get("read", False)]
+                    unread_posts = self._unread_post_indices()
                     if unread_posts and 0 <= self.current_module < len(unread_posts):
                         self.current_post = unread_posts[self.current_module]
                         self.post_scroll_y = 0  # Reset scroll when opening post
                         # Mark as read when viewing
-                        self.posts[self.current_post]["read"] = True
+                        self._mark_post_read(self.current_post)
             
         elif event.key == pygame.K_LEFT:
             # Navigate to previous team member
@@ -3967,7 +4507,7 @@ class GLYPHIS_IOBBS:
             if self.state == "compose":
                 self.state = "email_menu"
                 self.current_module = 0
-            elif self.state == "inbox" or self.state == "outbox" or self.state == "sent":
+            elif self.state in self.EMAIL_LIST_STATES:
                 self.state = "email_menu"
                 self.current_module = 0
             elif self.state == "reading":
@@ -3997,7 +4537,7 @@ class GLYPHIS_IOBBS:
                 if self.current_post is not None:
                     self.current_post = None
                     # Reset selection to first unread post
-                    unread_posts = [i for i, post in enumerate(self.posts) if not post.get("read", False)]
+                    unread_posts = self._unread_post_indices()
                     if unread_posts:
                         self.current_module = 0
                 # On front post list, ESC doesn't do anything (use SPACEBAR for menu)
@@ -4027,6 +4567,7 @@ class GLYPHIS_IOBBS:
             self.bbs_height = int(self.baseline_bbs_height * self.scale)
             self.bbs_x = int(self.baseline_bbs_x * self.scale)
             self.bbs_y = int(self.baseline_bbs_y * self.scale)
+            self._rebuild_scale_cache()
             self.documentation_viewer.set_scale(self.scale)
             # Update OS mode scale if active
             if self.os_mode_active and self.os_mode:
@@ -4036,33 +4577,22 @@ class GLYPHIS_IOBBS:
             # Reset content scroll (can be adjusted per screen if needed)
             self.content_scroll_y = 0
             # Recreate BBS surface with new dimensions
-            self.bbs_surface = pygame.Surface((self.bbs_width, self.bbs_height), pygame.SRCALPHA)
-            # Recreate fonts with new scale
-            try:
-                self.font_large = pygame.font.Font(get_data_path("Retro Gaming.ttf"), int(30 * self.scale))
-                self.font_medium = pygame.font.Font(get_data_path("Retro Gaming.ttf"), int(22 * self.scale))
-                self.font_medium_small = pygame.font.Font(get_data_path("Retro Gaming.ttf"), max(1, int(20 * self.scale)))
-                self.font_small = pygame.font.Font(get_data_path("Retro Gaming.ttf"), int(16 * self.scale))
-                self.font_tiny = pygame.font.Font(get_data_path("Retro Gaming.ttf"), int(12 * self.scale))
-            except:
-                self.font_large = pygame.font.Font(None, int(30 * self.scale))
-                self.font_medium = pygame.font.Font(None, int(22 * self.scale))
-                self.font_medium_small = pygame.font.Font(None, max(1, int(20 * self.scale)))
-                self.font_small = pygame.font.Font(None, int(16 * self.scale))
-                self.font_tiny = pygame.font.Font(None, int(12 * self.scale))
+            self.bbs_surface = pygame.Surface((self.bbs_width, self.bbs_height)).convert()
+            # Switch fonts to the new scale (cached text surfaces belong to the old fonts)
+            self._clear_render_caches()
+            self._load_fonts()
             # Rescale scroll values
             self.scroll_speed = int(2 * self.scale)
             self.scroll_pause_y = int(660 * self.scale)
             # Rescale scroll image if it exists
-            if self.scroll_image:
-                try:
-                    original_scroll = pygame.image.load(get_data_path("images", "BBS_Scroll.png")).convert_alpha()
-                    if original_scroll.get_width() != self.bbs_width:
-                        scale_factor = self.bbs_width / original_scroll.get_width()
-                        new_height = int(original_scroll.get_height() * scale_factor)
-                        self.scroll_image = pygame.transform.scale(original_scroll, (self.bbs_width, new_height))
-                except:
-                    pass  # If we can't reload, keep the existing scaled image
+            if self.scroll_image and self._scroll_image_original:
+                original_scroll = self._scroll_image_original
+                if original_scroll.get_width() != self.bbs_width:
+                    scale_factor = self.bbs_width / original_scroll.get_width()
+                    new_height = int(original_scroll.get_height() * scale_factor)
+                    self.scroll_image = pygame.transform.scale(original_scroll, (self.bbs_width, new_height))
+                else:
+                    self.scroll_image = original_scroll
         
         elif event.key == pygame.K_SPACE:
             if self.state == "front_post":
@@ -4208,12 +4738,101 @@ class GLYPHIS_IOBBS:
                 # Don't clear active_ops_session here - let it clear when audio finishes
                 print("DEBUG GHOST USER: Sequence complete, inputs re-enabled")
 
+    def _toggle_os_mode(self):
+        """F10: switch OS Mode on or off, creating it on first use"""
+        self.os_mode_active = not self.os_mode_active
+        # Immediately update video state when OS Mode is toggled
+        # This ensures the old video is stopped and the new OS-specific video starts right away
+        self._update_audio_power_state()
+        if self.os_mode_active:
+            # Initialize OS mode if not already initialized
+            if self.os_mode is None:
+                try:
+                    # Create callback function to reset BBS and exit OS mode
+                    def reset_bbs_and_exit_os():
+                        self._reset_to_beginning()
+                        self.os_mode_active = False
+                        # Immediately update video state when exiting OS Mode
+                        # This ensures the OS video is stopped and the regular video starts right away
+                        self._update_audio_power_state()
+                    
+                    # Create token checker callback
+                    def has_token(token):
+                        return self.inventory.has_token(token)
+                    
+                    # Create recording state callbacks
+                    def get_recording_state():
+                        user = self.get_active_user()
+                        if user:
+                            return user.get("recording", False), user.get("recording_start_time")
+                        return False, None
+                    
+                    def set_recording_state(is_recording, start_time=None):
+                        user = self.get_active_user()
+                        if user:
+                            user["recording"] = is_recording
+                            user["recording_start_time"] = start_time
+                            self.save_user_state()
+                    
+                    # Create notes state callbacks
+                    def get_notes():
+                        user = self.get_active_user()
+                        if user:
+                            return user.get("notes", [])
+                        return []
+                    
+                    def save_notes(notes):
+                        print(f"[DEBUG] save_notes callback called with {len(notes)} notes")
+                        user = self.get_active_user()
+                        if user:
+                            print(f"[DEBUG] User found: {user.get('username', 'unknown')}")
+                            user["notes"] = notes
+                            print(f"[DEBUG] Set user notes, now calling save_user_state")
+                            self.save_user_state()
+                            print(f"[DEBUG] save_user_state completed")
+                        else:
+                            print(f"[DEBUG] No active user found!")
+
+                    def get_user_credentials():
+                        user = self.get_active_user()
+                        if user:
+                            return user.get("username", ""), user.get("pin", "")
+                        return "", ""
+                    
+                    def get_chess_stats():
+                        user = self.get_active_user()
+                        if user:
+                            return user.get("chess_stats", {})
+                        return {}
+                    
+                    def save_chess_stats(stats):
+                        user = self.get_active_user()
+                        if user:
+                            user["chess_stats"] = stats
+                            self.save_user_state()
+                    
+                    self.os_mode = OSMode(self.screen, self.scale, reset_bbs_and_exit_os, 
+                                          self.bbs_x, self.bbs_y, self.bbs_width, has_token,
+                                          get_recording_state, set_recording_state,
+                                          get_notes, save_notes, get_user_credentials,
+                                          get_chess_stats, save_chess_stats)
+                except Exception as e:
+                    print(f"Warning: Failed to initialize OS Mode: {e}")
+                    self.os_mode_active = False
+            else:
+                # Update scale if it changed
+                self.os_mode.update_scale(self.scale)
+        # Ensure cursor is visible (OS mode will handle its own cursor switching)
+        pygame.mouse.set_visible(True)
+
     def run(self):
         """Main game loop"""
         running = True
         
         while running:
             dt = self.clock.tick(60) / 1000.0
+            # Caret blinks 500 ms on / 500 ms off
+            self._caret_on = not (pygame.time.get_ticks() // 500) & 1
             
             # Update FPS tracking
             current_time = time.time()
@@ -4235,8 +4854,15 @@ class GLYPHIS_IOBBS:
             
             # Ensure ambient track keeps playing and update fade-in
             if self.ambient_sound:
-                # Check if channel stopped playing (shouldn't happen with loops=-1, but just in case)
-                if self.ambient_playing and self.ambient_channel and not self.ambient_channel.get_busy():
+                # Check if channel stopped playing (shouldn't happen with loops=-1, but just in case);
+                # that is rare enough that once a second is plenty
+                self._ambient_busy_check_timer += dt
+                if self._ambient_busy_check_timer >= 1.0:
+                    self._ambient_busy_check_timer = 0.0
+                    ambient_stopped = self.ambient_playing and self.ambient_channel and not self.ambient_channel.get_busy()
+                else:
+                    ambient_stopped = False
+                if ambient_stopped:
                     print("DEBUG: Ambient track stopped unexpectedly, restarting...")
                     try:
                         if not pygame.mixer.get_init():
@@ -4245,18 +4871,16 @@ class GLYPHIS_IOBBS:
                         if self.ambient_channel:
                             self.ambient_channel.set_volume(0.0)
                             self.ambient_fade_in = True
-                            self.ambient_fade_start_time = pygame.time.get_ticks() / 1000.0
+                            self.ambient_fade_elapsed = 0.0
                     except Exception as e:
                         print(f"Warning: Failed to restart ambient track: {e}")
                 
                 # Update fade-in
                 if self.ambient_fade_in and self.ambient_playing and self.ambient_channel:
-                    current_time = pygame.time.get_ticks() / 1000.0
-                    elapsed = current_time - self.ambient_fade_start_time
-                    if elapsed < self.ambient_fade_duration:
+                    self.ambient_fade_elapsed += dt
+                    if self.ambient_fade_elapsed < self.ambient_fade_duration:
                         # Fade in from 0.0 to 1.0 over fade_duration seconds
-                        volume = min(1.0, elapsed / self.ambient_fade_duration)
-                        self.ambient_channel.set_volume(volume)
+                        self.ambient_channel.set_volume(self.ambient_fade_elapsed / self.ambient_fade_duration)
                     else:
                         # Fade-in complete, set to full volume
                         self.ambient_channel.set_volume(1.0)
@@ -4264,9 +4888,14 @@ class GLYPHIS_IOBBS:
                         print("DEBUG: Ambient room track fade-in complete, volume at 1.0")
 
             # Handle events
+            self._sync_mouse_motion_filter()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type in self.REPAINT_EVENTS:
+                    self._last_present_key = None
+                # Resolved once per event; the checks below compare against the key directly
+                key = event.key if event.type == pygame.KEYDOWN else None
                 
                 # Block all inputs during ghost user sequence (except QUIT)
                 if self.ghost_user_input_blocked:
@@ -4280,26 +4909,12 @@ class GLYPHIS_IOBBS:
                     mouse_x, mouse_y = pygame.mouse.get_pos()
                     
                     # Reset hotspot (scaled from baseline coordinates)
-                    reset_x, reset_y, reset_w, reset_h = RESET_HOTSPOT
-                    reset_hotspot_rect = pygame.Rect(
-                        int(reset_x * self.scale),
-                        int(reset_y * self.scale),
-                        int(reset_w * self.scale),
-                        int(reset_h * self.scale)
-                    )
-                    if reset_hotspot_rect.collidepoint(mouse_x, mouse_y):
+                    if self._reset_hotspot_rect.collidepoint(mouse_x, mouse_y):
                         self._reset_to_beginning()
                         continue
                     
                     # Overlay toggle hotspot (scaled from baseline coordinates)
-                    overlay_x, overlay_y, overlay_w, overlay_h = OVERLAY_HOTSPOT
-                    overlay_hotspot_rect = pygame.Rect(
-                        int(overlay_x * self.scale),
-                        int(overlay_y * self.scale),
-                        int(overlay_w * self.scale),
-                        int(overlay_h * self.scale)
-                    )
-                    if overlay_hotspot_rect.collidepoint(mouse_x, mouse_y):
+                    if self._overlay_hotspot_rect.collidepoint(mouse_x, mouse_y):
                         # If OS mode is active, toggle OS mode overlay instead
                         if self.os_mode_active and self.os_mode:
                             self.os_mode.toggle_overlay()
@@ -4308,11 +4923,11 @@ class GLYPHIS_IOBBS:
                         continue
                 
                 # F12 quits the program
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
+                if key == pygame.K_F12:
                     running = False
                     break
 
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                if key == pygame.K_F4:
                     self.documentation_viewer.toggle_visibility()
                     continue
 
@@ -4320,125 +4935,42 @@ class GLYPHIS_IOBBS:
                     continue
 
                 if self.delete_confirmation_active:
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_y:
+                    if key is not None:
+                        if key == pygame.K_y:
                             self.confirm_delete_user()
-                        elif event.key in (pygame.K_n, pygame.K_ESCAPE):
+                        elif key in (pygame.K_n, pygame.K_ESCAPE):
                             self.cancel_delete_user()
                     continue
 
                 if self.logout_modal_active:
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_y:
+                    if key is not None:
+                        if key == pygame.K_y:
                             self.confirm_logout()
-                        elif event.key in (pygame.K_n, pygame.K_ESCAPE):
+                        elif key in (pygame.K_n, pygame.K_ESCAPE):
                             self.cancel_logout_modal()
                     continue
 
                 if self.delete_email_modal_active:
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_y:
+                    if key is not None:
+                        if key == pygame.K_y:
                             self.confirm_delete_email()
-                        elif event.key in (pygame.K_n, pygame.K_ESCAPE):
+                        elif key in (pygame.K_n, pygame.K_ESCAPE):
                             self.cancel_delete_email_modal()
                     continue
 
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+                if key == pygame.K_F11:
                     self.prompt_delete_user()
                     continue
                 
                 # F10: Toggle OS Mode
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
-                    self.os_mode_active = not self.os_mode_active
-                    # Immediately update video state when OS Mode is toggled
-                    # This ensures the old video is stopped and the new OS-specific video starts right away
-                    self._update_audio_power_state()
-                    if self.os_mode_active:
-                        # Initialize OS mode if not already initialized
-                        if self.os_mode is None:
-                            try:
-                                # Create callback function to reset BBS and exit OS mode
-                                def reset_bbs_and_exit_os():
-                                    self._reset_to_beginning()
-                                    self.os_mode_active = False
-                                    # Immediately update video state when exiting OS Mode
-                                    # This ensures the OS video is stopped and the regular video starts right away
-                                    self._update_audio_power_state()
-                                
-                                # Create token checker callback
-                                def has_token(token):
-                                    return self.inventory.has_token(token)
-                                
-                                # Create recording state callbacks
-                                def get_recording_state():
-                                    user = self.get_active_user()
-                                    if user:
-                                        return user.get("recording", False), user.get("recording_start_time")
-                                    return False, None
-                                
-                                def set_recording_state(is_recording, start_time=None):
-                                    user = self.get_active_user()
-                                    if user:
-                                        user["recording"] = is_recording
-                                        user["recording_start_time"] = start_time
-                                        self.save_user_state()
-                                
-                                # Create notes state callbacks
-                                def get_notes():
-                                    user = self.get_active_user()
-                                    if user:
-                                        return user.get("notes", [])
-                                    return []
-                                
-                                def save_notes(notes):
-                                    print(f"[DEBUG] save_notes callback called with {len(notes)} notes")
-                                    user = self.get_active_user()
-                                    if user:
-                                        print(f"[DEBUG] User found: {user.get('username', 'unknown')}")
-                                        user["notes"] = notes
-                                        print(f"[DEBUG] Set user notes, now calling save_user_state")
-                                        self.save_user_state()
-                                        print(f"[DEBUG] save_user_state completed")
-                                    else:
-                                        print(f"[DEBUG] No active user found!")
-
-                                def get_user_credentials():
-                                    user = self.get_active_user()
-                                    if user:
-                                        return user.get("username", ""), user.get("pin", "")
-                                    return "", ""
-                                
-                                def get_chess_stats():
-                                    user = self.get_active_user()
-                                    if user:
-                                        return user.get("chess_stats", {})
-                                    return {}
-                                
-                                def save_chess_stats(stats):
-                                    user = self.get_active_user()
-                                    if user:
-                                        user["chess_stats"] = stats
-                                        self.save_user_state()
-                                
-                                self.os_mode = OSMode(self.screen, self.scale, reset_bbs_and_exit_os, 
-                                                      self.bbs_x, self.bbs_y, self.bbs_width, has_token,
-                                                      get_recording_state, set_recording_state,
-                                                      get_notes, save_notes, get_user_credentials,
-                                                      get_chess_stats, save_chess_stats)
-                            except Exception as e:
-                                print(f"Warning: Failed to initialize OS Mode: {e}")
-                                self.os_mode_active = False
-                        else:
-                            # Update scale if it changed
-                            self.os_mode.update_scale(self.scale)
-                    # Ensure cursor is visible (OS mode will handle its own cursor switching)
-                    pygame.mouse.set_visible(True)
+                if key == pygame.K_F10:
+                    self._toggle_os_mode()
                     continue
 
                 # Handle OS Mode events
                 if self.os_mode_active and self.os_mode:
                     # ESC to exit OS mode
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    if key == pygame.K_ESCAPE:
                         self.os_mode_active = False
                         # Immediately update video state when exiting OS Mode
                         # This ensures the OS video is stopped and the regular video starts right away
@@ -4461,14 +4993,14 @@ class GLYPHIS_IOBBS:
                     continue
                 
                 # Allow skipping scroll animation with any key
-                if self.state == "bbs_scroll" and event.type == pygame.KEYDOWN:
+                if self.state == "bbs_scroll" and key is not None:
                     self.state = "intro"
                     self.scroll_y = None
                     self.scroll_pause_frames = 0
                     self.scroll_pause_triggered = False
                 
                 # Handle intro screen - advance on any keypress
-                if self.state == "intro" and event.type == pygame.KEYDOWN:
+                if self.state == "intro" and key is not None:
                     active_user = self.get_active_user()
                     if active_user and active_user.get("username"):
                         self.state = "login_username"
@@ -4480,7 +5012,7 @@ class GLYPHIS_IOBBS:
                         self.intro_timer = 0
                     continue
                 
-                if event.type == pygame.KEYDOWN:
+                if key is not None:
                     if self.state in ("login_username", "login_pin_create", "login_pin_verify", "login_success"):
                         self.handle_login_input(event)
                         continue
@@ -4498,17 +5030,17 @@ class GLYPHIS_IOBBS:
                 self.active_ops_session.update(dt)
                 
                 # Check for pending token grants from CRACKER IDE
-                if hasattr(self.active_ops_session, 'pending_token_grants') and self.active_ops_session.pending_token_grants:
-                    for token in self.active_ops_session.pending_token_grants[:]:  # Copy list to iterate safely
+                session = self.active_ops_session
+                if session.pending_token_grants:
+                    for token in session.pending_token_grants[:]:  # Copy list to iterate safely
                         self.grant_token(token, reason=f"LAPC-1 challenge milestone: {token}")
-                        self.active_ops_session.pending_token_grants.remove(token)
+                        session.pending_token_grants.remove(token)
                 
                 # Check if LAPC-1 challenge is completed (all 7 nodes working)
-                if hasattr(self.active_ops_session, 'challenge_completed') and self.active_ops_session.challenge_completed:
-                    if hasattr(self, 'steam') and not getattr(self, '_lapc1_achievement_unlocked', False):
-                        self.steam.unlock_achievement("ACH_LAPC1_READY")
-                        self._lapc1_achievement_unlocked = True
-                        log_event("Steam achievement unlocked: ACH_LAPC1_READY (All 7 nodes completed)")
+                if session.challenge_completed and not self._lapc1_achievement_unlocked:
+                    self.steam.unlock_achievement("ACH_LAPC1_READY")
+                    self._lapc1_achievement_unlocked = True
+                    log_event("Steam achievement unlocked: ACH_LAPC1_READY (All 7 nodes completed)")
                 
                 if self.active_ops_session.should_exit():
                     self._end_ops_session()
@@ -4519,8 +5051,8 @@ class GLYPHIS_IOBBS:
             if self.os_mode_active and self.os_mode:
                 self.os_mode.update(dt)
                 # Check if modem modal requested BBS reset and OS exit
-                if hasattr(self.os_mode, 'modem_modal_should_reset_bbs') and self.os_mode.modem_modal_should_reset_bbs:
-                    if hasattr(self.os_mode, 'modem_modal_should_exit_os') and self.os_mode.modem_modal_should_exit_os:
+                if self.os_mode.modem_modal_should_reset_bbs:
+                    if self.os_mode.modem_modal_should_exit_os:
                         self._reset_to_beginning()
                         self.os_mode_active = False
                         # Immediately update video state when exiting OS Mode
@@ -4530,11 +5062,11 @@ class GLYPHIS_IOBBS:
                         self.os_mode.modem_modal_should_exit_os = False
             
             # Run Steam API callbacks (required for achievements/stats to work)
-            if hasattr(self, 'steam'):
-                self.steam.run_callbacks()
+            self.steam.run_callbacks()
 
-            # Clear BBS surface
-            self.bbs_surface.fill(BLACK)
+            # Clear BBS surface, unless the state's draw method is about to cover all of it anyway
+            if self.state not in self.SELF_CLEARING_STATES:
+                self.bbs_surface.fill(BLACK)
             
             # Draw current state (BBS content)
             if self.state == "bbs_scroll":
@@ -4618,32 +5150,38 @@ class GLYPHIS_IOBBS:
             # Draw BBS window first (before desktop background)
             if self.video_cap and _cv2_available:
                 # Video mode: render video frame, then BBS window, then scanline overlay
-                # Read next frame from video
-                ret, frame = self.video_cap.read()
-                if ret:
-                    # Convert BGR to RGB (OpenCV uses BGR, pygame uses RGB)
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    # Resize video frame to match screen size
-                    frame_resized = cv2.resize(frame_rgb, (self.screen_width, self.screen_height))
-                    # Convert numpy array to pygame surface
-                    # pygame.surfarray expects (width, height) format, so we need to swap axes
-                    frame_swapped = np.swapaxes(frame_resized, 0, 1)
-                    self.video_frame = pygame.surfarray.make_surface(frame_swapped)
-                    # Draw video frame as background
+                now_ms = pygame.time.get_ticks()
+                if (
+                    self.bbs_x <= 0
+                    and self.bbs_y <= 0
+                    and self.bbs_x + self.bbs_width >= self.screen_width
+                    and self.bbs_y + self.bbs_height >= self.screen_height
+                ):
+                    # The BBS window hides the whole desktop, so don't decode frames nobody will see
+                    pass
+                elif (
+                    self.video_frame is not None
+                    and now_ms < self._next_video_frame_ms
+                    and self.video_frame.get_size() == (self.screen_width, self.screen_height)
+                ):
+                    # The game loop runs faster than the video; repeat the last frame until the next one is due
                     self.screen.blit(self.video_frame, (0, 0))
                 else:
-                    # Video ended, loop back to beginning
-                    self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    self._next_video_frame_ms = now_ms + self._video_frame_interval_ms
+                    # Read next frame from video
                     ret, frame = self.video_cap.read()
                     if ret:
-                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        frame_resized = cv2.resize(frame_rgb, (self.screen_width, self.screen_height))
-                        frame_swapped = np.swapaxes(frame_resized, 0, 1)
-                        self.video_frame = pygame.surfarray.make_surface(frame_swapped)
-                        self.screen.blit(self.video_frame, (0, 0))
+                        # Draw video frame as background
+                        self.screen.blit(self._video_frame_to_surface(frame), (0, 0))
                     else:
-                        # Fallback if video can't be read
-                        self.screen.fill(BLACK)
+                        # Video ended, loop back to beginning
+                        self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                        ret, frame = self.video_cap.read()
+                        if ret:
+                            self.screen.blit(self._video_frame_to_surface(frame), (0, 0))
+                        else:
+                            # Fallback if video can't be read
+                            self.screen.fill(BLACK)
                 
                 # Draw BBS window on top of video
                 self.screen.blit(self.bbs_surface, (self.bbs_x, self.bbs_y))
@@ -4673,8 +5211,7 @@ class GLYPHIS_IOBBS:
                         overlays = []
             # Draw thin cyan border around BBS window (on top of everything, unless OS mode is active)
             if not self.os_mode_active:
-                pygame.draw.rect(self.screen, CYAN,
-                                 (self.bbs_x, self.bbs_y, self.bbs_width, self.bbs_height), 1)
+                pygame.draw.rect(self.screen, CYAN, self._bbs_screen_rect, 1)
 
             for overlay_surface, (offset_x, offset_y) in overlays:
                 if overlay_surface:
@@ -4701,33 +5238,39 @@ class GLYPHIS_IOBBS:
                 self.os_mode.draw_overlay()
             elif self.scanline_image:
                 # Draw BBS scanline when not in OS mode
-                scanline_scaled = pygame.transform.scale(self.scanline_image, (self.bbs_width, self.bbs_height))
+                scanline_scaled = self._scanline_scaled
+                if scanline_scaled is None or scanline_scaled.get_size() != (self.bbs_width, self.bbs_height):
+                    scanline_scaled = pygame.transform.scale(self.scanline_image, (self.bbs_width, self.bbs_height)).convert_alpha()
+                    self._scanline_scaled = scanline_scaled
                 self.screen.blit(scanline_scaled, (self.bbs_x, self.bbs_y))
 
             # Draw mouse coordinates
             mouse_x, mouse_y = pygame.mouse.get_pos()
             mouse_text = f"Mouse: {mouse_x}, {mouse_y}"
-            mouse_surface = self.font_tiny.render(mouse_text, True, CYAN)
-            self.screen.blit(mouse_surface, (10, 10))
+            mouse_surface = self._render_hud_line("mouse", mouse_text)
+            hud_rects = [self.screen.blit(mouse_surface, (10, 10))]
 
             bbs_local_x = (mouse_x - self.bbs_x) / self.scale
             bbs_local_y = (mouse_y - self.bbs_y) / self.scale
             bbs_text = f"BBS Window: {int(bbs_local_x)}, {int(bbs_local_y)}"
-            bbs_surface = self.font_tiny.render(bbs_text, True, CYAN)
-            bbs_text_y = 10 + mouse_surface.get_height() + int(4 * self.scale)
-            self.screen.blit(bbs_surface, (10, bbs_text_y))
+            bbs_surface = self._render_hud_line("bbs", bbs_text)
+            bbs_text_y = 10 + mouse_surface.get_height() + self._S[4]
+            hud_rects.append(self.screen.blit(bbs_surface, (10, bbs_text_y)))
             
             # Draw FPS display below Mouse and BBS Window text
             try:
                 fps_text = f"FPS: {int(self.fps_actual)}/{self.fps_target}"
-                fps_surface = self.font_tiny.render(fps_text, True, CYAN)
-                fps_y = bbs_text_y + bbs_surface.get_height() + int(4 * self.scale)
-                self.screen.blit(fps_surface, (10, fps_y))
+                fps_surface = self._render_hud_line("fps", fps_text)
+                fps_y = bbs_text_y + bbs_surface.get_height() + self._S[4]
+                hud_rects.append(self.screen.blit(fps_surface, (10, fps_y)))
             except Exception:
                 pass  # Silently fail if font rendering fails
             
             self.documentation_viewer.draw(self.screen)
+            doc_cursor_state = self.documentation_viewer.cursor_state
             self.documentation_viewer.apply_cursor()
+            if self.documentation_viewer.cursor_state != doc_cursor_state:
+                self._last_cursor = None  # The viewer replaced whatever cursor was set
             
             # Update cursor based on mouse position (only for areas outside OS desktop)
             if self.os_mode_active and self.os_mode:
@@ -4736,61 +5279,50 @@ class GLYPHIS_IOBBS:
                 mouse_x, mouse_y = pygame.mouse.get_pos()
                 if not self.os_mode.is_mouse_in_desktop(mouse_x, mouse_y):
                     # Mouse is outside desktop - use default cursor (hand cursor)
-                    is_night = _is_tokyo_nighttime()
-                    mouse_buttons = pygame.mouse.get_pressed()
-                    
-                    if is_night:
-                        if mouse_buttons[0] and self.mouse_hand_cursor_click_night:
-                            cursor_to_use = self.mouse_hand_cursor_click_night
-                        else:
-                            cursor_to_use = self.mouse_hand_cursor_night
-                    else:
-                        if mouse_buttons[0] and self.mouse_hand_cursor_click:
-                            cursor_to_use = self.mouse_hand_cursor_click
-                        else:
-                            cursor_to_use = self.mouse_hand_cursor
-                    
-                    if cursor_to_use:
-                        try:
-                            pygame.mouse.set_cursor(cursor_to_use)
-                        except Exception:
-                            pass
+                    self._apply_cursor(self._hand_cursor())
+                else:
+                    # OS mode manages the cursor inside its desktop
+                    self._last_cursor = None
             else:
                 # OS mode not active - use normal cursor logic
                 self._update_cursor()
             
             # Draw black rectangles if overlay is active
-            overlay_x, overlay_y, overlay_w, overlay_h = OVERLAY_HOTSPOT
-            overlay_hotspot_rect = pygame.Rect(
-                int(overlay_x * self.scale),
-                int(overlay_y * self.scale),
-                int(overlay_w * self.scale),
-                int(overlay_h * self.scale)
-            )
             if self.bbs_overlay_active:
                 # Black rectangle covering entire BBS window
-                bbs_overlay_rect = pygame.Rect(self.bbs_x, self.bbs_y, self.bbs_width, self.bbs_height)
-                pygame.draw.rect(self.screen, BLACK, bbs_overlay_rect)
+                pygame.draw.rect(self.screen, BLACK, self._bbs_screen_rect)
                 
-                # Black rectangle covering the overlay hotspot (stretched right 20px and down 15px, scaled)
-                stretched_hotspot_rect = pygame.Rect(
-                    int(overlay_x * self.scale),
-                    int(overlay_y * self.scale),
-                    int((overlay_w + 20) * self.scale),
-                    int((overlay_h + 15) * self.scale)
-                )
-                pygame.draw.rect(self.screen, BLACK, stretched_hotspot_rect)
+                # Black rectangle covering the overlay hotspot
+                pygame.draw.rect(self.screen, BLACK, self._stretched_overlay_rect)
             
-            # Periodically check for new emails (every 60 frames = ~1 second at 60fps)
-            self._email_check_counter += 1
-            if self._email_check_counter >= 60:
+            # Periodically check for new emails (once a second, independent of frame rate)
+            now_ms = pygame.time.get_ticks()
+            if now_ms - self._email_last_check_ms >= 1000:
+                self._email_last_check_ms = now_ms
                 self.check_email_database()
-                self._email_check_counter = 0
+            if self._user_state_save_due_ms is not None and now_ms >= self._user_state_save_due_ms:
+                self.save_user_state()
             
-            # Update display
-            pygame.display.flip()
-        
+            # Update display. On a BBS screen over a still background, only the BBS window (or just the
+            # redrawn panel on module screens), the clock and the HUD text (plus where the HUD was last
+            # frame) differ from the last frame
+            present_key = self._present_key()
+            if present_key is not None and present_key == self._last_present_key:
+                if self.state not in self.PANEL_CACHED_STATES:
+                    self._dirty_rects.append(self._bbs_screen_rect)
+                pygame.display.update(self._dirty_rects + hud_rects + self._last_hud_rects)
+            else:
+                pygame.display.flip()
+            self._last_present_key = present_key
+            self._last_hud_rects = hud_rects
+            self._dirty_rects = []
+
+        self.shutdown()
+
+    def shutdown(self):
+        """Single exit path: flush pending saves, release video / Steam, then quit"""
         # Save email state before quitting
+        self._flush_user_state_save()
         if hasattr(self, 'email_db'):
             self.email_db.save_sent_emails()
         
@@ -4829,10 +5361,16 @@ class GLYPHIS_IOBBS:
     def draw_system_clock(self):
         """Render the system clock on the BBS window"""
         clock_text = format_ingame_clock()
-        clock_surface = self.font_tiny.render(clock_text, True, CYAN)
-        x = self.bbs_width - clock_surface.get_width() - int(20 * self.scale)
-        y = int(10 * self.scale)
-        self.bbs_surface.blit(clock_surface, (x, y))
+        previous = self._hud_surfaces.get("clock")
+        clock_surface = self._render_hud_line("clock", clock_text)
+        x = self.bbs_width - clock_surface.get_width() - self._S[20]
+        y = self._S[10]
+        clock_rect = self.bbs_surface.blit(clock_surface, (x, y))
+        if previous is None or previous[1] is not clock_surface:
+            # Only a changed reading needs presenting (old and new extents, in case the width changed)
+            self._mark_dirty(clock_rect)
+            if previous is not None:
+                self._mark_dirty(previous[1].get_rect(topright=clock_rect.topright))
 
     def prompt_delete_email(self):
         """Open confirmation modal to delete the currently viewed email."""
@@ -4844,15 +5382,18 @@ class GLYPHIS_IOBBS:
             log_event("Delete email requested but origin mailbox unknown.")
             return
 
-        source_list = self.inbox if origin_state == "inbox" else (self.outbox if origin_state == "outbox" else self.sent)
+        source_list = self._mailbox_for(origin_state)
         if source_list is None:
             return
 
-        try:
-            index = source_list.index(self.selected_email)
-        except ValueError:
-            log_event("Delete email requested but message not found in mailbox.")
-            return
+        # The list position recorded when the email was opened is normally still right;
+        # otherwise (mail arrived or was removed meanwhile) look it up by identity
+        index = self.selected_email_index
+        if index is None or not 0 <= index < len(source_list) or source_list[index] is not self.selected_email:
+            index = next((i for i, e in enumerate(source_list) if e is self.selected_email), None)
+            if index is None:
+                log_event("Delete email requested but message not found in mailbox.")
+                return
 
         self.delete_email_modal_active = True
         self.delete_email_source_list = source_list
@@ -4902,12 +5443,13 @@ class GLYPHIS_IOBBS:
             return
 
         log_event("Email deleted from mailbox.")
+        self._recount_unread()
         self.selected_email = None
         self.previous_email_state = None
         self.email_scroll_y = 0
 
         if origin_state in ("inbox", "outbox", "sent"):
-            target_list = self.inbox if origin_state == "inbox" else (self.outbox if origin_state == "outbox" else self.sent)
+            target_list = self._mailbox_for(origin_state)
             self.state = origin_state
             if target_list:
                 self.current_module = max(0, min(index, len(target_list) - 1))
@@ -4917,32 +5459,56 @@ class GLYPHIS_IOBBS:
             self.state = "email_menu"
             self.current_module = 0
 
-        # Persist state (especially inbox changes)
-        self.save_user_state()
+        # Persist state (especially inbox changes). The profile dict is updated now; the disk write is
+        # deferred so a run of deletions ends in one user_state.json rewrite
+        self.persist_active_user_profile()
+        self._schedule_user_state_save()
 
-    def draw_delete_email_modal(self):
-        """Render the delete email confirmation overlay."""
-        overlay = pygame.Surface((self.bbs_width, self.bbs_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.bbs_surface.blit(overlay, (0, 0))
+    def _schedule_user_state_save(self, delay_ms=2000):
+        """Ask run() to call save_user_state after delay_ms, unless something saves sooner"""
+        if self._user_state_save_due_ms is None:
+            self._user_state_save_due_ms = pygame.time.get_ticks() + delay_ms
 
-        modal_width = int(self.bbs_width * 0.72)
-        modal_height = int(self.bbs_height * 0.28)
-        modal_x = (self.bbs_width - modal_width) // 2
-        modal_y = (self.bbs_height - modal_height) // 2
-        modal_rect = pygame.Rect(modal_x, modal_y, modal_width, modal_height)
+    def _flush_user_state_save(self):
+        """Write a deferred save now (before quitting)"""
+        if self._user_state_save_due_ms is not None:
+            self.save_user_state()
 
+    def _get_modal_overlay(self):
+        """Translucent black sheet drawn under the confirmation modals, rebuilt only when the BBS is resized"""
+        overlay = self._modal_overlay
+        if overlay is None or overlay.get_size() != (self.bbs_width, self.bbs_height):
+            overlay = pygame.Surface((self.bbs_width, self.bbs_height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 200))
+            self._modal_overlay = overlay
+        return overlay
+
+    def _draw_confirmation_modal(self, name, header_text, header_pad, header_gap, message_lines):
+        """Dim the BBS and draw a centred Y/N modal: the cached box for `name`, a header and (text, colour) lines.
+        header_pad / header_gap are baseline px above and below the header."""
+        S = self._S
+        self.bbs_surface.blit(self._get_modal_overlay(), (0, 0))
+
+        modal_rect = self._modal_rects[name]
         pygame.draw.rect(self.bbs_surface, DARK_BLUE, modal_rect)
         pygame.draw.rect(self.bbs_surface, CYAN, modal_rect, 3)
 
-        header_text = "DELETE EMAIL"
-        header_surface = self.font_medium.render(header_text, True, CYAN)
-        header_pos = (
-            modal_x + (modal_width - header_surface.get_width()) // 2,
-            modal_y + int(20 * self.scale)
-        )
-        self.bbs_surface.blit(header_surface, header_pos)
+        render = self._render_cached
+        modal_x, modal_width = modal_rect.x, modal_rect.width
+        header_surface = render(header_text, self.font_medium, CYAN)
+        line_y = modal_rect.y + S[header_pad]
+        text_blits = [(header_surface, (modal_x + (modal_width - header_surface.get_width()) // 2, line_y))]
+        line_y += header_surface.get_height() + S[header_gap]
+        font_small = self.font_small
+        line_gap = S[12]
+        for text, colour in message_lines:
+            text_surface = render(text, font_small, colour)
+            text_blits.append((text_surface, (modal_x + (modal_width - text_surface.get_width()) // 2, line_y)))
+            line_y += text_surface.get_height() + line_gap
+        self.bbs_surface.blits(text_blits, doreturn=0)
 
+    def draw_delete_email_modal(self):
+        """Render the delete email confirmation overlay."""
         subject = ""
         if isinstance(self.selected_email, Email) and self.selected_email.subject:
             subject = self.selected_email.subject.strip()
@@ -4955,12 +5521,7 @@ class GLYPHIS_IOBBS:
             ("Press Y to confirm or N to cancel.", WHITE),
         ]
 
-        line_y = header_pos[1] + header_surface.get_height() + int(24 * self.scale)
-        for text, colour in message_lines:
-            text_surface = self.font_small.render(text, True, colour)
-            text_x = modal_x + (modal_width - text_surface.get_width()) // 2
-            self.bbs_surface.blit(text_surface, (text_x, line_y))
-            line_y += text_surface.get_height() + int(12 * self.scale)
+        self._draw_confirmation_modal("delete_email", "DELETE EMAIL", 20, 24, message_lines)
 
     def prompt_logout_confirmation(self):
         """Open the confirmation modal before exiting the application."""
@@ -4980,43 +5541,16 @@ class GLYPHIS_IOBBS:
             return
         log_event("Logout confirmed by user.")
         self.logout_modal_active = False
-        pygame.quit()
-        sys.exit()
+        self.shutdown()
 
     def draw_logout_modal(self):
         """Render the logout confirmation overlay."""
-        overlay = pygame.Surface((self.bbs_width, self.bbs_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.bbs_surface.blit(overlay, (0, 0))
-
-        modal_width = int(self.bbs_width * 0.68)
-        modal_height = int(self.bbs_height * 0.24) + int(30 * self.scale)
-        modal_x = (self.bbs_width - modal_width) // 2
-        modal_y = (self.bbs_height - modal_height) // 2
-        modal_rect = pygame.Rect(modal_x, modal_y, modal_width, modal_height)
-
-        pygame.draw.rect(self.bbs_surface, DARK_BLUE, modal_rect)
-        pygame.draw.rect(self.bbs_surface, CYAN, modal_rect, 3)
-
-        header_text = "CONFIRM LOGOUT"
-        header_surface = self.font_medium.render(header_text, True, CYAN)
-        header_pos = (
-            modal_x + (modal_width - header_surface.get_width()) // 2,
-            modal_y + int(20 * self.scale)
-        )
-        self.bbs_surface.blit(header_surface, header_pos)
-
         message_lines = [
             ("Logout of GLYPHIS_IO BBS?", CYAN),
             ("Press Y to confirm or N to cancel.", WHITE),
         ]
 
-        line_y = header_pos[1] + header_surface.get_height() + int(24 * self.scale)
-        for text, colour in message_lines:
-            text_surface = self.font_small.render(text, True, colour)
-            text_x = modal_x + (modal_width - text_surface.get_width()) // 2
-            self.bbs_surface.blit(text_surface, (text_x, line_y))
-            line_y += text_surface.get_height() + int(12 * self.scale)
+        self._draw_confirmation_modal("logout", "CONFIRM LOGOUT", 20, 24, message_lines)
 
     def prompt_delete_user(self):
         """Show confirmation modal for deleting the active user profile."""
@@ -5065,6 +5599,20 @@ class GLYPHIS_IOBBS:
         # Reinitialise the application to reboot the experience.
         self.__init__()
 
+    def _write_user_state(self, data):
+        """Write user_state.json, skipping the disk entirely when nothing changed since the last write.
+        The file is written to a temp file and swapped in with os.replace, so a crash can't truncate it."""
+        # Compact one-shot dumps() takes the C encoder; indent or json.dump() would use the pure-Python one
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        if text == self._user_state_written:
+            return
+        state_path = get_data_path("user_state.json")
+        tmp_path = state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, state_path)
+        self._user_state_written = text
+
     def _remove_active_user_profile(self):
         """Remove the active user record from state and persist to disk."""
         users = self.user_state.get("users", [])
@@ -5088,9 +5636,7 @@ class GLYPHIS_IOBBS:
         }
 
         try:
-            state_path = get_data_path("user_state.json")
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            self._write_user_state(data)
         except Exception as exc:
             log_event(f"Error saving user_state.json after deleting '{username}': {exc}")
             return False
@@ -5099,27 +5645,6 @@ class GLYPHIS_IOBBS:
 
     def draw_delete_confirmation_modal(self):
         """Render the delete confirmation overlay onto the BBS surface."""
-        overlay = pygame.Surface((self.bbs_width, self.bbs_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.bbs_surface.blit(overlay, (0, 0))
-
-        modal_width = int(self.bbs_width * 0.75)
-        modal_height = int(self.bbs_height * 0.32)
-        modal_x = (self.bbs_width - modal_width) // 2
-        modal_y = (self.bbs_height - modal_height) // 2
-        modal_rect = pygame.Rect(modal_x, modal_y, modal_width, modal_height)
-
-        pygame.draw.rect(self.bbs_surface, DARK_BLUE, modal_rect)
-        pygame.draw.rect(self.bbs_surface, CYAN, modal_rect, 3)
-
-        header_text = "CONFIRM USER DELETION"
-        header_surface = self.font_medium.render(header_text, True, CYAN)
-        header_pos = (
-            modal_x + (modal_width - header_surface.get_width()) // 2,
-            modal_y + int(24 * self.scale)
-        )
-        self.bbs_surface.blit(header_surface, header_pos)
-
         username = self.delete_confirmation_username or "this profile"
         message_lines = [
             (f"Delete '{username}' from GLYPHIS_IO?", CYAN),
@@ -5127,12 +5652,7 @@ class GLYPHIS_IOBBS:
             ("Press Y to confirm or N to cancel.", WHITE),
         ]
 
-        line_y = header_pos[1] + header_surface.get_height() + int(28 * self.scale)
-        for text, colour in message_lines:
-            text_surface = self.font_small.render(text, True, colour)
-            text_x = modal_x + (modal_width - text_surface.get_width()) // 2
-            self.bbs_surface.blit(text_surface, (text_x, line_y))
-            line_y += text_surface.get_height() + int(12 * self.scale)
+        self._draw_confirmation_modal("delete_user", "CONFIRM USER DELETION", 24, 28, message_lines)
 
     def _create_blank_user(self):
         return {
@@ -5153,8 +5673,23 @@ class GLYPHIS_IOBBS:
             ]
         }
 
+    @staticmethod
+    def _sanitize_stored_email(stored_email):
+        """Copy the known fields of a saved inbox email dict, dropping anything else"""
+        get = stored_email.get
+        return {
+            "id": get("id"),
+            "sender": get("sender"),
+            "recipient": get("recipient"),
+            "subject": get("subject"),
+            "body": get("body"),
+            "timestamp": get("timestamp"),
+            "read": bool(get("read", False)),
+        }
+
     def load_user_state(self):
         state = {"users": [], "active_user_index": 0}
+        sanitize_email = self._sanitize_stored_email
         try:
             state_path = get_data_path("user_state.json")
             if os.path.exists(state_path):
@@ -5170,8 +5705,7 @@ class GLYPHIS_IOBBS:
                                 cleaned["username"] = user.get("username")
                                 cleaned["pin"] = user.get("pin")
                                 cleaned["sent_emails"] = list(user.get("sent_emails", []))
-                                user_tokens = [normalize_token(t) for t in user.get("tokens", [])]
-                                cleaned["tokens"] = list(sort_tokens(tok for tok in user_tokens if tok))
+                                cleaned["tokens"] = list(sort_tokens(user.get("tokens", [])))
                                 cleaned["recording"] = bool(user.get("recording", False))
                                 cleaned["recording_start_time"] = user.get("recording_start_time")
                                 # Load notes, ensure first note exists and is locked
@@ -5184,20 +5718,9 @@ class GLYPHIS_IOBBS:
                                             "is_locked": True
                                         }
                                     ] + cleaned["notes"][1:] if cleaned["notes"] else cleaned["notes"]
-                                cleaned["inbox_emails"] = []
-                                for stored_email in user.get("inbox_emails", []):
-                                    if not isinstance(stored_email, dict):
-                                        continue
-                                    sanitized_email = {
-                                        "id": stored_email.get("id"),
-                                        "sender": stored_email.get("sender"),
-                                        "recipient": stored_email.get("recipient"),
-                                        "subject": stored_email.get("subject"),
-                                        "body": stored_email.get("body"),
-                                        "timestamp": stored_email.get("timestamp"),
-                                        "read": bool(stored_email.get("read", False)),
-                                    }
-                                    cleaned["inbox_emails"].append(sanitized_email)
+                                cleaned["inbox_emails"] = [
+                                    sanitize_email(e) for e in user.get("inbox_emails", []) if isinstance(e, dict)
+                                ]
                                 try:
                                     best_tcs = user.get("username_simulacra_tcs")
                                     cleaned["username_simulacra_tcs"] = float(best_tcs) if best_tcs is not None else None
@@ -5215,8 +5738,7 @@ class GLYPHIS_IOBBS:
                             migrated_user["username"] = data.get("username")
                             migrated_user["pin"] = data.get("pin")
                             migrated_user["sent_emails"] = list(data.get("sent_emails", []))
-                            migrated_tokens = [normalize_token(t) for t in data.get("tokens", [])]
-                            migrated_user["tokens"] = list(sort_tokens(tok for tok in migrated_tokens if tok))
+                            migrated_user["tokens"] = list(sort_tokens(data.get("tokens", [])))
                             migrated_user["recording"] = bool(data.get("recording", False))
                             migrated_user["recording_start_time"] = data.get("recording_start_time")
                             # Load notes, ensure first note exists and is locked
@@ -5229,20 +5751,9 @@ class GLYPHIS_IOBBS:
                                         "is_locked": True
                                     }
                                 ] + migrated_user["notes"][1:] if migrated_user["notes"] else migrated_user["notes"]
-                            migrated_user["inbox_emails"] = []
-                            for stored_email in data.get("inbox_emails", []):
-                                if not isinstance(stored_email, dict):
-                                    continue
-                                sanitized_email = {
-                                    "id": stored_email.get("id"),
-                                    "sender": stored_email.get("sender"),
-                                    "recipient": stored_email.get("recipient"),
-                                    "subject": stored_email.get("subject"),
-                                    "body": stored_email.get("body"),
-                                    "timestamp": stored_email.get("timestamp"),
-                                    "read": bool(stored_email.get("read", False)),
-                                }
-                                migrated_user["inbox_emails"].append(sanitized_email)
+                            migrated_user["inbox_emails"] = [
+                                sanitize_email(e) for e in data.get("inbox_emails", []) if isinstance(e, dict)
+                            ]
                             try:
                                 best_tcs = data.get("username_simulacra_tcs")
                                 migrated_user["username_simulacra_tcs"] = float(best_tcs) if best_tcs is not None else None
@@ -5274,8 +5785,7 @@ class GLYPHIS_IOBBS:
             username = user.get("username")
             self.player_email = username if username else "unknown"
             self.player_pin = user.get("pin")
-            tokens = [normalize_token(t) for t in user.get("tokens", [])]
-            self.inventory.tokens = set(tok for tok in tokens if tok)
+            self.inventory.replace_tokens(normalize_tokens(user.get("tokens", [])))
             user["tokens"] = list(sort_tokens(self.inventory.tokens))
             self.email_db.sent_email_ids = set(user.get("sent_emails", []))
             # Recording state is already loaded in user profile, no need to restore here
@@ -5284,17 +5794,17 @@ class GLYPHIS_IOBBS:
             for stored_email in user.get("inbox_emails", []):
                 if not isinstance(stored_email, dict):
                     continue
-                email_payload = dict(stored_email)
-                email_payload.setdefault("recipient", self.player_email)
-                email = Email.from_dict(email_payload)
+                # Older saves omit the recipient
+                email = Email.from_dict(stored_email, default_recipient=self.player_email)
                 if email:
                     self.inbox.append(email)
         else:
             self.player_email = "unknown"
             self.player_pin = None
-            self.inventory.tokens = set()
+            self.inventory.clear()
             self.email_db.sent_email_ids = set()
             self.inbox = []
+        self._recount_unread()
 
         if self.player_pin and not self.inventory.has_token(Tokens.PIN_SET):
             self.grant_token(Tokens.PIN_SET, reason="restored from profile")
@@ -5338,23 +5848,8 @@ class GLYPHIS_IOBBS:
                     "is_locked": True
                 }
             ]
-        serialized_inbox = []
-        for email in self.inbox:
-            if isinstance(email, Email):
-                serialized_inbox.append(email.to_dict())
-            elif isinstance(email, dict):
-                serialized_inbox.append(
-                    {
-                        "id": email.get("id"),
-                        "sender": email.get("sender"),
-                        "recipient": email.get("recipient", real_username),
-                        "subject": email.get("subject"),
-                        "body": email.get("body"),
-                        "timestamp": email.get("timestamp"),
-                        "read": bool(email.get("read", False)),
-                    }
-                )
-        user["inbox_emails"] = serialized_inbox
+        # Every path that fills the inbox (profile load, database delivery, NPC replies) appends Email objects
+        user["inbox_emails"] = [email.to_dict() for email in self.inbox]
 
     def set_active_user_index(self, index):
         users = self.user_state.get("users", [])
@@ -5430,18 +5925,25 @@ class GLYPHIS_IOBBS:
         self.apply_active_user_profile()
 
     def save_user_state(self):
+        self._user_state_save_due_ms = None
         self.persist_active_user_profile()
-        users = [u for u in self.user_state.get("users", []) if u.get("username")]
-
         active_username = self.player_email if self.player_email not in ("unknown", "guest") else None
-        active_index = 0
-        if active_username:
-            for i, user in enumerate(users):
-                if user.get("username") == active_username:
-                    active_index = i
-                    break
-        elif users:
-            active_index = min(self.user_state.get("active_user_index", 0), len(users) - 1)
+        # Drop unnamed profiles and locate the active one in the same pass
+        users = []
+        active_index = None
+        for user in self.user_state.get("users", []):
+            name = user.get("username")
+            if not name:
+                continue
+            if active_index is None and name == active_username:
+                active_index = len(users)
+            users.append(user)
+
+        if active_index is None:
+            if active_username or not users:
+                active_index = 0
+            else:
+                active_index = min(self.user_state.get("active_user_index", 0), len(users) - 1)
 
         self.user_state["users"] = users
         self.user_state["active_user_index"] = active_index if users else 0
@@ -5451,14 +5953,26 @@ class GLYPHIS_IOBBS:
             "active_user_index": active_index
         }
         try:
-            state_path = get_data_path("user_state.json")
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            self._write_user_state(data)
         except Exception as e:
             log_event(f"Error saving user_state.json: {e}")
 
-    def draw_login_username_screen(self):
-        self.bbs_surface.fill(BLACK)
+    def _ascii_banner(self, lines, font, color):
+        """Render a block of ASCII-art lines, one font line apart, into a single transparent surface"""
+        key = (id(font), color, tuple(lines))
+        banner = self._banner_cache.get(key)
+        if banner is None:
+            rendered = [font.render(line, True, color) for line in lines]
+            line_height = font.get_linesize()
+            width = max((surface.get_width() for surface in rendered), default=0)
+            banner = pygame.Surface((width, line_height * len(rendered)), pygame.SRCALPHA)
+            banner.blits([(surface, (0, i * line_height)) for i, surface in enumerate(rendered)], doreturn=0)
+            self._banner_cache[key] = banner
+        return banner
+
+    def _draw_login_username_static(self):
+        """Draw the unchanging parts of the username screen; returns (content_rect, input_box_rect)"""
+        S = self._S
         self._draw_background_grid()
         
         # Header panel
@@ -5468,19 +5982,19 @@ class GLYPHIS_IOBBS:
         )
         
         # Main content panel (wider box with less margin on sides)
-        panel_top = header_rect.bottom + int(30 * self.scale)
-        panel_height = self.bbs_height - panel_top - int(100 * self.scale)
+        panel_top = header_rect.bottom + S[30]
+        panel_height = self.bbs_height - panel_top - S[100]
         content_rect = pygame.Rect(
-            int(30 * self.scale),
+            S[30],
             panel_top,
-            self.bbs_width - int(60 * self.scale),
+            self.bbs_width - S[60],
             panel_height
         )
         pygame.draw.rect(self.bbs_surface, PANEL_BLUE, content_rect)
         pygame.draw.rect(self.bbs_surface, CYAN, content_rect, 2)
         
         # Section header - ASCII art
-        section_y = content_rect.y + int(25 * self.scale)
+        section_y = content_rect.y + S[25]
         ascii_art_lines = [
             " █████╗ ██╗   ██╗████████╗██╗  ██╗███████╗███╗   ██╗████████╗██╗ ██████╗ █████╗ ████████╗██╗ ██████╗ ███╗   ██╗",
             "██╔══██╗██║   ██║╚══██╔══╝██║  ██║██╔════╝████╗  ██║╚══██╔══╝██║██╔════╝██╔══██╗╚══██╔══╝██║██╔═══██╗████╗  ██║",
@@ -5489,110 +6003,113 @@ class GLYPHIS_IOBBS:
             "██║  ██║╚██████╔╝   ██║   ██║  ██║███████╗██║ ╚████║   ██║   ██║╚██████╗██║  ██║   ██║   ██║╚██████╔╝██║ ╚████║",
             "╚═╝  ╚═╝ ╚═════╝    ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═══╝   ╚═╝   ╚═╝ ╚═════╝╚═╝  ╚═╝   ╚═╝   ╚═╝ ╚═════╝ ╚═╝  ╚═══╝"
         ]
-        ascii_x = content_rect.x + int(20 * self.scale)
+        ascii_x = content_rect.x + S[20]
         ascii_y = section_y
         # Use monospaced font with good Unicode support for ANSI/box-drawing characters
-        # Try fonts in order of preference for box-drawing character support
-        ascii_font = None
-        font_names = ["Consolas", "Courier New", "Lucida Console", "DejaVu Sans Mono", "Courier"]
-        for font_name in font_names:
-            try:
-                test_font = pygame.font.SysFont(font_name, int(12 * self.scale))
-                # Test if font can render box-drawing characters
-                test_surface = test_font.render("█", True, (255, 255, 255))
-                if test_surface.get_width() > 0:
-                    ascii_font = test_font
-                    break
-            except:
-                continue
-        # Fallback to default monospaced font if none worked
-        if ascii_font is None:
-            ascii_font = pygame.font.SysFont("courier", int(12 * self.scale))
-        for line in ascii_art_lines:
-            self.draw_text(line, ascii_font, ACCENT_CYAN, ascii_x, ascii_y)
-            ascii_y += ascii_font.get_linesize()
+        ascii_font = get_ascii_art_font(S[12])
+        banner = self._ascii_banner(ascii_art_lines, ascii_font, ACCENT_CYAN)
+        self.bbs_surface.blit(banner, (ascii_x, ascii_y))
+        ascii_y += banner.get_height()
         
         # Username input area (positioned below ASCII art)
-        prompt_y = ascii_y + int(15 * self.scale)
-        self.draw_text("WHAT'S YOUR NAME STRANGER:", self.font_small, CYAN, content_rect.x + int(20 * self.scale), prompt_y)
+        prompt_y = ascii_y + S[15]
+        self._draw_text_line("WHAT'S YOUR NAME STRANGER:", self.font_small, CYAN, content_rect.x + S[20], prompt_y)
         
         # Input box
-        input_box_y = prompt_y + int(35 * self.scale)
+        input_box_y = prompt_y + S[35]
         input_box_rect = pygame.Rect(
-            content_rect.x + int(20 * self.scale),
+            content_rect.x + S[20],
             input_box_y,
-            content_rect.width - int(40 * self.scale),
-            int(40 * self.scale)
+            content_rect.width - S[40],
+            S[40]
         )
+
+        # Footer
+        footer_y = self.bbs_height - S[50]
+        self.draw_line(footer_y)
+        self._draw_text_line("PRESS ENTER TO SUBMIT | TAB FOR NEW SESSION | ESC TO QUIT", self.font_tiny, DARK_CYAN, S[60], footer_y + S[10])
+        return content_rect, input_box_rect
+
+    def draw_login_username_screen(self):
+        S = self._S
+        # Grid, panels, banner, prompt and footer only change with the layout; the input box,
+        # error line and options are drawn over the snapshot every frame
+        layer_key = (self.bbs_width, self.bbs_height, self.content_scroll_y)
+        if self._static_layer_key.get("login_username") == layer_key:
+            self.bbs_surface.blit(self._static_layer["login_username"], (0, 0))
+            content_rect, input_box_rect = self._login_username_rects
+        else:
+            content_rect, input_box_rect = self._draw_login_username_static()
+            self._static_layer["login_username"] = self.bbs_surface.convert()
+            self._static_layer_key["login_username"] = layer_key
+            self._login_username_rects = (content_rect, input_box_rect)
+        input_box_y = input_box_rect.y
+
         box_color = ACCENT_CYAN if self.login_focus == "input" else CYAN
         pygame.draw.rect(self.bbs_surface, PANEL_BLUE, input_box_rect)
         pygame.draw.rect(self.bbs_surface, box_color, input_box_rect, 2)
         
         # Input text
         input_display = self.login_input if len(self.login_input) < 24 else self.login_input[-24:]
-        caret_visible = self.login_focus == "input" and (pygame.time.get_ticks() // 500) % 2 == 0
-        prefix_surface = self.font_medium.render("> ", True, CYAN)
-        base_x = input_box_rect.x + int(10 * self.scale)
-        render_y = input_box_y + int(8 * self.scale)
+        caret_visible = self.login_focus == "input" and self._caret_on
+        prefix_surface = self._render_cached("> ", self.font_medium, CYAN)
+        base_x = input_box_rect.x + S[10]
+        render_y = input_box_y + S[8]
         self.bbs_surface.blit(prefix_surface, (base_x, render_y))
         x_cursor = base_x + prefix_surface.get_width()
 
         input_color = CYAN if self.login_focus == "input" else DARK_CYAN
         if input_display:
-            input_surface = self.font_medium.render(input_display, True, input_color)
+            input_surface = self._render_cached(input_display, self.font_medium, input_color)
             self.bbs_surface.blit(input_surface, (x_cursor, render_y))
             x_cursor += input_surface.get_width()
         if caret_visible:
-            caret_surface = self.font_medium.render("_", True, CYAN)
+            caret_surface = self._render_cached("_", self.font_medium, CYAN)
             self.bbs_surface.blit(caret_surface, (x_cursor, render_y))
 
         # Error message
         if self.login_error:
-            error_y = input_box_rect.bottom + int(15 * self.scale)
+            error_y = input_box_rect.bottom + S[15]
             error_rect = pygame.Rect(
-                content_rect.x + int(20 * self.scale),
+                content_rect.x + S[20],
                 error_y,
-                content_rect.width - int(40 * self.scale),
-                int(30 * self.scale)
+                content_rect.width - S[40],
+                S[30]
             )
             pygame.draw.rect(self.bbs_surface, (32, 8, 8), error_rect)
             pygame.draw.rect(self.bbs_surface, RED, error_rect, 1)
-            self.draw_text(self.login_error, self.font_small, RED, error_rect.x + int(10 * self.scale), error_y + int(8 * self.scale))
+            self._draw_text_line(self.login_error, self.font_small, RED, error_rect.x + S[10], error_y + S[8])
 
         # New session option
-        indicator_y = (error_y if self.login_error else input_box_rect.bottom) + int(30 * self.scale)
-        self.draw_text("[ OPTIONS ]", self.font_small, ACCENT_CYAN, content_rect.x + int(20 * self.scale), indicator_y)
+        indicator_y = (error_y if self.login_error else input_box_rect.bottom) + S[30]
+        self._draw_text_line("[ OPTIONS ]", self.font_small, ACCENT_CYAN, content_rect.x + S[20], indicator_y)
         
-        option_y = indicator_y + int(30 * self.scale)
+        option_y = indicator_y + S[30]
         base_color = CYAN if self.login_focus == "new_session" else DARK_CYAN
         if self.login_focus == "new_session":
             option_rect = pygame.Rect(
-                content_rect.x + int(20 * self.scale),
-                option_y - int(5 * self.scale),
-                int(200 * self.scale),
-                int(30 * self.scale)
+                content_rect.x + S[20],
+                option_y - S[5],
+                S[200],
+                S[30]
             )
             pygame.draw.rect(self.bbs_surface, HIGHLIGHT_BLUE, option_rect)
             pygame.draw.rect(self.bbs_surface, ACCENT_CYAN, option_rect, 1)
         
-        left_surface = self.font_small.render("( ", True, base_color)
+        left_surface = self._render_cached("( ", self.font_small, base_color)
         circle_font = get_selection_glyph_font(self.font_small.get_height())
-        circle_surface = circle_font.render(SELECTION_GLYPH, True, base_color)
-        right_surface = self.font_small.render(" ) NEW SESSION", True, base_color)
-        base_x = content_rect.x + int(30 * self.scale)
+        circle_surface = self._render_cached(SELECTION_GLYPH, circle_font, base_color)
+        right_surface = self._render_cached(" ) NEW SESSION", self.font_small, base_color)
+        base_x = content_rect.x + S[30]
         self.bbs_surface.blit(left_surface, (base_x, option_y))
         x_cursor = base_x + left_surface.get_width()
         self.bbs_surface.blit(circle_surface, (x_cursor, option_y - 6))
         x_cursor += circle_surface.get_width()
         self.bbs_surface.blit(right_surface, (x_cursor, option_y))
 
-        # Footer
-        footer_y = self.bbs_height - int(50 * self.scale)
-        self.draw_line(footer_y)
-        self.draw_text("PRESS ENTER TO SUBMIT | TAB FOR NEW SESSION | ESC TO QUIT", self.font_tiny, DARK_CYAN, int(60 * self.scale), footer_y + int(10 * self.scale))
-
-    def draw_login_pin_screen(self, create_mode=True):
-        self.bbs_surface.fill(BLACK)
+    def _draw_login_pin_static(self, create_mode):
+        """Draw the unchanging parts of the PIN screen; returns (content_rect, input_box_rect)"""
+        S = self._S
         self._draw_background_grid()
         
         title = "GLYPHIS_IO BBS // PIN CONFIGURATION" if create_mode else "GLYPHIS_IO BBS // PIN AUTHENTICATION"
@@ -5601,19 +6118,19 @@ class GLYPHIS_IOBBS:
         header_rect = self._draw_header_panel(title, [])
         
         # Main content panel
-        panel_top = header_rect.bottom + int(30 * self.scale)
-        panel_height = self.bbs_height - panel_top - int(100 * self.scale)
+        panel_top = header_rect.bottom + S[30]
+        panel_height = self.bbs_height - panel_top - S[100]
         content_rect = pygame.Rect(
-            int(60 * self.scale),
+            S[60],
             panel_top,
-            self.bbs_width - int(120 * self.scale),
+            self.bbs_width - S[120],
             panel_height
         )
         pygame.draw.rect(self.bbs_surface, PANEL_BLUE, content_rect)
         pygame.draw.rect(self.bbs_surface, CYAN, content_rect, 2)
         
         # Section header - ASCII art
-        section_y = content_rect.y + int(25 * self.scale)
+        section_y = content_rect.y + S[25]
         security_ascii_lines = [
             "███████╗███████╗ ██████╗██╗   ██╗██████╗ ██╗████████╗██╗   ██╗",
             "██╔════╝██╔════╝██╔════╝██║   ██║██╔══██╗██║╚══██╔══╝╚██╗ ██╔╝",
@@ -5622,79 +6139,84 @@ class GLYPHIS_IOBBS:
             "███████║███████╗╚██████╗╚██████╔╝██║  ██║██║   ██║      ██║   ",
             "╚══════╝╚══════╝ ╚═════╝ ╚═════╝ ╚═╝  ╚═╝╚═╝   ╚═╝      ╚═╝   "
         ]
-        security_ascii_x = content_rect.x + int(20 * self.scale)
+        security_ascii_x = content_rect.x + S[20]
         security_ascii_y = section_y
         # Use monospaced font with good Unicode support for ANSI/box-drawing characters
-        security_ascii_font = None
-        font_names = ["Consolas", "Courier New", "Lucida Console", "DejaVu Sans Mono", "Courier"]
-        for font_name in font_names:
-            try:
-                test_font = pygame.font.SysFont(font_name, int(12 * self.scale))
-                test_surface = test_font.render("█", True, (255, 255, 255))
-                if test_surface.get_width() > 0:
-                    security_ascii_font = test_font
-                    break
-            except:
-                continue
-        if security_ascii_font is None:
-            security_ascii_font = pygame.font.SysFont("courier", int(12 * self.scale))
-        for line in security_ascii_lines:
-            self.draw_text(line, security_ascii_font, PINK, security_ascii_x, security_ascii_y)
-            security_ascii_y += security_ascii_font.get_linesize()
+        banner = self._ascii_banner(security_ascii_lines, get_ascii_art_font(S[12]), PINK)
+        self.bbs_surface.blit(banner, (security_ascii_x, security_ascii_y))
+        security_ascii_y += banner.get_height()
         
         # PIN input area (positioned below ASCII art)
-        prompt_y = security_ascii_y + int(15 * self.scale)
-        self.draw_text("PIN:", self.font_small, CYAN, content_rect.x + int(20 * self.scale), prompt_y)
+        prompt_y = security_ascii_y + S[15]
+        self._draw_text_line("PIN:", self.font_small, CYAN, content_rect.x + S[20], prompt_y)
         
         # Input box
-        input_box_y = prompt_y + int(35 * self.scale)
+        input_box_y = prompt_y + S[35]
         input_box_rect = pygame.Rect(
-            content_rect.x + int(20 * self.scale),
+            content_rect.x + S[20],
             input_box_y,
-            int(200 * self.scale),
-            int(40 * self.scale)
+            S[200],
+            S[40]
         )
         pygame.draw.rect(self.bbs_surface, PANEL_BLUE, input_box_rect)
         pygame.draw.rect(self.bbs_surface, CYAN, input_box_rect, 2)
-        
+        prefix_surface = self._render_cached("> ", self.font_medium, CYAN)
+        self.bbs_surface.blit(prefix_surface, (input_box_rect.x + S[10], input_box_y + S[8]))
+
+        # Footer
+        footer_y = self.bbs_height - S[50]
+        self.draw_line(footer_y)
+        self._draw_text_line("PRESS ENTER TO SUBMIT | ESC TO QUIT", self.font_tiny, DARK_CYAN, S[60], footer_y + S[10])
+        return content_rect, input_box_rect
+
+    def draw_login_pin_screen(self, create_mode=True):
+        S = self._S
+        # Everything but the typed bullets, caret and error line is a per-layout snapshot
+        layer_key = (create_mode, self.bbs_width, self.bbs_height, self.content_scroll_y)
+        if self._static_layer_key.get("login_pin") == layer_key:
+            self.bbs_surface.blit(self._static_layer["login_pin"], (0, 0))
+            content_rect, input_box_rect = self._login_pin_rects
+        else:
+            content_rect, input_box_rect = self._draw_login_pin_static(create_mode)
+            self._static_layer["login_pin"] = self.bbs_surface.convert()
+            self._static_layer_key["login_pin"] = layer_key
+            self._login_pin_rects = (content_rect, input_box_rect)
+
         # PIN input display
-        caret_visible = (pygame.time.get_ticks() // 500) % 2 == 0
-        base_x = input_box_rect.x + int(10 * self.scale)
-        render_y = input_box_y + int(8 * self.scale)
-        prefix_surface = self.font_medium.render("> ", True, CYAN)
-        self.bbs_surface.blit(prefix_surface, (base_x, render_y))
-        x_cursor = base_x + prefix_surface.get_width()
+        caret_visible = self._caret_on
+        render_y = input_box_rect.y + S[8]
+        x_cursor = input_box_rect.x + S[10] + self._render_cached("> ", self.font_medium, CYAN).get_width()
 
-        pin_font = pygame.font.SysFont(None, self.font_medium.get_height())
+        bullet_surface = self._render_cached("•", self.font_pin, CYAN)
+        bullet_width = bullet_surface.get_width()
         for _ in self.login_input:
-            bullet_surface = pin_font.render("•", True, CYAN)
             self.bbs_surface.blit(bullet_surface, (x_cursor, render_y))
-            x_cursor += bullet_surface.get_width()
+            x_cursor += bullet_width
 
         if caret_visible and len(self.login_input) < 4:
-            caret_surface = pin_font.render("_", True, CYAN)
+            caret_surface = self._render_cached("_", self.font_pin, CYAN)
             self.bbs_surface.blit(caret_surface, (x_cursor, render_y))
 
         # Error message
         if self.login_error:
-            error_y = input_box_rect.bottom + int(15 * self.scale)
+            error_y = input_box_rect.bottom + S[15]
             error_rect = pygame.Rect(
-                content_rect.x + int(20 * self.scale),
+                content_rect.x + S[20],
                 error_y,
-                content_rect.width - int(40 * self.scale),
-                int(30 * self.scale)
+                content_rect.width - S[40],
+                S[30]
             )
             pygame.draw.rect(self.bbs_surface, (32, 8, 8), error_rect)
             pygame.draw.rect(self.bbs_surface, RED, error_rect, 1)
-            self.draw_text(self.login_error, self.font_small, RED, error_rect.x + int(10 * self.scale), error_y + int(8 * self.scale))
-
-        # Footer
-        footer_y = self.bbs_height - int(50 * self.scale)
-        self.draw_line(footer_y)
-        self.draw_text("PRESS ENTER TO SUBMIT | ESC TO QUIT", self.font_tiny, DARK_CYAN, int(60 * self.scale), footer_y + int(10 * self.scale))
+            self._draw_text_line(self.login_error, self.font_small, RED, error_rect.x + S[10], error_y + S[8])
 
     def draw_login_success_screen(self):
-        self.bbs_surface.fill(BLACK)
+        S = self._S
+        # Nothing on this screen animates; redraw only when its text or the layout changes
+        layer_key = (self.login_message, self.player_email, self.bbs_width, self.bbs_height, self.content_scroll_y)
+        if self._static_layer_key.get("login_success") == layer_key:
+            self.bbs_surface.blit(self._static_layer["login_success"], (0, 0))
+            return
         self._draw_background_grid()
         
         # Header panel
@@ -5704,12 +6226,12 @@ class GLYPHIS_IOBBS:
         )
         
         # Success panel (matching AUTHENTICATION page box size)
-        panel_top = header_rect.bottom + int(30 * self.scale)
-        panel_height = self.bbs_height - panel_top - int(100 * self.scale)
+        panel_top = header_rect.bottom + S[30]
+        panel_height = self.bbs_height - panel_top - S[100]
         success_rect = pygame.Rect(
-            int(30 * self.scale),
+            S[30],
             panel_top,
-            self.bbs_width - int(60 * self.scale),
+            self.bbs_width - S[60],
             panel_height
         )
         pygame.draw.rect(self.bbs_surface, PANEL_BLUE, success_rect)
@@ -5724,47 +6246,36 @@ class GLYPHIS_IOBBS:
             "███████║   ██║   ██║  ██║   ██║   ╚██████╔╝███████║╚═╝    ╚██████╔╝██║ ╚████║███████╗██║██║ ╚████║███████╗",
             "╚══════╝   ╚═╝   ╚═╝  ╚═╝   ╚═╝    ╚═════╝ ╚══════╝        ╚═════╝ ╚═╝  ╚═══╝╚══════╝╚═╝╚═╝  ╚═══╝╚══════╝"
         ]
-        status_ascii_x = success_rect.x + int(20 * self.scale)
-        status_ascii_y = success_rect.y + int(25 * self.scale)
+        status_ascii_x = success_rect.x + S[20]
+        status_ascii_y = success_rect.y + S[25]
         # Use monospaced font with good Unicode support for ANSI/box-drawing characters
-        status_ascii_font = None
-        font_names = ["Consolas", "Courier New", "Lucida Console", "DejaVu Sans Mono", "Courier"]
-        for font_name in font_names:
-            try:
-                test_font = pygame.font.SysFont(font_name, int(12 * self.scale))
-                test_surface = test_font.render("█", True, (255, 255, 255))
-                if test_surface.get_width() > 0:
-                    status_ascii_font = test_font
-                    break
-            except:
-                continue
-        if status_ascii_font is None:
-            status_ascii_font = pygame.font.SysFont("courier", int(12 * self.scale))
-        for line in status_ascii_lines:
-            self.draw_text(line, status_ascii_font, CYAN, status_ascii_x, status_ascii_y)
-            status_ascii_y += status_ascii_font.get_linesize()
+        banner = self._ascii_banner(status_ascii_lines, get_ascii_art_font(S[12]), CYAN)
+        self.bbs_surface.blit(banner, (status_ascii_x, status_ascii_y))
+        status_ascii_y += banner.get_height()
         
         # Success message
         message = self.login_message or "WELCOME BACK. PRESS ENTER TO CONTINUE."
-        message_y = status_ascii_y + int(15 * self.scale)
-        self.draw_text(message, self.font_medium, CYAN, success_rect.x + int(20 * self.scale), message_y)
+        message_y = status_ascii_y + S[15]
+        self._draw_text_line(message, self.font_medium, CYAN, success_rect.x + S[20], message_y)
         
         # Continue prompt
-        prompt_y = success_rect.bottom - int(50 * self.scale)
+        prompt_y = success_rect.bottom - S[50]
         prompt_rect = pygame.Rect(
-            success_rect.x + int(20 * self.scale),
+            success_rect.x + S[20],
             prompt_y,
-            success_rect.width - int(40 * self.scale),
-            int(35 * self.scale)
+            success_rect.width - S[40],
+            S[35]
         )
         pygame.draw.rect(self.bbs_surface, HIGHLIGHT_BLUE, prompt_rect)
         pygame.draw.rect(self.bbs_surface, ACCENT_CYAN, prompt_rect, 1)
-        self.draw_text("PRESS ENTER TO CONTINUE", self.font_small, CYAN, prompt_rect.x + int(10 * self.scale), prompt_y + int(8 * self.scale))
+        self._draw_text_line("PRESS ENTER TO CONTINUE", self.font_small, CYAN, prompt_rect.x + S[10], prompt_y + S[8])
         
         # Footer
-        footer_y = self.bbs_height - int(50 * self.scale)
+        footer_y = self.bbs_height - S[50]
         self.draw_line(footer_y)
-        self.draw_text(f"USER: {self.player_email}", self.font_tiny, DARK_CYAN, int(60 * self.scale), footer_y + int(10 * self.scale))
+        self._draw_text_line(f"USER: {self.player_email}", self.font_tiny, DARK_CYAN, S[60], footer_y + S[10])
+        self._static_layer["login_success"] = self.bbs_surface.convert()
+        self._static_layer_key["login_success"] = layer_key
 
     def handle_login_input(self, event):
         if event.key == pygame.K_TAB:
@@ -5776,69 +6287,16 @@ class GLYPHIS_IOBBS:
             return
 
         if event.key == pygame.K_ESCAPE:
-            pygame.quit()
-            sys.exit()
+            self.shutdown()
 
         if event.key == pygame.K_BACKSPACE:
             self.login_input = self.login_input[:-1]
             return
 
         if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-            if self.state == "login_username":
-                if self.login_focus == "new_session":
-                    log_event("Starting new session from login screen")
-                    self.start_new_session()
-                    return
-                entered_username = self.login_input.strip()
-                if not entered_username:
-                    self.login_error = "ENTER USERNAME."
-                    return
-                user_index = self.find_user_index(entered_username)
-                if user_index is None:
-                    self.login_error = "USERNAME NOT RECOGNISED."
-                    return
-                log_event(f"User '{entered_username}' selected from login screen")
-                self.set_active_user_index(user_index)
-                self.login_error = ""
-                self.login_input = ""
-                self.login_focus = "input"
-                self.save_user_state()
-                if self.player_pin:
-                    self.state = "login_pin_verify"
-                else:
-                    self.state = "login_pin_create"
-            elif self.state == "login_pin_create":
-                if len(self.login_input) == 4 and self.login_input.isdigit():
-                    self.player_pin = self.login_input
-                    self.save_user_state()
-                    if not self.inventory.has_token(Tokens.PIN_SET):
-                        self.grant_token(Tokens.PIN_SET, reason="login PIN configured")
-                    self.login_message = "PIN SAVED. PRESS ENTER TO CONTINUE."
-                    self.login_input = ""
-                    self.login_error = ""
-                    self.state = "login_success"
-                else:
-                    self.login_error = "PIN MUST BE 4 DIGITS."
-            elif self.state == "login_pin_verify":
-                stored_pin = self.player_pin or ""
-                if self.login_input == stored_pin:
-                    self.player_pin = stored_pin
-                    if not self.inventory.has_token(Tokens.PIN_SET):
-                        self.grant_token(Tokens.PIN_SET, reason="login PIN verified")
-                    self.login_message = "ACCESS GRANTED. PRESS ENTER TO CONTINUE."
-                    self.login_input = ""
-                    self.login_error = ""
-                    self.state = "login_success"
-                else:
-                    self.login_error = "INCORRECT PIN." 
-                    self.login_input = ""
-            elif self.state == "login_success":
-                self.login_input = ""
-                self.login_error = ""
-                self.login_message = ""
-                self.loading_progress = 0
-                self.loading_complete = False
-                self.state = "loading"
+            handler_name = self.LOGIN_SUBMIT_HANDLERS.get(self.state)
+            if handler_name:
+                getattr(self, handler_name)()
             return
 
         if event.type == pygame.KEYDOWN and event.unicode:
@@ -5854,10 +6312,68 @@ class GLYPHIS_IOBBS:
                     self.login_input += char
                     self.login_error = ""
 
+    def _submit_login_username(self):
+        if self.login_focus == "new_session":
+            log_event("Starting new session from login screen")
+            self.start_new_session()
+            return
+        entered_username = self.login_input.strip()
+        if not entered_username:
+            self.login_error = "ENTER USERNAME."
+            return
+        user_index = self.find_user_index(entered_username)
+        if user_index is None:
+            self.login_error = "USERNAME NOT RECOGNISED."
+            return
+        log_event(f"User '{entered_username}' selected from login screen")
+        self.set_active_user_index(user_index)
+        self.login_error = ""
+        self.login_input = ""
+        self.login_focus = "input"
+        self.save_user_state()
+        if self.player_pin:
+            self.state = "login_pin_verify"
+        else:
+            self.state = "login_pin_create"
+
+    def _submit_login_pin_create(self):
+        if len(self.login_input) == 4 and self.login_input.isdigit():
+            self.player_pin = self.login_input
+            self.save_user_state()
+            if not self.inventory.has_token(Tokens.PIN_SET):
+                self.grant_token(Tokens.PIN_SET, reason="login PIN configured")
+            self.login_message = "PIN SAVED. PRESS ENTER TO CONTINUE."
+            self.login_input = ""
+            self.login_error = ""
+            self.state = "login_success"
+        else:
+            self.login_error = "PIN MUST BE 4 DIGITS."
+
+    def _submit_login_pin_verify(self):
+        stored_pin = self.player_pin or ""
+        if self.login_input == stored_pin:
+            self.player_pin = stored_pin
+            if not self.inventory.has_token(Tokens.PIN_SET):
+                self.grant_token(Tokens.PIN_SET, reason="login PIN verified")
+            self.login_message = "ACCESS GRANTED. PRESS ENTER TO CONTINUE."
+            self.login_input = ""
+            self.login_error = ""
+            self.state = "login_success"
+        else:
+            self.login_error = "INCORRECT PIN." 
+            self.login_input = ""
+
+    def _submit_login_success(self):
+        self.login_input = ""
+        self.login_error = ""
+        self.login_message = ""
+        self.loading_progress = 0
+        self.loading_complete = False
+        self.state = "loading"
+
     def send_glyphis_username_reply(self, original_email):
-        body_lower = (original_email.body or "").lower()
         username = self.player_email
-        if any(word in body_lower for word in ["thank", "thanks", "thx", "appreciate"]):
+        if GRATITUDE_RE.search(original_email.body or ""):
             reply_body = (
                 "APPRECIATED. GRATITUDE IS OPTIONAL, RESULTS AREN'T.\n\n"
                 f"ACCOUNT '{username}' IS ACTIVE. NEXT TIME YOU LOG IN, THE SYSTEM WILL PROMPT YOU TO SET A FOUR-DIGIT PIN. "
@@ -5880,6 +6396,7 @@ class GLYPHIS_IOBBS:
 
         reply = Email("glyphis@ciphernet.net", username, reply_subject, reply_body)
         self.inbox.append(reply)
+        self._recount_unread()
         log_event("Glyphis auto-replied to username registration")
 
     def _handle_token_acquired(self, token: str) -> None:
@@ -5927,6 +6444,7 @@ class GLYPHIS_IOBBS:
             body
         )
         self.inbox.append(email)
+        self._recount_unread()
         log_event("Jaxkando delivered ASTRO-MINER cracking task email")
 
     def grant_token(self, token: str, *, reason: Optional[str] = None) -> bool:
@@ -5945,17 +6463,9 @@ class GLYPHIS_IOBBS:
             self._handle_token_acquired(code)
             
             # Unlock Steam achievements for key milestones
-            if hasattr(self, 'steam'):
-                achievement_map = {
-                    Tokens.PSEM: "ACH_FIRST_STEPS",  # Email system unlocked
-                    Tokens.USERNAME_SET: "ACH_REGISTERED",  # Username registered
-                    Tokens.GAMES1: "ACH_GAMES_UNLOCKED",  # Games module unlocked
-                    Tokens.AUDIO1: "ACH_AUDIO_OPS",  # Audio ops unlocked
-                    # Note: ACH_LAPC1_READY is unlocked when all 7 nodes are completed, not here
-                }
-                achievement_id = achievement_map.get(code)
-                if achievement_id:
-                    self.steam.unlock_achievement(achievement_id)
+            achievement_id = self.TOKEN_ACHIEVEMENTS.get(code)
+            if achievement_id:
+                self.steam.unlock_achievement(achievement_id)
         return added
 
     def start_new_session(self):
@@ -5981,6 +6491,7 @@ class GLYPHIS_IOBBS:
         email = self.email_db.deliver_email_by_id(email_id, self.player_email, placeholders=placeholders)
         if email:
             self.inbox.append(email)
+            self._recount_unread()
             self.save_user_state()
             log_event(f"Delivered email '{email.subject}' from {email.sender}")
             return True
@@ -32,11 +32,11 @@ class Email:
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, default_recipient=None):
         if not isinstance(data, dict):
             return None
         sender = data.get("sender")
-        recipient = data.get("recipient")
+        recipient = data.get("recipient", default_recipient)
         subject = data.get("subject")
         body = data.get("body")
         timestamp = data.get("timestamp")
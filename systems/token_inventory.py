@@ -14,6 +14,7 @@ class TokenInventory:
 
     def __init__(self):
         self.tokens = set()  # Use set for O(1) lookup
+        self.version = 0  # Bumped on every change so callers can cache token-derived lists
 
     def add_token(self, token: Optional[str]) -> bool:
         code = normalize_token(token)
@@ -24,6 +25,7 @@ class TokenInventory:
             return False
         if code not in self.tokens:
             self.tokens.add(code)
+            self.version += 1
             return True
         return False
 
@@ -39,12 +41,18 @@ class TokenInventory:
             return False
         if code in self.tokens:
             self.tokens.remove(code)
+            self.version += 1
             return True
         return False
 
     def get_all_tokens(self) -> List[str]:
         return list(sort_tokens(self.tokens))
 
+    def replace_tokens(self, tokens) -> None:
+        self.tokens = set(tokens)
+        self.version += 1
+
     def clear(self) -> None:
         self.tokens.clear()
+        self.version += 1
 
@@ -165,6 +165,12 @@ def normalize_token(token: Optional[str]) -> Optional[str]:
     return token.upper()
 
 
+def normalize_tokens(tokens: Iterable[Optional[str]]) -> set[str]:
+    """Normalise a collection of tokens in one pass, dropping empty entries."""
+
+    return {code for code in map(normalize_token, tokens) if code}
+
+
 def describe_token(token: str, *, fallback: bool = True) -> str:
     """Return a friendly label for a token code."""
 
@@ -180,10 +186,8 @@ def describe_token(token: str, *, fallback: bool = True) -> str:
 def sort_tokens(tokens: Iterable[str]) -> Iterable[str]:
     """Return tokens sorted with known tokens first (stable order)."""
 
-    normalised = [normalize_token(tok) for tok in tokens if normalize_token(tok)]
-
     def sort_key(token: str) -> tuple[int, str]:
         return (0 if token in TOKEN_METADATA else 1, token)
 
-    return sorted(set(normalised), key=sort_key)
+    return sorted(normalize_tokens(tokens), key=sort_key)
 